@@ -11,6 +11,10 @@ import boto3
 from botocore.exceptions import ClientError
 from dotenv import load_dotenv
 
+from src.utils.gazetteer import get_gazetteer
+from src.utils.location_normalizer import get_location_normalizer
+from src.utils.keyword_matcher import get_title_matcher
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -63,42 +67,6 @@ def list_ingestion_dates(bronze_bucket: str) -> list[str]:
         raise
 
 
-def normalize_location(location: str) -> str:
-    """Normalize location names to standardized format."""
-    location = location.lower()
-    
-    if "jakarta selatan" in location or "south jakarta" in location:
-        return "Jakarta Selatan"
-    elif "jakarta barat" in location or "west jakarta" in location:
-        return "Jakarta Barat"
-    elif "jakarta pusat" in location or "central jakarta" in location:
-        return "Jakarta Pusat"
-    elif "jakarta timur" in location or "east jakarta" in location:
-        return "Jakarta Timur"
-    elif "jakarta utara" in location or "north jakarta" in location:
-        return "Jakarta Utara"
-    elif "jakarta" in location:
-        return "Jakarta"
-    elif "yogyakarta" in location or "jogja" in location:
-        return "Yogyakarta"
-    elif "bandung" in location:
-        return "Bandung"
-    elif "surabaya" in location:
-        return "Surabaya"
-    elif "tangerang" in location:
-        return "Tangerang"
-    elif "bekasi" in location or "cikarang" in location:
-        return "Bekasi"
-    elif "depok" in location:
-        return "Depok"
-    elif "bogor" in location or "cileungsi" in location:
-        return "Bogor"
-    elif "semarang" in location:
-        return "Semarang"
-    else:
-        return location.title()
-
-
 def read_bronze_data(
     bronze_bucket: str,
     ingestion_date: str,
@@ -147,8 +115,16 @@ def transform_data(df: pd.DataFrame) -> pd.DataFrame:
         logger.warning("Empty dataframe, skipping transformation")
         return df
     
+    # Filter judul yang sama dengan pipeline harian (apply_title_filter)
+    if "job_title" in df.columns:
+        original_count = len(df)
+        df = df[get_title_matcher().mask_series(df["job_title"])].reset_index(drop=True)
+        logger.info(f"✓ Title filter: {original_count} → {len(df)} records")
+    
     if "location" in df.columns:
-        df["location"] = df["location"].map(normalize_location)
+        places = get_gazetteer().enrich_series(df["location"])
+        df[places.columns] = places
+        df["location"] = get_location_normalizer().normalize_series(df["location"])
         logger.info("✓ Location normalization applied")
     
     original_count = len(df)
@@ -313,10 +289,10 @@ if __name__ == "__main__":
             print("""Backfill Silver layer from Bronze data
             
 Usage:
-  python scripts/backfill_silver.py                          # All dates
-  python scripts/backfill_silver.py --start 2026-02-20      # From date onwards
-  python scripts/backfill_silver.py --range 2026-02-20 2026-03-05  # Range
-  python scripts/backfill_silver.py --dates 2026-02-20 2026-02-21  # Specific dates
+  python -m scripts.backfill_silver                          # All dates
+  python -m scripts.backfill_silver --start 2026-02-20      # From date onwards
+  python -m scripts.backfill_silver --range 2026-02-20 2026-03-05  # Range
+  python -m scripts.backfill_silver --dates 2026-02-20 2026-02-21  # Specific dates
             """)
             sys.exit(0)
         elif sys.argv[1] == "--start" and len(sys.argv) > 2:
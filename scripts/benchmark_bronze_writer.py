@@ -0,0 +1,95 @@
+"""Benchmark jalur tulis bronze: pandas/pandera lama vs. pyarrow langsung.
+
+Tiap jalur dijalankan di proses Python baru (seperti container Lambda baru)
+dan mengukur:
+
+- ``import``  : waktu import modul yang dibutuhkan jalur itu
+- ``write``   : build batch + dedup + validasi + tulis Parquet
+- ``peak_rss``: RSS puncak proses (``ru_maxrss``)
+
+Jalur:
+
+- ``pandas`` : DataFrame -> drop_duplicates -> job_schema.validate -> to_parquet
+- ``arrow``  : build_bronze_table -> validate_bronze_table -> ParquetWriter
+
+Jalankan dari root repo: ``python -m scripts.benchmark_bronze_writer``
+"""
+
+import json
+import subprocess
+import sys
+
+RECORDS = """
+records = [
+    {
+        "job_id": f"{i % (N - N // 10):032x}",  # ~10% duplikat
+        "job_title": f"Data Engineer Intern {i}",
+        "company_name": f"PT Contoh {i % 500}",
+        "location": "Jakarta Selatan",
+        "job_url": f"https://glints.com/id/opportunities/jobs/x/{i}",
+        "platform": "glints",
+        "scraped_at": "20240101_070000",
+        "keyword": "data+engineer+intern",
+    }
+    for i in range(N)
+]
+"""
+
+CHILD_PANDAS = """
+import io, json, resource, time
+t0 = time.perf_counter()
+import pandas as pd
+from src.utils.data_validator import job_schema
+t1 = time.perf_counter()
+{records}
+df = pd.DataFrame(records).drop_duplicates(subset=["job_id"])
+df = job_schema.validate(df)
+df.to_parquet(io.BytesIO(), engine="pyarrow", index=False)
+t2 = time.perf_counter()
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"import_s": t1 - t0, "write_s": t2 - t1, "rss_kb": rss}}))
+"""
+
+CHILD_ARROW = """
+import json, os, resource, tempfile, time
+t0 = time.perf_counter()
+from src.utils.bronze_writer import (
+    BronzeParquetWriter, bronze_schema, build_bronze_table, validate_bronze_table,
+)
+t1 = time.perf_counter()
+{records}
+with tempfile.TemporaryDirectory() as tmp:
+    writer = BronzeParquetWriter("glints", directory=tmp)
+    batch = writer.dedupe(records)
+    writer.write_table(validate_bronze_table(build_bronze_table(batch, bronze_schema())))
+    writer.close()
+t2 = time.perf_counter()
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"import_s": t1 - t0, "write_s": t2 - t1, "rss_kb": rss}}))
+"""
+
+
+def run_child(code: str, n: int) -> dict:
+    source = f"N = {n}\n" + code.format(records=RECORDS)
+    out = subprocess.run(
+        [sys.executable, "-c", source],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main(n: int = 2000, repeat: int = 3) -> None:
+    print(f"{n} record per run, min dari {repeat} run")
+    print(f"{'jalur':<8} {'import':>8} {'write':>8} {'peak_rss':>10}")
+    for label, code in (("pandas", CHILD_PANDAS), ("arrow", CHILD_ARROW)):
+        runs = [run_child(code, n) for _ in range(repeat)]
+        import_s = min(r["import_s"] for r in runs)
+        write_s = min(r["write_s"] for r in runs)
+        rss_mb = min(r["rss_kb"] for r in runs) / 1024
+        print(f"{label:<8} {import_s:7.3f}s {write_s:7.3f}s {rss_mb:8.1f}MB")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,62 @@
+"""Benchmark cold start scraper: init (import handler) vs. handler sampai browser siap.
+
+Tiap mode dijalankan di proses Python baru (seperti container Lambda baru):
+
+- ``serial``  : perilaku lama, import pyarrow lalu launch Chromium di handler
+- ``prewarm`` : SCRAPER_PREWARM=1, Chromium di-launch saat import handler (fase
+  init) paralel dengan import pyarrow
+
+Jalankan dari root repo (butuh Chromium Playwright terpasang):
+``python -m scripts.benchmark_cold_start``
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+CHILD = """
+import json, time
+t0 = time.perf_counter()
+import src.entrypoint.handlers  # fase init Lambda
+t1 = time.perf_counter()
+
+from src.utils.warm_runtime import run_warm
+import src.utils.bronze_writer  # pipeline meng-import pyarrow di handler
+
+async def first_context(session):
+    async with session.context():
+        pass
+
+run_warm(first_context)
+t2 = time.perf_counter()
+print(json.dumps({"init_s": t1 - t0, "handler_s": t2 - t1}))
+"""
+
+
+def run_mode(prewarm: bool) -> dict:
+    env = dict(os.environ, SCRAPER_WARM_REUSE="1")
+    env.pop("SCRAPER_PREWARM", None)
+    if prewarm:
+        env["SCRAPER_PREWARM"] = "1"
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main(repeat: int = 3) -> None:
+    print(f"{'mode':<8} {'init':>8} {'handler':>9} {'total':>8}")
+    for label, prewarm in (("serial", False), ("prewarm", True)):
+        runs = [run_mode(prewarm) for _ in range(repeat)]
+        init_s = min(r["init_s"] for r in runs)
+        handler_s = min(r["handler_s"] for r in runs)
+        print(f"{label:<8} {init_s:7.2f}s {handler_s:8.2f}s {init_s + handler_s:7.2f}s")
+
+
+if __name__ == "__main__":
+    main()
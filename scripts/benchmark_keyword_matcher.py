@@ -0,0 +1,63 @@
+"""Benchmark compiled keyword matcher vs. the old per-keyword substring loop.
+
+Jalankan dari root repo: ``python -m scripts.benchmark_keyword_matcher``
+"""
+
+import random
+import time
+
+from src.utils.keyword_matcher import get_title_matcher
+from src.utils.keywords import ALLOWED, BLOCKED
+
+TITLE_WORDS = [
+    "data", "engineer", "intern", "senior", "analyst", "marketing", "sales",
+    "backend", "developer", "bi", "ml", "three", "build", "platform", "admin",
+    "warehouse", "officer", "sql", "staff", "creative", "machine", "learning",
+]  # fmt: skip
+
+
+def legacy_filter(titles: list[str]) -> list[str]:
+    kept = []
+    for title in titles:
+        title_lower = title.lower()
+        if not any(word in title_lower for word in ALLOWED) or any(
+            word in title_lower for word in BLOCKED
+        ):
+            continue
+        kept.append(title)
+    return kept
+
+
+def make_titles(n: int, seed: int = 42) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(TITLE_WORDS) for _ in range(rng.randint(2, 5))).title()
+        for _ in range(n)
+    ]
+
+
+def bench(label: str, fn, titles: list[str], repeat: int = 5) -> list[str]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(titles)
+        best = min(best, time.perf_counter() - start)
+    per_title_us = best / len(titles) * 1e6
+    print(f"{label:<10} {best * 1000:8.1f} ms  ({per_title_us:.2f} us/judul)")
+    return result
+
+
+def main(n: int = 100_000) -> None:
+    titles = make_titles(n)
+    matcher = get_title_matcher()
+
+    print(f"{n} judul, {len(ALLOWED)} allowed + {len(BLOCKED)} blocked keyword")
+    legacy = bench("legacy", legacy_filter, titles)
+    compiled = bench("compiled", matcher.filter_titles, titles)
+
+    # Selisih = false positive substring lama ("hr" di "three", "ui" di "build")
+    print(f"lolos: legacy={len(legacy)} compiled={len(compiled)}")
+
+
+if __name__ == "__main__":
+    main()
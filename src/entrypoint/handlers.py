@@ -1,16 +1,41 @@
 # Lazy import untuk handler (tanpa import top-level yang berat)
 import os
 
+# Opt-in (image scraper): launch Chromium di fase init Lambda, paralel dengan
+# import pyarrow, supaya handler pertama menemukan browser yang siap.
+if os.getenv("SCRAPER_PREWARM", "").strip().lower() in ("1", "true", "yes", "on"):
+    from src.utils.warm_runtime import prewarm
+
+    prewarm()
+
 # Daftar keyword yang ingin kamu scrape secara rutin
 
 
-def _get_keywords(default: list[str]) -> list[str]:
-    env_keywords = os.getenv("SCRAPE_KEYWORDS")
+def _get_keywords(default: list[str], env_name: str = "SCRAPE_KEYWORDS") -> list[str]:
+    env_keywords = os.getenv(env_name)
     if env_keywords:
         return [kw.strip() for kw in env_keywords.split(",") if kw.strip()]
     return default
 
 
+def _run_scraper_pipeline(run_pipeline, keywords: list[str]):
+    """Jalankan pipeline scraper async dari handler sinkron.
+
+    SCRAPER_WARM_REUSE=1 (atau SCRAPER_PREWARM=1): event loop, Playwright dan
+    Chromium disimpan di level module dan dipakai ulang oleh invocation
+    berikutnya di container warm.
+    Default: ``asyncio.run`` (semua dibuat dan ditutup per invocation).
+    """
+    import asyncio
+    from src.utils.scraper_utils import env_flag
+
+    if env_flag("SCRAPER_WARM_REUSE") or env_flag("SCRAPER_PREWARM"):
+        from src.utils.warm_runtime import run_warm
+
+        return run_warm(lambda session: run_pipeline(keywords, session=session))
+    return asyncio.run(run_pipeline(keywords))
+
+
 DEFAULT_KEYWORDS = [
     "data-engineer-intern",
     "etl-developer-intern",
@@ -28,15 +53,14 @@ DEFAULT_KEYWORDS_GLINTS = [
 
 # Handler untuk Kalibrr
 def kalibrr_handler(event, context):
-    import asyncio
     from src.main.main_kalibrr import run_kalibrr_pipeline
 
     print("Memicu Lambda Kalibrr...")
-    # asyncio.run digunakan karena Lambda adalah fungsi sinkronous
-    # sedangkan scraper kita asinkronous (async/await)
+    # Lambda adalah fungsi sinkronous sedangkan scraper kita asinkronous
+    # (async/await): asyncio.run, atau loop warm kalau SCRAPER_WARM_REUSE=1
     keywords = _get_keywords(DEFAULT_KEYWORDS)
     try:
-        result = asyncio.run(run_kalibrr_pipeline(keywords))
+        result = _run_scraper_pipeline(run_kalibrr_pipeline, keywords)
         if not result:
             raise RuntimeError("Pipeline selesai tapi 0 data berhasil diproses")
         return {
@@ -50,13 +74,12 @@ def kalibrr_handler(event, context):
 
 # Handler untuk Glints
 def glints_handler(event, context):
-    import asyncio
     from src.main.main_glints import run_glints_pipeline
 
     print("Memicu Lambda Glints...")
     keywords = _get_keywords(DEFAULT_KEYWORDS_GLINTS)
     try:
-        result = asyncio.run(run_glints_pipeline(keywords))
+        result = _run_scraper_pipeline(run_glints_pipeline, keywords)
         if not result:
             raise RuntimeError("Pipeline selesai tapi 0 data berhasil diproses")
         return {
@@ -70,13 +93,12 @@ def glints_handler(event, context):
 
 # Handler untuk JobStreet
 def jobstreet_handler(event, context):
-    import asyncio
     from src.main.main_jobstreet import run_jobstreet_pipeline
 
     print("Memicu Lambda JobStreet...")
     keywords = _get_keywords(DEFAULT_KEYWORDS)
     try:
-        result = asyncio.run(run_jobstreet_pipeline(keywords))
+        result = _run_scraper_pipeline(run_jobstreet_pipeline, keywords)
         if not result:
             raise RuntimeError("Pipeline selesai tapi 0 data berhasil diproses")
         return {
@@ -88,6 +110,37 @@ def jobstreet_handler(event, context):
         raise
 
 
+# Handler untuk semua platform sekaligus (satu container, satu Chromium)
+def all_platforms_handler(event, context):
+    from src.main.main_all import run_all_platforms_pipeline
+
+    print("Memicu Lambda All Platforms...")
+    # Format keyword Glints berbeda (pakai "+"), jadi override per platform
+    # lewat SCRAPE_KEYWORDS_GLINTS / _JOBSTREET / _KALIBRR
+    keywords_by_platform = {
+        "glints": _get_keywords(DEFAULT_KEYWORDS_GLINTS, "SCRAPE_KEYWORDS_GLINTS"),
+        "jobstreet": _get_keywords(DEFAULT_KEYWORDS, "SCRAPE_KEYWORDS_JOBSTREET"),
+        "kalibrr": _get_keywords(DEFAULT_KEYWORDS, "SCRAPE_KEYWORDS_KALIBRR"),
+    }
+    try:
+        results = _run_scraper_pipeline(
+            run_all_platforms_pipeline, keywords_by_platform
+        )
+        # Upload platform yang sukses sudah terjadi; gagal tetap dilaporkan
+        failed = [platform for platform, count in results.items() if not count]
+        if failed:
+            raise RuntimeError(
+                f"Pipeline selesai tapi 0 data untuk: {', '.join(failed)} ({results})"
+            )
+        return {
+            "statusCode": 200,
+            "body": f"All platforms scrape sukses: {results}",
+        }
+    except Exception as e:
+        print(f"Error di Lambda All Platforms: {e}")
+        raise
+
+
 # Handler untuk Silver Layer
 def silver_layer_handler(event, context):
     """AWS Lambda handler untuk Silver layer transformation."""
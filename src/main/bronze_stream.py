@@ -0,0 +1,117 @@
+# Tahap bersama run_*_pipeline, dijalankan sebagai pipeline asyncio bertahap:
+#
+#   scrape (batch per langkah) -> [queue] -> dedup/enrich/validasi (thread)
+#                              -> [queue] -> tulis row group Parquet (thread)
+#                              -> upload bronze setelah batch terakhir
+#
+# Queue dibatasi (SCRAPE_PIPELINE_QUEUE_SIZE) supaya scraper tertahan kalau
+# tahap hilir tertinggal: memori tetap beberapa batch. Lazy import.
+import asyncio
+import os
+from typing import AsyncIterator
+
+DEFAULT_QUEUE_SIZE = 2
+_DONE = object()
+
+
+def _validate_batch(records: list[dict], schema):
+    """Record -> Arrow Table + cek schema bronze (jalan di thread, tanpa pandas)."""
+    from src.utils.bronze_writer import build_bronze_table, validate_bronze_table
+
+    return validate_bronze_table(build_bronze_table(records, schema))
+
+
+async def _run_stages(*stages) -> None:
+    """Jalankan semua tahap; kalau satu gagal, tahap lain dibatalkan."""
+    tasks = [asyncio.create_task(stage) for stage in stages]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def stream_to_bronze(
+    platform: str,
+    batches: AsyncIterator[tuple[str, list[dict]]],
+    session=None,
+    replace_partition: bool = True,
+) -> tuple[int, set[str]]:
+    """Tulis ``(keyword, records)`` dari scraper ke satu file bronze lalu upload.
+
+    Validasi batch N dan penulisan Parquet berjalan di thread selagi keyword
+    berikutnya masih di-scrape. Dedup ``job_id`` dilakukan saat batch datang
+    (batch pertama menang, sama seperti ``drop_duplicates`` lama).
+    ``replace_partition=False`` menambah file ke partisi bronze hari ini
+    alih-alih menggantinya (run dengan seen index hanya membawa listing
+    terbaru). Return ``(jumlah baris terupload, job_id terupload)``;
+    (0, set()) kalau tidak ada data atau upload gagal.
+    """
+    from src.scraper.job_details import DetailEnricher
+    from src.utils.bronze_writer import BronzeParquetWriter, bronze_schema
+    from src.utils.scraper_utils import env_flag
+    from src.utils.upload_to_s3 import upload_file_to_s3
+
+    queue_size = max(
+        1, int(os.getenv("SCRAPE_PIPELINE_QUEUE_SIZE", DEFAULT_QUEUE_SIZE))
+    )
+    to_validate: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    to_write: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    # Detail lowongan (deskripsi, gaji, tipe, tanggal) per batch selagi browser hidup
+    enrich = env_flag("SCRAPE_ENRICH_DETAILS")
+    enricher = DetailEnricher.from_env(session) if enrich else None
+    writer = BronzeParquetWriter(platform, bronze_schema(with_details=enrich))
+
+    # Sentinel hanya dikirim saat tahap selesai normal; kalau satu tahap
+    # gagal, _run_stages membatalkan yang lain (tidak ada yang menunggu selamanya)
+    async def scrape_stage() -> None:
+        try:
+            async for keyword, batch in batches:
+                records = writer.dedupe(batch)
+                if not records:
+                    continue
+                for record in records:
+                    record["keyword"] = keyword
+                await to_validate.put(records)
+        finally:
+            await batches.aclose()
+        await to_validate.put(_DONE)
+
+    async def validate_stage() -> None:
+        while (records := await to_validate.get()) is not _DONE:
+            if enricher is not None:
+                await enricher.enrich(records)
+            table = await asyncio.to_thread(_validate_batch, records, writer.schema)
+            await to_write.put(table)
+        await to_write.put(_DONE)
+
+    async def write_stage() -> None:
+        while (table := await to_write.get()) is not _DONE:
+            await asyncio.to_thread(writer.write_table, table)
+
+    try:
+        try:
+            await _run_stages(scrape_stage(), validate_stage(), write_stage())
+        finally:
+            if enricher is not None:
+                await enricher.close()
+
+        path = writer.close()
+        if path is None:
+            print("❌ Gagal: Tidak ada data yang berhasil ditarik.")
+            return 0, set()
+        print(
+            f"✅ Validasi Sukses: {writer.rows_written} baris "
+            f"({writer.row_groups} row group) siap dikirim."
+        )
+        uploaded = await asyncio.to_thread(
+            upload_file_to_s3, path, platform, replace=replace_partition
+        )
+        if not uploaded:
+            return 0, set()
+        return writer.rows_written, writer.seen_ids
+    finally:
+        writer.discard()
@@ -0,0 +1,57 @@
+# Lazy import untuk cold start cepat
+import asyncio
+
+
+async def run_all_platforms_pipeline(
+    keywords_by_platform: dict[str, list[str]], session=None
+) -> dict[str, int]:
+    """Scrape semua platform paralel dengan SATU event loop dan SATU Chromium.
+
+    Tiap platform tetap terisolasi: context browser sendiri per keyword,
+    AIMDController sendiri, dan upload bronze sendiri (``platform=<nama>``).
+    Error di satu platform di-log dan tidak menghentikan platform lain.
+    Return jumlah baris yang di-upload per platform (0 = gagal/kosong).
+    """
+    import time
+
+    from src.main.platform_pipeline import run_platform_pipeline
+    from src.utils.scraper_utils import use_session
+
+    start = time.monotonic()
+    async with use_session(session, headless=True) as session:
+        platforms = list(keywords_by_platform)
+        outcomes = await asyncio.gather(
+            *(
+                run_platform_pipeline(
+                    platform, keywords_by_platform[platform], session=session
+                )
+                for platform in platforms
+            ),
+            return_exceptions=True,
+        )
+
+    results = {}
+    for platform, outcome in zip(platforms, outcomes):
+        if isinstance(outcome, BaseException):
+            print(f"❌ Pipeline {platform} gagal: {type(outcome).__name__}: {outcome}")
+            results[platform] = 0
+        else:
+            results[platform] = outcome or 0
+    print(
+        f"--- Semua platform selesai dalam {time.monotonic() - start:.1f}s: {results}"
+    )
+    return results
+
+
+if __name__ == "__main__":
+    from src.entrypoint.handlers import DEFAULT_KEYWORDS, DEFAULT_KEYWORDS_GLINTS
+
+    asyncio.run(
+        run_all_platforms_pipeline(
+            {
+                "glints": DEFAULT_KEYWORDS_GLINTS,
+                "jobstreet": DEFAULT_KEYWORDS,
+                "kalibrr": DEFAULT_KEYWORDS,
+            }
+        )
+    )
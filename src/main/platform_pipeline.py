@@ -0,0 +1,77 @@
+# Pipeline scrape -> bronze yang sama untuk semua platform; main_<platform>
+# dan main_all hanya memanggil ``run_platform_pipeline``. Lazy import untuk
+# cold start cepat.
+
+
+async def run_platform_pipeline(platform: str, keywords: list[str], session=None):
+    """Scrape semua keyword satu platform lalu stream hasilnya ke bronze.
+
+    ``session`` (ScraperSession) dari pemanggil (warm Lambda, main_all) dipakai
+    ulang dan tidak ditutup di sini. Return jumlah baris yang di-upload.
+    """
+    # Import HANYA saat fungsi dipanggil
+    from src.main.bronze_stream import stream_to_bronze
+    from src.scraper.engine import PlatformScraper, get_spec
+    from src.utils.adaptive_concurrency import AIMDController
+    from src.utils.scraper_utils import (
+        env_flag,
+        stream_keywords_concurrently,
+        use_session,
+    )
+
+    spec = get_spec(platform)
+    scraper = PlatformScraper(spec)
+
+    # Job yang sudah terlihat di run sebelumnya -> pagination berhenti lebih
+    # awal (hanya untuk listing yang diurutkan terbaru)
+    seen_index = None
+    if spec.newest_first and env_flag("SCRAPE_SEEN_INDEX"):
+        from src.utils.seen_index import SeenJobIndex
+
+        seen_index = SeenJobIndex.load(platform)
+
+    # Limit paralel adaptif (AIMD) bersama untuk semua keyword platform ini
+    controller = AIMDController.from_env(platform)
+
+    def scrape_keyword(keyword: str):
+        print(f"--- Start {platform} Pipeline: {keyword} ---")
+        # Async generator: record di-yield per langkah/halaman pagination
+        return scraper.stream(
+            spec.url_for(keyword),
+            headless=True,
+            session=session,
+            seen_index=seen_index,
+            controller=controller,
+        )
+
+    # Satu Chromium untuk semua keyword; tiap keyword dapat context baru.
+    # SCRAPE_CONCURRENCY > 1 menjalankan beberapa keyword paralel
+    # (SCRAPE_ADAPTIVE_CONCURRENCY=1: limit disesuaikan controller).
+    async with use_session(session, headless=True) as session:
+        try:
+            # Pipeline bertahap: batch di-dedup, divalidasi (thread) dan ditulis
+            # ke Parquet selagi keyword berikutnya di-scrape, lalu di-upload
+            rows, job_ids = await stream_to_bronze(
+                platform,
+                stream_keywords_concurrently(
+                    keywords, scrape_keyword, controller=controller
+                ),
+                session=session,
+                # Dengan seen index run ini berhenti lebih awal: file run
+                # sebelumnya hari ini harus tetap ada (job-nya sudah di index)
+                replace_partition=seen_index is None,
+            )
+        except Exception as e:
+            print(f"❌ Pipeline {platform} berhenti di tahap Validasi/Upload: {e}")
+            raise
+        print(controller.summary())
+
+    if rows and seen_index is not None:
+        seen_index.add_many(job_ids)
+        seen_index.save()
+
+    if rows:
+        print(f"--- 🏆 Pipeline {platform} Selesai dengan Sukses ---")
+    else:
+        print(f"--- ⚠️ Pipeline {platform} Selesai tanpa data terupload ---")
+    return rows
@@ -0,0 +1,319 @@
+# Engine scraper bersama: satu alur (session -> blocking -> goto+retry ->
+# wait ready -> pagination -> job_id md5) untuk semua platform. Tiap job board
+# cukup mendeskripsikan dirinya lewat ``PlatformSpec`` di modul spec-nya.
+#
+# Modul ini sengaja ringan (tanpa import Playwright di top level) supaya spec
+# bisa di-import untuk cold start cepat; dependensi berat di-import lazy.
+import hashlib
+import importlib
+import os
+import pkgutil
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+# Modul spec per platform: ``src/scraper/jobscraper_<platform>.py`` yang
+# mendefinisikan ``SPEC``. Platform baru (mis. dealls, karir.com) cukup satu
+# file spec baru; registry menemukannya dari nama file.
+SPEC_MODULE_PREFIX = "jobscraper_"
+
+
+@dataclass(frozen=True)
+class PlatformSpec:
+    """Deskripsi deklaratif satu job board untuk ``PlatformScraper``.
+
+    ``url_template`` memakai placeholder ``{keyword}``. ``pagination`` adalah
+    kwargs ``PaginationConfig``. ``listing_api_patterns`` + ``parse_payload``
+    mengaktifkan mode intercept response API; ``prepare_dom`` dijalankan
+    sebelum ekstraksi DOM tiap langkah. ``http_fast_path`` mencoba listing
+    server-rendered lewat HTTP dulu (``SCRAPE_HTTP_FAST_PATH=1``), termasuk
+    halaman ``?page=N`` berikutnya; hanya untuk pagination ``page_param``,
+    karena load-more/scroll butuh browser untuk halaman kedua dan seterusnya.
+    ``newest_first`` = listing
+    diurutkan terbaru, jadi seen index (``SCRAPE_SEEN_INDEX``) aman dipakai
+    untuk berhenti lebih awal. ``blocked_resources`` berisi kategori
+    ``RESOURCE_CATEGORY_PATTERNS`` yang diblokir Chromium (kosong = tidak ada).
+    """
+
+    name: str
+    base_url: str
+    url_template: str
+    card_selector: str
+    field_selectors: dict
+    pagination: dict
+    listing_api_patterns: tuple[str, ...] = ()
+    parse_payload: Optional[Callable[[dict], list[dict]]] = None
+    prepare_dom: Optional[Callable[..., Awaitable[None]]] = None
+    ready_wait_ms: int = 10000
+    http_fast_path: bool = False
+    newest_first: bool = False
+    blocked_resources: tuple[str, ...] = ()
+
+    def __post_init__(self):
+        style = self.pagination.get("style")
+        if self.http_fast_path and style != "page_param":
+            # Fast path hanya dapat halaman pertama: coverage listing turun diam-diam
+            raise ValueError(
+                f"{self.name}: http_fast_path butuh pagination 'page_param', "
+                f"bukan {style!r}"
+            )
+
+    def url_for(self, keyword: str) -> str:
+        return self.url_template.format(keyword=keyword)
+
+    def job_url(self, href: str) -> str:
+        """URL kanonik (lihat ``canonical_href``); href boleh path atau absolut."""
+        from src.utils.scraper_utils import canonical_href
+
+        return f"{self.base_url}{canonical_href(href)}"
+
+    def job_id(self, href: str) -> str:
+        """Job ID = md5 dari URL kanonik, sama untuk mode DOM dan payload."""
+        return hashlib.md5(self.job_url(href).encode()).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def spec_modules() -> dict[str, str]:
+    """Platform -> nama modul spec, hasil scan ``jobscraper_*`` di package ini.
+
+    Hanya nama file yang dibaca (tanpa import), jadi cold start tetap hanya
+    meng-import spec platform yang dipakai.
+    """
+    package = __name__.rpartition(".")[0]
+    return {
+        name.removeprefix(SPEC_MODULE_PREFIX): f"{package}.{name}"
+        for _, name, _ in pkgutil.iter_modules([os.path.dirname(__file__)])
+        if name.startswith(SPEC_MODULE_PREFIX)
+    }
+
+
+def get_spec(platform: str) -> PlatformSpec:
+    """Load ``SPEC`` platform dari modul ``jobscraper_<platform>`` (lazy)."""
+    modules = spec_modules()
+    if platform not in modules:
+        raise ValueError(f"Platform tidak dikenal: {platform}")
+    spec = importlib.import_module(modules[platform]).SPEC
+    if spec.name != platform:
+        raise ValueError(f"SPEC di {modules[platform]} bernama {spec.name!r}")
+    return spec
+
+
+class PlatformScraper:
+    """Scraper listing generik yang digerakkan ``PlatformSpec``."""
+
+    def __init__(self, spec: PlatformSpec):
+        self.spec = spec
+
+    def build_results(self, cards: list[dict], timestamp: str) -> list[dict]:
+        """Card (sudah lolos filter ALLOWED/BLOCKED) -> record bronze."""
+        return [
+            {
+                "job_id": self.spec.job_id(card["href"]),
+                "job_title": card["job_title"],
+                "company_name": card["company_name"],
+                "location": card["location"],
+                "job_url": self.spec.job_url(card["href"]),
+                "platform": self.spec.name,
+                "scraped_at": timestamp,
+            }
+            for card in cards
+        ]
+
+    async def _stream_http(
+        self, url: str, session, seen_index
+    ) -> AsyncIterator[list[dict]]:
+        """Fast path tanpa browser, yield card relevan per halaman.
+
+        Tidak yield apa pun kalau halaman pertama gagal (blocked/kosong/
+        dependency tidak ada): pemanggil eskalasi ke browser. Halaman
+        berikutnya di-fetch lewat ``?page=N`` dengan budget dan kondisi
+        berhenti yang sama seperti ``Paginator``.
+        """
+        import time
+
+        from src.utils.http_fetch import fetch_cards_http
+        from src.utils.keyword_matcher import filter_cards
+        from src.utils.pagination import (
+            PaginationConfig,
+            budget_from_env,
+            with_page_param,
+        )
+        from src.utils.scraper_utils import canonical_href
+
+        spec = self.spec
+        config = budget_from_env(PaginationConfig(**spec.pagination))
+        client = session.http_client() if session else None
+        deadline = time.monotonic() + config.time_budget_s
+        hrefs: set[str] = set()
+        for page_number in range(1, config.max_steps + 1):
+            page_url = (
+                url
+                if page_number == 1
+                else with_page_param(url, config.page_param, page_number)
+            )
+            cards = await fetch_cards_http(
+                page_url, spec.card_selector, spec.field_selectors, client=client
+            )
+            if not cards:
+                if page_number == 1:
+                    print("Eskalasi ke browser...")
+                break
+            new_cards = []
+            for card in cards:
+                href = canonical_href(card["href"])
+                if href not in hrefs:
+                    hrefs.add(href)
+                    new_cards.append(card)
+            if not new_cards:
+                break
+            relevant = filter_cards(new_cards)
+            print(
+                f"HTTP fast path halaman {page_number}: {len(new_cards)} card baru, "
+                f"{len(new_cards) - len(relevant)} difilter"
+            )
+            yield relevant
+            if seen_index is not None and seen_index.all_seen(
+                [spec.job_id(card["href"]) for card in new_cards]
+            ):
+                break
+            if len(hrefs) >= config.max_cards or time.monotonic() >= deadline:
+                break
+
+    async def _stream_browser(
+        self, url: str, headless: bool, session, seen_index, controller
+    ) -> AsyncIterator[list[dict]]:
+        """Yield card baru per langkah pagination (context ditutup di akhir)."""
+        from src.utils.keyword_matcher import get_title_matcher
+        from src.utils.pagination import Paginator, PaginationConfig, budget_from_env
+        from src.utils.scraper_utils import (
+            ListingResponseCollector,
+            ResourcePolicy,
+            apply_resource_policy,
+            env_flag,
+            use_session,
+            wait_until_ready,
+        )
+        from tenacity import retry, stop_after_attempt
+
+        spec = self.spec
+        async with (
+            use_session(session, headless=headless) as active_session,
+            active_session.context(platform=spec.name) as context,
+        ):
+            print("Berhasil create stealth_context")
+
+            print("Creating new page...")
+            page = await context.new_page()
+
+            # Blocking native di Chromium sesuai policy platform
+            policy = ResourcePolicy.from_categories(spec.blocked_resources)
+            await apply_resource_policy(page, spec.name, policy)
+
+            # Pasang listener SEBELUM goto agar response listing ikut tertangkap
+            collector = None
+            if spec.listing_api_patterns and env_flag(
+                "SCRAPE_INTERCEPT_RESPONSES", default=True
+            ):
+                collector = ListingResponseCollector(
+                    page, list(spec.listing_api_patterns)
+                )
+
+            @retry(
+                stop=stop_after_attempt(3),
+                wait=controller.retry_wait,
+                reraise=True,
+            )
+            async def navigate_with_retry():
+                print(f"Navigating to URL: {url}")
+                await controller.goto(
+                    page, url, wait_until="domcontentloaded", timeout=30000
+                )
+
+            try:
+                await navigate_with_retry()
+                print("Successfully loaded page")
+            except Exception as e:
+                print(f"Error during page.goto: {type(e).__name__}: {str(e)}")
+                raise
+
+            # Siap begitu payload listing tertangkap atau card stabil
+            await wait_until_ready(
+                page,
+                spec.card_selector,
+                collector=collector,
+                max_wait_ms=spec.ready_wait_ms,
+                label=spec.name,
+            )
+
+            # Listing diurutkan terbaru: berhenti kalau satu langkah sudah dikenal
+            def stop_when_all_seen(new_cards: list[dict]) -> bool:
+                job_ids = [spec.job_id(card["href"]) for card in new_cards]
+                return seen_index.all_seen(job_ids)
+
+            paginator = Paginator(
+                page,
+                url,
+                spec.card_selector,
+                spec.field_selectors,
+                budget_from_env(PaginationConfig(**spec.pagination)),
+                collector=collector,
+                parse_payload=spec.parse_payload if collector else None,
+                prepare_dom=spec.prepare_dom,
+                stop_when=stop_when_all_seen if seen_index is not None else None,
+                title_filter=get_title_matcher(),
+                controller=controller,
+                label=spec.name,
+            )
+            async for cards in paginator.iter_steps():
+                yield cards
+            if paginator.stats.seen == 0:
+                controller.on_empty_page()
+
+    async def stream(
+        self,
+        url: str,
+        headless: bool = True,
+        session=None,
+        seen_index=None,
+        controller=None,
+    ) -> AsyncIterator[list[dict]]:
+        """Scrape satu halaman hasil pencarian, yield record per langkah/halaman.
+
+        ``session`` (ScraperSession) opsional: kalau diberikan, Chromium dipakai
+        ulang dan hanya context per keyword yang dibuat/ditutup di sini.
+        ``seen_index`` (SeenJobIndex) opsional: pagination berhenti begitu satu
+        langkah hanya berisi job yang sudah dikenal.
+        ``controller`` (AIMDController) opsional: dibagi antar keyword satu
+        platform untuk mencatat latency/timeout/429/403 dan jeda retry.
+        """
+        from src.utils.adaptive_concurrency import AIMDController
+        from src.utils.scraper_utils import env_flag
+        from src.utils.time_utils import now_wib
+
+        if controller is None:
+            controller = AIMDController.from_env(self.spec.name)
+
+        timestamp = now_wib().strftime("%Y%m%d_%H%M%S")
+        total = 0
+        via_http = False
+        if self.spec.http_fast_path and env_flag("SCRAPE_HTTP_FAST_PATH"):
+            async for cards in self._stream_http(url, session, seen_index):
+                via_http = True
+                total += len(cards)
+                if cards:
+                    yield self.build_results(cards, timestamp)
+        if not via_http:
+            async for cards in self._stream_browser(
+                url, headless, session, seen_index, controller
+            ):
+                total += len(cards)
+                yield self.build_results(cards, timestamp)
+        if not total:
+            print("⚠️ Tidak ada data yang lolos filter.")
+
+    async def scrape(self, url: str, **kwargs) -> list[dict]:
+        """Seperti ``stream`` tapi dikumpulkan jadi satu list."""
+        results = []
+        async for batch in self.stream(url, **kwargs):
+            results.extend(batch)
+        return results
@@ -0,0 +1,262 @@
+# Enrichment detail lowongan (opsional, SCRAPE_ENRICH_DETAILS=1): setelah
+# listing selesai, tiap job_url dikunjungi untuk deskripsi, gaji, tipe kerja
+# dan tanggal posting. Ketiga platform memasang JSON-LD schema.org JobPosting
+# (untuk Google Jobs), jadi satu parser dipakai untuk semua.
+import asyncio
+import html as html_lib
+import json
+import os
+import re
+import time
+from typing import Optional
+
+DETAIL_FIELDS = ("job_description", "salary", "job_type", "posted_at")
+
+DEFAULT_CONCURRENCY = 6
+DEFAULT_RATE_PER_S = 3.0
+DEFAULT_TIME_BUDGET_S = 240.0
+
+_JSONLD_RE = re.compile(
+    r"<script[^>]+type=[\"']application/ld\+json[\"'][^>]*>(.*?)</script>",
+    re.IGNORECASE | re.DOTALL,
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def _html_to_text(value: str) -> str:
+    text = _TAG_RE.sub(" ", html_lib.unescape(value or ""))
+    return _SPACE_RE.sub(" ", html_lib.unescape(text)).strip()
+
+
+def _find_job_posting(data) -> Optional[dict]:
+    if isinstance(data, list):
+        for item in data:
+            found = _find_job_posting(item)
+            if found:
+                return found
+        return None
+    if not isinstance(data, dict):
+        return None
+    types = data.get("@type")
+    if types == "JobPosting" or (isinstance(types, list) and "JobPosting" in types):
+        return data
+    return _find_job_posting(data.get("@graph") or [])
+
+
+def _format_salary(base_salary) -> Optional[str]:
+    if not isinstance(base_salary, dict):
+        return None
+    currency = base_salary.get("currency") or ""
+    value = base_salary.get("value")
+    if isinstance(value, dict):
+        unit = value.get("unitText") or ""
+        low, high = value.get("minValue"), value.get("maxValue")
+        amount = value.get("value")
+        if low is not None and high is not None:
+            text = f"{low}-{high}"
+        else:
+            text = str(amount if amount is not None else low or high or "")
+    else:
+        unit = ""
+        text = "" if value is None else str(value)
+    if not text:
+        return None
+    salary = f"{currency} {text}".strip()
+    return f"{salary}/{unit}" if unit else salary
+
+
+def parse_job_posting(jsonld_blocks: list[str]) -> dict:
+    """Ambil field detail dari blok JSON-LD halaman detail (None kalau tidak ada)."""
+    result: dict = dict.fromkeys(DETAIL_FIELDS)
+    for raw in jsonld_blocks:
+        try:
+            posting = _find_job_posting(json.loads(raw))
+        except (ValueError, TypeError):
+            continue
+        if not posting:
+            continue
+        employment = posting.get("employmentType")
+        if isinstance(employment, list):
+            employment = ", ".join(str(item) for item in employment)
+        result.update(
+            {
+                "job_description": _html_to_text(posting.get("description", ""))
+                or None,
+                "salary": _format_salary(posting.get("baseSalary")),
+                "job_type": employment or None,
+                "posted_at": posting.get("datePosted") or None,
+            }
+        )
+        break
+    return result
+
+
+def extract_jsonld_blocks(html: str) -> list[str]:
+    return _JSONLD_RE.findall(html or "")
+
+
+class _PagePool:
+    """Pool page Playwright terbatas di satu context (dibuat saat pertama dipakai)."""
+
+    def __init__(self, session, size: int):
+        self.session = session
+        self.size = size
+        self._context = None
+        self._created = 0
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            if self._idle.empty() and self._created < self.size:
+                if self._context is None:
+                    self._context = await self.session.new_context()
+                self._created += 1
+                return await self._context.new_page()
+        return await self._idle.get()
+
+    def release(self, page) -> None:
+        self._idle.put_nowait(page)
+
+    async def close(self) -> None:
+        if self._context is not None:
+            await self._context.close()
+            self._context = None
+
+
+class DetailEnricher:
+    """Ambil detail banyak job paralel dengan rate limit per domain.
+
+    Detail dicari di ``cache`` (DetailCache) dulu; sisanya dicoba lewat HTTP
+    (kalau client ada), dan halaman yang terblokir atau tanpa JSON-LD
+    di-eskalasi ke pool page browser. Job yang belum selesai saat
+    ``time_budget_s`` habis dibiarkan tanpa detail.
+    """
+
+    def __init__(
+        self,
+        session=None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate_per_s: float = DEFAULT_RATE_PER_S,
+        time_budget_s: float = DEFAULT_TIME_BUDGET_S,
+        http_client=None,
+        cache=None,
+    ):
+        from src.utils.rate_limit import DomainRateLimiter
+
+        self.session = session
+        self.concurrency = max(1, concurrency)
+        self.time_budget_s = time_budget_s
+        self.http_client = http_client
+        self.cache = cache
+        self.limiter = DomainRateLimiter(rate_per_s, capacity=rate_per_s)
+        self._pages = _PagePool(session, self.concurrency) if session else None
+        self._start: Optional[float] = None
+        self._enriched = 0
+        self.counts = {"cache": 0, "http": 0, "browser": 0, "gagal": 0, "skip": 0}
+
+    @classmethod
+    def from_env(cls, session=None) -> "DetailEnricher":
+        from src.utils.detail_cache import DetailCache
+
+        return cls(
+            session=session,
+            concurrency=int(
+                os.getenv("SCRAPE_ENRICH_CONCURRENCY", DEFAULT_CONCURRENCY)
+            ),
+            rate_per_s=float(os.getenv("SCRAPE_ENRICH_RATE_PER_S", DEFAULT_RATE_PER_S)),
+            time_budget_s=float(
+                os.getenv("SCRAPE_ENRICH_TIME_BUDGET_S", DEFAULT_TIME_BUDGET_S)
+            ),
+            http_client=session.http_client() if session else None,
+            cache=DetailCache.from_env(),
+        )
+
+    async def _fetch_http(self, url: str) -> Optional[list[str]]:
+        from src.utils.http_fetch import looks_blocked
+
+        try:
+            response = await self.http_client.get(url)
+        except Exception as e:
+            print(f"Detail HTTP gagal {url}: {type(e).__name__}")
+            return None
+        if looks_blocked(response.status_code, response.text):
+            return None
+        return extract_jsonld_blocks(response.text) or None
+
+    async def _fetch_browser(self, url: str) -> Optional[list[str]]:
+        page = await self._pages.acquire()
+        try:
+            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            return await page.locator(
+                'script[type="application/ld+json"]'
+            ).all_text_contents()
+        except Exception as e:
+            print(f"Detail browser gagal {url}: {type(e).__name__}")
+            return None
+        finally:
+            self._pages.release(page)
+
+    async def fetch_detail(self, url: str) -> Optional[dict]:
+        """Detail satu job; None kalau semua jalur gagal."""
+        blocks = None
+        if self.http_client is not None:
+            await self.limiter.acquire(url)
+            blocks = await self._fetch_http(url)
+            if blocks:
+                self.counts["http"] += 1
+        if not blocks and self._pages is not None:
+            await self.limiter.acquire(url)
+            blocks = await self._fetch_browser(url)
+            if blocks:
+                self.counts["browser"] += 1
+        if not blocks:
+            self.counts["gagal"] += 1
+            return None
+        return parse_job_posting(blocks)
+
+    async def enrich(self, records: list[dict]) -> list[dict]:
+        """Tambahkan DETAIL_FIELDS ke tiap record (in place), return records.
+
+        Bisa dipanggil berkali-kali (per batch streaming); ``time_budget_s``
+        dihitung dari panggilan pertama. Panggil ``close()`` setelah selesai.
+        """
+        if self._start is None:
+            self._start = time.monotonic()
+        start = self._start
+        self._enriched += len(records)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def enrich_one(record: dict) -> None:
+            record.update(dict.fromkeys(DETAIL_FIELDS))
+            job_id = record["job_id"]
+            if self.cache is not None:
+                cached = await asyncio.to_thread(self.cache.get, job_id)
+                if cached is not None:
+                    self.counts["cache"] += 1
+                    record.update(cached)
+                    return
+
+            async with semaphore:
+                if time.monotonic() - start >= self.time_budget_s:
+                    self.counts["skip"] += 1
+                    return
+                detail = await self.fetch_detail(record["job_url"])
+            if detail:
+                record.update(detail)
+                # Hanya detail yang berisi yang di-cache (halaman kosong dicoba lagi)
+                if self.cache is not None and any(detail.values()):
+                    await asyncio.to_thread(self.cache.put, job_id, detail)
+
+        await asyncio.gather(*(enrich_one(record) for record in records))
+        return records
+
+    async def close(self) -> None:
+        """Tutup pool page, rapikan cache lokal, dan cetak ringkasan."""
+        if self._pages is not None:
+            await self._pages.close()
+        if self.cache is not None:
+            self.cache.evict()
+        elapsed = time.monotonic() - self._start if self._start is not None else 0.0
+        print(f"🔎 Enrichment {self._enriched} job dalam {elapsed:.1f}s: {self.counts}")
@@ -1,161 +1,97 @@
-# Lazy import untuk cold start cepat
-async def jobscraper_glints(url: str, headless: bool = True):
-    # Import HANYA saat fungsi dipanggil (lazy loading)
-    from playwright.async_api import Browser, BrowserContext, async_playwright
-    from src.utils.scraper_utils import (
-        create_browser,
-        create_stealth_context,
-        fast_human_scroll,
-    )
-    from src.utils.keywords import ALLOWED, BLOCKED
-    from src.utils.time_utils import now_wib
-    from tenacity import (
-        retry,
-        stop_after_attempt,
-        wait_exponential,
-    )
-    import hashlib
-    import json
-    import os
-
-    async def _scrape():
-        async with async_playwright() as p:
-            browser: Browser = await create_browser(p, headless=headless)
-            print("Berhasil create browser")
-            context: BrowserContext = await create_stealth_context(browser)
-            print("Berhasil create stealth_context")
-
-            print("Creating new page...")
-            page = await context.new_page()
-
-            # Resource blocking selektif: hanya gambar dan iklan
-            print("Setting up selective resource blocking...")
-            ad_hosts = [
-                "doubleclick.net",
-                "googlesyndication.com",
-                "google-analytics.com",
-                "googletagmanager.com",
-                "adsystem.com",
-                "ads.yahoo.com",
-                "adservice.google.com",
-            ]
-
-            async def route_handler(route):
-                url_lower = route.request.url.lower()
-                if any(host in url_lower for host in ad_hosts) or any(
-                    url_lower.endswith(ext)
-                    for ext in [
-                        ".png",
-                        ".jpg",
-                        ".jpeg",
-                        ".gif",
-                        ".webp",
-                        ".svg",
-                        ".ico",
-                    ]
-                ):
-                    await route.abort()
-                else:
-                    await route.continue_()
+# Spec Glints untuk PlatformScraper (lazy import untuk cold start cepat)
+import re
 
-            await page.route("**/*", route_handler)
-            print("Selective resource blocking enabled")
-
-            timestamp = now_wib().strftime("%Y%m%d_%H%M%S")
-            filename = f"glints_raw_{timestamp}.json"
-            results = []
-
-            # Fungsi Navigasi dengan Retry khusus
-            @retry(
-                stop=stop_after_attempt(3),
-                wait=wait_exponential(multiplier=1, min=2, max=10),
-                reraise=True,
-            )
-            async def navigate_with_retry():
-                print(f"Navigating to URL: {url}")
-                await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-
-            try:
-                await navigate_with_retry()
-                print("Successfully loaded page")
-                print("Waiting 5 seconds for hydration...")
-                await page.wait_for_timeout(5000)
+from src.scraper.engine import PlatformScraper, PlatformSpec
 
-                # Tunggu selector kartu muncul (PENTING agar tidak TargetClosed)
-                print("Waiting for job cards...")
-                selector = '[data-glints-tracking-element-name="job_card"]'
-                await page.wait_for_selector(selector, timeout=20000)
+CARD_SELECTOR = '[data-glints-tracking-element-name="job_card"]'
+FIELD_SELECTORS = {
+    "job_title": ('h2[class*="JobTitle"] a', "text"),
+    "href": ('h2[class*="JobTitle"] a', "href"),
+    "company_name": ('[data-cy="company_name_job_card"] a', "text"),
+    "location": ('div[class*="LocationWrapper"]', "text"),
+}
 
-                await fast_human_scroll(page)
+# Explore Glints memuat card berikutnya saat di-scroll
+PAGINATION = {"style": "scroll", "max_cards": 300, "time_budget_s": 60}
 
-                job_cards = await page.locator(selector).all()
-                print(f"Found {len(job_cards)} potential cards")
+# Halaman explore Glints di-hydrate dari GraphQL searchJobs
+LISTING_API_PATTERNS = ["/api/v2/graphql?op=searchJobs"]
 
-                for card in job_cards:
-                    try:
-                        # 1. Job Title
-                        title_elem = card.locator('h2[class*="JobTitle"] a').first
-                        job_title = (await title_elem.text_content()).strip()
+URL_TEMPLATE = (
+    "https://glints.com/id/opportunities/jobs/explore?"
+    "keyword={keyword}&country=ID&locationName=All+Cities%2FProvinces"
+    "&lowestLocationLevel=1&sortBy=LATEST&jobTypes=INTERNSHIP%2CFULL_TIME"
+    "&yearsOfExperienceRanges=LESS_THAN_A_YEAR%2CFRESH_GRAD%2CNO_EXPERIENCE"
+)
 
-                        # --- INTEGRASI FILTER PUSAT ---
-                        job_title_lower = job_title.lower()
-                        if not any(word in job_title_lower for word in ALLOWED) or any(
-                            word in job_title_lower for word in BLOCKED
-                        ):
-                            continue
 
-                        # 2. URL
-                        relative_url = await title_elem.get_attribute("href")
-                        full_url = f"https://glints.com{relative_url}"
+def _slugify(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
 
-                        # 3. Company Name
-                        company_elem = card.locator(
-                            '[data-cy="company_name_job_card"] a'
-                        ).first
-                        company_name = (await company_elem.text_content()).strip()
 
-                        # 4. Location
-                        location_elem = card.locator(
-                            'div[class*="LocationWrapper"]'
-                        ).first
-                        location = (await location_elem.text_content()).strip()
-
-                        # 5. Job ID (Hash dari URL)
-                        job_id = hashlib.md5(full_url.encode()).hexdigest()
-
-                        results.append(
-                            {
-                                "job_id": job_id,
-                                "job_title": job_title,
-                                "company_name": company_name,
-                                "location": location,
-                                "job_url": full_url,
-                                "platform": "glints",
-                                "scraped_at": timestamp,
-                            }
-                        )
-                    except Exception:
-                        continue
-
-                # Simpan Hasil
-                if results:
-                    output_dir = "/tmp/output"
-                    if not os.path.exists(output_dir):
-                        os.makedirs(output_dir)
-
-                    file_path = os.path.join(output_dir, filename)
-                    with open(file_path, "w", encoding="utf-8") as f:
-                        json.dump(results, f, ensure_ascii=False, indent=4)
-                    print(f"✅ Sukses! {len(results)} data disimpan di: {file_path}")
-                else:
-                    print("⚠️ Tidak ada data yang lolos filter.")
-
-            except Exception as e:
-                print(f"❌ Error during scraping: {type(e).__name__}: {str(e)}")
-            finally:
-                await context.close()
-                await browser.close()
-
-            return results
-
-    return await _scrape()
+def parse_listing_payload(payload: dict) -> list[dict]:
+    """Ubah payload GraphQL searchJobs jadi card dict (bentuk = extract_cards)."""
+    cards = []
+    data = (payload or {}).get("data") or {}
+    for result in data.values():
+        if not isinstance(result, dict):
+            continue
+        for job in result.get("jobsInPage") or []:
+            try:
+                job_title = job["title"].strip()
+                company_name = ((job.get("company") or {}).get("name") or "").strip()
+                location = (job.get("location") or {}).get("formattedName") or (
+                    job.get("city") or {}
+                ).get("name", "")
+                # URL asli dari API kalau ada; slug tebakan hanya fallback
+                href = job.get("url") or (
+                    f"/id/opportunities/jobs/{_slugify(job_title)}/{job['id']}"
+                )
+            except (KeyError, TypeError, AttributeError):
+                continue
+            cards.append(
+                {
+                    "job_title": job_title,
+                    "href": href,
+                    "company_name": company_name,
+                    "location": location.strip(),
+                }
+            )
+    return cards
+
+
+SPEC = PlatformSpec(
+    name="glints",
+    base_url="https://glints.com",
+    url_template=URL_TEMPLATE,
+    card_selector=CARD_SELECTOR,
+    field_selectors=FIELD_SELECTORS,
+    pagination=PAGINATION,
+    listing_api_patterns=tuple(LISTING_API_PATTERNS),
+    parse_payload=parse_listing_payload,
+    ready_wait_ms=20000,
+    # Listing Glints diurutkan terbaru: seen index boleh memotong pagination
+    newest_first=True,
+    blocked_resources=("tracker", "image", "font", "media"),
+)
+
+
+async def jobscraper_glints(
+    url: str,
+    headless: bool = True,
+    session=None,
+    seen_index=None,
+    controller=None,
+):
+    """Scrape satu halaman hasil pencarian Glints (lihat ``PlatformScraper.scrape``).
+
+    Listing diurutkan terbaru, jadi ``seen_index`` menghentikan infinite
+    scroll begitu satu langkah hanya berisi job yang sudah dikenal.
+    """
+    return await PlatformScraper(SPEC).scrape(
+        url,
+        headless=headless,
+        session=session,
+        seen_index=seen_index,
+        controller=controller,
+    )
@@ -1,113 +1,99 @@
-# Lazy import untuk cold start cepat
-async def jobscraper_jobstreet(url: str, headless: bool = True):
-    # Import HANYA saat fungsi dipanggil (lazy loading)
-    from playwright.async_api import Browser, BrowserContext, async_playwright
+# Spec JobStreet untuk PlatformScraper (lazy import untuk cold start cepat)
+from src.scraper.engine import PlatformScraper, PlatformSpec
+
+# Mengincar atribut data-automation yang sangat stabil di JobStreet
+CARD_SELECTOR = 'article[data-automation="normalJob"]'
+FIELD_SELECTORS = {
+    "job_title": ('[data-automation="jobTitle"]', "text"),
+    "href": ('[data-automation="jobTitle"]', "href"),
+    "company_name": ('[data-automation="jobCompany"]', "text"),
+    "location": ('[data-automation="jobLocation"]', "text"),
+}
+
+PAGINATION = {"style": "page_param", "max_cards": 300, "time_budget_s": 90}
+
+# Endpoint search SEEK yang dipakai JobStreet untuk hydrate/paging listing
+LISTING_API_PATTERNS = ["/api/jobsearch/v5/search", "/api/chalice-search/"]
+
+URL_TEMPLATE = "https://id.jobstreet.com/id/{keyword}-jobs?daterange=7"
+
+
+def parse_listing_payload(payload: dict) -> list[dict]:
+    """Ubah payload job search JobStreet jadi card dict (bentuk = extract_cards)."""
+    cards = []
+    for job in (payload or {}).get("data") or []:
+        try:
+            job_title = job["title"].strip()
+            company_name = (
+                job.get("companyName")
+                or (job.get("advertiser") or {}).get("description")
+                or ""
+            ).strip()
+            locations = job.get("locations") or []
+            location = (
+                locations[0].get("label", "") if locations else job.get("location", "")
+            )
+            href = f"/id/job/{job['id']}"
+        except (KeyError, TypeError, AttributeError, IndexError):
+            continue
+        cards.append(
+            {
+                "job_title": job_title,
+                "href": href,
+                "company_name": company_name,
+                "location": (location or "").strip(),
+            }
+        )
+    return cards
+
+
+async def prepare_dom(page) -> None:
     from src.utils.scraper_utils import (
-        create_browser,
-        create_stealth_context,
         fast_human_scroll,
+        human_delay,
+        wait_until_ready,
     )
-    from src.utils.keywords import ALLOWED, BLOCKED
-    from src.utils.time_utils import now_wib
-    from tenacity import retry, stop_after_attempt, wait_exponential
-    import hashlib
-    import asyncio
-
-    async def _scrape():
-        async with async_playwright() as p:
-            browser: Browser = await create_browser(p, headless=headless)
-            print("Berhasil create browser")
-            context: BrowserContext = await create_stealth_context(browser)
-            print("Berhasil create stealth_context")
-
-            print("Creating new page...")
-            page = await context.new_page()
-            print("Page created successfully")
-            # Resource blocking DISABLED - JobStreet detects when resources are blocked
-            # Allow all resources to load normally for stealth
-
-            @retry(
-                stop=stop_after_attempt(3),
-                wait=wait_exponential(multiplier=1, min=2, max=10),
-                reraise=True,
-            )
-            async def navigate_with_retry():
-                print(f"Navigating to URL: {url}")
-                await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-
-            try:
-                await navigate_with_retry()
-                print("Successfully loaded page (domcontentloaded)")
-                print("Waiting 5 seconds for hydration...")
-                await page.wait_for_timeout(5000)
-            except Exception as e:
-                print(f"Error during page.goto: {type(e).__name__}: {str(e)}")
-                raise
-
-            # Penanganan modal login yang sering muncul di JobStreet
-            await page.keyboard.press("Escape")
-            await asyncio.sleep(1)
-
-            # Strategi Scroll: Lakukan scroll perlahan 3 kali saja
-            # Ini memicu lazy loading tanpa mencekik RAM 8GB
-            for i in range(3):
-                await fast_human_scroll(page)
-                await asyncio.sleep(1)
-
-            results = []
-
-            # Mengincar atribut data-automation yang sangat stabil di JobStreet
-            job_cards = await page.locator('article[data-automation="normalJob"]').all()
-            timestamp = now_wib().strftime("%Y%m%d_%H%M%S")
 
-            for card in job_cards:
-                try:
-                    # 1. Job Title
-                    title_elem = card.locator('[data-automation="jobTitle"]').first
-                    job_title = (await title_elem.text_content()).strip()
-
-                    # --- INTEGRASI FILTER PUSAT ---
-                    job_title_lower = job_title.lower()
-                    if not any(word in job_title_lower for word in ALLOWED) or any(
-                        word in job_title_lower for word in BLOCKED
-                    ):
-                        continue
-
-                    # 2. URL (Path relatif, perlu prefix)
-                    relative_url = await title_elem.get_attribute("href")
-                    full_url = f"https://id.jobstreet.com{relative_url}"
-
-                    # 3. Company Name
-                    company_elem = card.locator('[data-automation="jobCompany"]').first
-                    company_name = (await company_elem.text_content()).strip()
-
-                    # 4. Location
-                    # Mengambil teks lokasi (Jakarta Selatan, dll)
-                    location_elem = card.locator(
-                        '[data-automation="jobLocation"]'
-                    ).first
-                    location = (await location_elem.text_content()).strip()
-
-                    # 5. Job ID (Hash dari URL agar konsisten antar platform)
-                    job_id = hashlib.md5(full_url.encode()).hexdigest()
-
-                    results.append(
-                        {
-                            "job_id": job_id,
-                            "job_title": job_title,
-                            "company_name": company_name,
-                            "location": location,
-                            "job_url": full_url,
-                            "platform": "jobstreet",
-                            "scraped_at": timestamp,
-                        }
-                    )
-                except Exception:
-                    continue
-
-            await context.close()
-            await browser.close()
-
-            return results
-
-    return await _scrape()
+    # Penanganan modal login yang sering muncul di JobStreet
+    await page.keyboard.press("Escape")
+    await human_delay()
+
+    # Strategi Scroll: Lakukan scroll perlahan 3 kali saja
+    # Ini memicu lazy loading tanpa mencekik RAM 8GB.
+    # Setelah scroll cukup tunggu jumlah card stabil, bukan 1 detik.
+    for i in range(3):
+        await fast_human_scroll(page)
+        await wait_until_ready(
+            page,
+            CARD_SELECTOR,
+            max_wait_ms=2000,
+            stable_polls=1,
+            label=f"jobstreet-scroll-{i + 1}",
+        )
+
+
+SPEC = PlatformSpec(
+    name="jobstreet",
+    base_url="https://id.jobstreet.com",
+    url_template=URL_TEMPLATE,
+    card_selector=CARD_SELECTOR,
+    field_selectors=FIELD_SELECTORS,
+    pagination=PAGINATION,
+    listing_api_patterns=tuple(LISTING_API_PATTERNS),
+    parse_payload=parse_listing_payload,
+    prepare_dom=prepare_dom,
+    ready_wait_ms=15000,
+    # Sebagian besar listing JobStreet sudah ada di HTML server
+    http_fast_path=True,
+    # JobStreet mendeteksi asset yang diblokir: policy hanya tracker
+    blocked_resources=("tracker",),
+)
+
+
+async def jobscraper_jobstreet(
+    url: str, headless: bool = True, session=None, controller=None
+):
+    """Scrape satu halaman hasil pencarian JobStreet (lihat ``PlatformScraper.scrape``)."""
+    return await PlatformScraper(SPEC).scrape(
+        url, headless=headless, session=session, controller=controller
+    )
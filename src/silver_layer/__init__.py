@@ -11,6 +11,7 @@ from .config import (
 from .transformations import (
     normalize_location,
     apply_location_normalization,
+    apply_title_filter,
 )
 from .validators import validate_silver_schema
 from .storage import get_bronze_object, upload_to_silver
@@ -26,6 +27,7 @@ __all__ = [
     "JOB_SILVER_SCHEMA",
     "normalize_location",
     "apply_location_normalization",
+    "apply_title_filter",
     "validate_silver_schema",
     "get_bronze_object",
     "upload_to_silver",
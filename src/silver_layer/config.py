@@ -58,5 +58,14 @@ JOB_SILVER_SCHEMA = DataFrameSchema(
         "platform": Column(str, Check.isin(get_list_platforms())),
         "scraped_at": Column(str),
         "keyword": Column(str),
+        # Gazetteer enrichment from apply_location_normalization
+        "city": Column(str, nullable=True, required=False, coerce=True),
+        "province": Column(str, nullable=True, required=False, coerce=True),
+        "is_remote": Column(bool, required=False, coerce=True),
+        # Optional detail fields from the enrichment stage
+        "job_description": Column(str, nullable=True, required=False, coerce=True),
+        "salary": Column(str, nullable=True, required=False, coerce=True),
+        "job_type": Column(str, nullable=True, required=False, coerce=True),
+        "posted_at": Column(str, nullable=True, required=False, coerce=True),
     }
 )
@@ -4,7 +4,7 @@ import logging
 import pandas as pd
 
 from .config import get_list_platforms
-from .transformations import apply_location_normalization
+from .transformations import apply_location_normalization, apply_title_filter
 from .validators import validate_silver_schema
 from .storage import get_bronze_object, upload_to_silver
 
@@ -15,9 +15,10 @@ def transform_silver(df: pd.DataFrame) -> str:
     """Orchestrate Silver layer transformation pipeline.
 
     Pipeline steps:
-    1. Apply location normalization
-    2. Validate against Silver schema
-    3. Upload to Silver S3 bucket
+    1. Drop duplicate jobs and irrelevant job titles
+    2. Apply location normalization
+    3. Validate against Silver schema
+    4. Upload to Silver S3 bucket
 
     Args:
         df: Bronze layer dataframe
@@ -26,6 +27,15 @@ def transform_silver(df: pd.DataFrame) -> str:
         S3 object key of uploaded file
     """
     # Step 1: Apply transformations
+    total_rows = len(df)
+    # Bronze may hold several files per day (append mode with the seen
+    # index); keep the most recent scrape of each job.
+    df = df.drop_duplicates(subset=["job_id"], keep="last").reset_index(drop=True)
+    if len(df) < total_rows:
+        logger.info(f"Dropped {total_rows - len(df)} duplicate job_id rows.")
+    df = apply_title_filter(df)
+    logger.info(f"Title filter kept {len(df)}/{total_rows} rows.")
+
     logger.info("Starting location normalization...")
     df = apply_location_normalization(df)
     logger.info("Location normalization completed.")
@@ -3,9 +3,12 @@
 import io
 import logging
 import os
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import boto3
 from botocore.exceptions import ClientError
 from dotenv import load_dotenv
@@ -21,12 +24,88 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_READ_WORKERS = 8
 
-def get_bronze_object(list_platforms: list[str]) -> pd.DataFrame:
+
+def list_bronze_keys(s3: "S3Client", bucket_name: str, prefix: str) -> list[str]:
+    """List every object key under a prefix, following S3 pagination.
+
+    Args:
+        s3: boto3 S3 client
+        bucket_name: Bucket to list
+        prefix: Key prefix to list under
+
+    Returns:
+        Object keys in listing order (may exceed the 1000-key page limit)
+    """
+    paginator = s3.get_paginator("list_objects_v2")
+    return [
+        obj["Key"]
+        for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix)
+        for obj in page.get("Contents", [])
+    ]
+
+
+def _read_bronze_table(
+    s3: "S3Client", bucket_name: str, key: str, columns: Optional[list[str]]
+) -> pa.Table:
+    """Download one bronze Parquet object and decode it to an Arrow table."""
+    logger.info(f"Processing object: {key}")
+    body = s3.get_object(Bucket=bucket_name, Key=key)["Body"].read()
+    parquet = pq.ParquetFile(io.BytesIO(body))
+    if columns is not None:
+        # Older files may lack some columns (e.g. detail fields); skip them here
+        # and let concat fill them with nulls.
+        available = set(parquet.schema_arrow.names)
+        columns = [name for name in columns if name in available]
+    table = parquet.read(columns=columns, use_pandas_metadata=False)
+    return table.replace_schema_metadata(None)
+
+
+def read_bronze_tables(
+    s3: "S3Client",
+    bucket_name: str,
+    keys: list[str],
+    columns: Optional[list[str]] = None,
+    max_workers: Optional[int] = None,
+) -> pa.Table:
+    """Fetch and decode bronze objects concurrently, then concatenate once.
+
+    Args:
+        s3: boto3 S3 client (thread-safe, shared by all workers)
+        bucket_name: Bronze bucket name
+        keys: Object keys to read
+        columns: Optional column projection applied while decoding
+        max_workers: Thread pool size, defaults to ``SILVER_READ_WORKERS``
+
+    Returns:
+        Single Arrow table; columns missing from some files are null-filled
+    """
+    if max_workers is None:
+        max_workers = int(os.getenv("SILVER_READ_WORKERS", DEFAULT_READ_WORKERS))
+    max_workers = max(1, min(max_workers, len(keys)))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        tables = list(
+            pool.map(
+                lambda key: _read_bronze_table(s3, bucket_name, key, columns), keys
+            )
+        )
+    return pa.concat_tables(tables, promote_options="permissive")
+
+
+def get_bronze_object(
+    list_platforms: list[str], columns: Optional[list[str]] = None
+) -> pd.DataFrame:
     """Read parquet files from Bronze S3 bucket for given platforms.
 
+    Objects are listed with a paginator, downloaded on a thread pool and
+    decoded to Arrow, so runtime follows the slowest object rather than the
+    sum of all of them.
+
     Args:
         list_platforms: List of platform names to read data from
+        columns: Optional list of columns to read (all columns if None)
 
     Returns:
         Combined dataframe from all platforms
@@ -36,25 +115,20 @@ def get_bronze_object(list_platforms: list[str]) -> pd.DataFrame:
     ingestion_date = now_wib().strftime("%Y-%m-%d")
 
     try:
-        df = pd.DataFrame()
-
+        keys = []
         for platform in list_platforms:
             object_key_prefix = f"platform={platform}/ingestion_date={ingestion_date}/"
             logger.info(f"Listing objects with prefix: {object_key_prefix}")
 
-            response = s3.list_objects_v2(Bucket=bucket_name, Prefix=object_key_prefix)
-
-            if "Contents" not in response:
+            platform_keys = list_bronze_keys(s3, bucket_name, object_key_prefix)
+            if not platform_keys:
                 logger.info(f"No objects found with prefix: {object_key_prefix}")
-                continue
+            keys.extend(platform_keys)
 
-            for obj in response["Contents"]:
-                obj_key = obj["Key"]
-                logger.info(f"Processing object: {obj_key}")
+        if not keys:
+            return pd.DataFrame()
 
-                obj_response = s3.get_object(Bucket=bucket_name, Key=obj_key)
-                df_obj = pd.read_parquet(io.BytesIO(obj_response["Body"].read()))
-                df = pd.concat([df, df_obj], ignore_index=True)
+        df = read_bronze_tables(s3, bucket_name, keys, columns).to_pandas()
 
         logger.info(f"Combined DataFrame shape: {df.shape}")
         logger.info(f"Combined DataFrame columns: {df.columns.tolist()}")
@@ -2,6 +2,10 @@
 
 import pandas as pd
 
+from src.utils.gazetteer import get_gazetteer
+from src.utils.keyword_matcher import get_title_matcher
+from src.utils.location_normalizer import get_location_normalizer
+
 
 def normalize_location(location: str) -> str:
     """Normalize location names to standardized format.
@@ -10,53 +14,45 @@ def normalize_location(location: str) -> str:
         location: Raw location string from job listing
 
     Returns:
-        Normalized location string
+        Canonical city from the shared alias table, or the title-cased input
     """
-    location = location.lower()
-
-    # Jakarta districts
-    if "jakarta selatan" in location or "south jakarta" in location:
-        return "Jakarta Selatan"
-    elif "jakarta barat" in location or "west jakarta" in location:
-        return "Jakarta Barat"
-    elif "jakarta pusat" in location or "central jakarta" in location:
-        return "Jakarta Pusat"
-    elif "jakarta timur" in location or "east jakarta" in location:
-        return "Jakarta Timur"
-    elif "jakarta utara" in location or "north jakarta" in location:
-        return "Jakarta Utara"
-    elif "jakarta" in location:
-        return "Jakarta"
-
-    # other cities
-    elif "yogyakarta" in location or "jogja" in location:
-        return "Yogyakarta"
-    elif "bandung" in location:
-        return "Bandung"
-    elif "surabaya" in location:
-        return "Surabaya"
-    elif "tangerang" in location:
-        return "Tangerang"
-    elif "bekasi" in location or "cikarang" in location:
-        return "Bekasi"
-    elif "depok" in location:
-        return "Depok"
-    elif "bogor" in location or "cileungsi" in location:
-        return "Bogor"
-    elif "semarang" in location:
-        return "Semarang"
-    else:
-        return location.title()
+    return get_location_normalizer().normalize(location)
 
 
 def apply_location_normalization(df: pd.DataFrame) -> pd.DataFrame:
-    """Apply location normalization to dataframe.
+    """Apply location normalization and gazetteer enrichment to dataframe.
+
+    The raw location is resolved against the Indonesian gazetteer into
+    ``city``, ``province`` and ``is_remote`` before ``location`` itself is
+    normalized. ``location`` keeps its legacy alias-table values; the
+    city/province hierarchy lives only in the new columns. Only the distinct
+    locations are processed; results are mapped back to the rows through
+    their factorized codes.
 
     Args:
         df: Input dataframe with 'location' column
 
     Returns:
-        Dataframe with normalized locations
+        Dataframe with normalized locations plus city, province and is_remote
     """
-    df["location"] = df["location"].apply(normalize_location)
+    places = get_gazetteer().enrich_series(df["location"])
+    df[places.columns] = places
+    df["location"] = get_location_normalizer().normalize_series(df["location"])
     return df
+
+
+def apply_title_filter(df: pd.DataFrame) -> pd.DataFrame:
+    """Drop rows whose job title fails the ALLOWED/BLOCKED keyword filter.
+
+    Uses the same compiled matcher as the scrapers, vectorized over the
+    column, so rows scraped with the older substring filter (e.g. "hr"
+    matching "three") are cleaned up here.
+
+    Args:
+        df: Input dataframe with 'job_title' column
+
+    Returns:
+        Dataframe containing only relevant job titles
+    """
+    mask = get_title_matcher().mask_series(df["job_title"])
+    return df[mask].reset_index(drop=True)
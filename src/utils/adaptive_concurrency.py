@@ -0,0 +1,152 @@
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from playwright.async_api import Page, Response
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from src.utils.scraper_utils import env_flag, get_scrape_concurrency
+
+THROTTLE_STATUS = {403, 429}
+
+
+class AIMDController:
+    """Batas page paralel per platform, additive-increase/multiplicative-decrease.
+
+    Tiap goto sukses dan cepat menaikkan limit ~1 per "putaran" (``+1/limit``);
+    timeout, HTTP 429/403, goto lebih lambat dari ``latency_target_s`` atau
+    halaman tanpa card memotong limit dengan ``decrease_factor``. Penurunan
+    beruntun dalam ``cooldown_s`` dihitung sekali (satu burst error = satu sinyal).
+    """
+
+    def __init__(
+        self,
+        platform: str,
+        initial: int = 1,
+        min_limit: int = 1,
+        max_limit: int = 4,
+        latency_target_s: float = 10.0,
+        decrease_factor: float = 0.5,
+        cooldown_s: float = 5.0,
+    ):
+        self.platform = platform
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self.latency_target_s = latency_target_s
+        self.decrease_factor = decrease_factor
+        self.cooldown_s = cooldown_s
+        self.in_flight = 0
+        self.counts = {"ok": 0, "lambat": 0, "timeout": 0, "throttled": 0, "kosong": 0}
+        self._last_decrease = float("-inf")
+        self._changed: Optional[asyncio.Event] = None
+
+    @classmethod
+    def from_env(cls, platform: str) -> "AIMDController":
+        """SCRAPE_ADAPTIVE_CONCURRENCY=1: limit bergerak di [1, SCRAPE_MAX_CONCURRENCY].
+
+        Tanpa flag, limit tetap di SCRAPE_CONCURRENCY (perilaku lama).
+        """
+        initial = get_scrape_concurrency()
+        if not env_flag("SCRAPE_ADAPTIVE_CONCURRENCY"):
+            return cls(platform, initial, min_limit=initial, max_limit=initial)
+        max_limit = int(os.getenv("SCRAPE_MAX_CONCURRENCY", max(initial, 4)))
+        return cls(platform, initial, min_limit=1, max_limit=max_limit)
+
+    @property
+    def current_limit(self) -> int:
+        return max(self.min_limit, int(self.limit))
+
+    # ------------------------------------------------------------------ slots
+
+    def _event(self) -> asyncio.Event:
+        if self._changed is None:
+            self._changed = asyncio.Event()
+        return self._changed
+
+    async def acquire(self) -> None:
+        while self.in_flight >= self.current_limit:
+            event = self._event()
+            event.clear()
+            await event.wait()
+        self.in_flight += 1
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._event().set()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    # ---------------------------------------------------------------- signals
+
+    def on_success(self, latency_s: float) -> None:
+        if latency_s > self.latency_target_s:
+            self.counts["lambat"] += 1
+            self._decrease(f"goto lambat {latency_s:.1f}s")
+            return
+        self.counts["ok"] += 1
+        before = self.current_limit
+        self.limit = min(float(self.max_limit), self.limit + 1 / self.current_limit)
+        if self.current_limit > before:
+            print(f"⬆️ AIMD[{self.platform}] limit {before} -> {self.current_limit}")
+            self._event().set()
+
+    def on_timeout(self) -> None:
+        self.counts["timeout"] += 1
+        self._decrease("timeout")
+
+    def on_status(self, status: int) -> None:
+        if status in THROTTLE_STATUS:
+            self.counts["throttled"] += 1
+            self._decrease(f"HTTP {status}")
+
+    def on_empty_page(self) -> None:
+        self.counts["kosong"] += 1
+        self._decrease("halaman tanpa card")
+
+    def _decrease(self, reason: str) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown_s:
+            return
+        self._last_decrease = now
+        before = self.current_limit
+        self.limit = max(float(self.min_limit), self.limit * self.decrease_factor)
+        print(
+            f"⬇️ AIMD[{self.platform}] {reason}: limit {before} -> {self.current_limit}"
+        )
+
+    # ------------------------------------------------------------- navigation
+
+    async def goto(self, page: Page, url: str, **kwargs) -> Optional[Response]:
+        """``page.goto`` yang mencatat latency, timeout dan status 429/403."""
+        start = time.monotonic()
+        try:
+            response = await page.goto(url, **kwargs)
+        except PlaywrightTimeoutError:
+            self.on_timeout()
+            raise
+        if response is not None and response.status in THROTTLE_STATUS:
+            self.on_status(response.status)
+        else:
+            self.on_success(time.monotonic() - start)
+        return response
+
+    def retry_wait(self, retry_state) -> float:
+        """Wait tenacity: exponential 2s, 4s, ... dikali tingkat back-off.
+
+        Saat limit penuh (situs sehat) sama dengan ``wait_exponential(min=2)``;
+        setelah limit dipotong, jeda retry ikut memanjang (maks 30 detik).
+        """
+        base = 2.0 * 2 ** (retry_state.attempt_number - 1)
+        return min(30.0, base * self.max_limit / self.current_limit)
+
+    def summary(self) -> str:
+        return f"AIMD[{self.platform}] limit akhir {self.current_limit}, {self.counts}"
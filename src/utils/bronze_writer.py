@@ -0,0 +1,151 @@
+import io
+import json
+import os
+from typing import Iterable, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.json as pa_json
+import pyarrow.parquet as pq
+
+from src.utils.time_utils import now_wib
+
+BRONZE_DIR = "/tmp/bronze"
+
+BRONZE_COLUMNS = (
+    "job_id",
+    "job_title",
+    "company_name",
+    "location",
+    "job_url",
+    "platform",
+    "scraped_at",
+    "keyword",
+)
+# Ada kalau enrichment detail aktif (SCRAPE_ENRICH_DETAILS)
+DETAIL_COLUMNS = ("job_description", "salary", "job_type", "posted_at")
+
+# Aturan yang sama dengan data_validator.job_schema, dicek langsung di Arrow
+REQUIRED_COLUMNS = BRONZE_COLUMNS[:7]
+ALLOWED_PLATFORMS = ("kalibrr", "jobstreet", "glints", "dealls", "karir.com")
+
+
+class BronzeSchemaError(ValueError):
+    """Batch bronze tidak lolos cek schema (setara pandera SchemaError)."""
+
+
+def bronze_schema(with_details: bool = False) -> pa.Schema:
+    """Schema Arrow tetap untuk file bronze (semua kolom string)."""
+    columns = BRONZE_COLUMNS + (DETAIL_COLUMNS if with_details else ())
+    return pa.schema([pa.field(name, pa.string()) for name in columns])
+
+
+def _as_str(value) -> Optional[str]:
+    # Setara ``coerce=True`` pandera: nilai non-string jadi str, None tetap null
+    return value if value is None or isinstance(value, str) else str(value)
+
+
+def build_bronze_table(records: list[dict], schema: pa.Schema) -> pa.Table:
+    """Record dict -> Table dengan schema tetap (kolom di luar schema dibuang).
+
+    Dibangun lewat reader JSON C++ pyarrow, bukan ``Table.from_pylist``:
+    konversi objek Python pyarrow meng-import pandas (kalau terpasang) saat
+    pertama dipakai, dan itu justru biaya cold start yang mau dihindari.
+    """
+    lines = "\n".join(
+        json.dumps({name: _as_str(record.get(name)) for name in schema.names})
+        for record in records
+    )
+    return pa_json.read_json(
+        io.BytesIO(lines.encode("utf-8")),
+        parse_options=pa_json.ParseOptions(explicit_schema=schema),
+    )
+
+
+def validate_bronze_table(table: pa.Table) -> pa.Table:
+    """Cek ``job_schema`` tanpa pandas: kolom wajib tidak null, ``job_id``
+    unik, dan ``platform`` termasuk platform yang dikenal."""
+    for name in REQUIRED_COLUMNS:
+        if name not in table.column_names:
+            raise BronzeSchemaError(f"kolom '{name}' tidak ada")
+        if table[name].null_count:
+            raise BronzeSchemaError(
+                f"kolom '{name}' berisi {table[name].null_count} nilai null"
+            )
+    if pc.count_distinct(table["job_id"]).as_py() != table.num_rows:
+        raise BronzeSchemaError("kolom 'job_id' berisi duplikat")
+    unknown = set(pc.unique(table["platform"]).to_pylist()) - set(ALLOWED_PLATFORMS)
+    if unknown:
+        raise BronzeSchemaError(f"platform tidak dikenal: {sorted(unknown)}")
+    return table
+
+
+class BronzeParquetWriter:
+    """Tulis batch record bronze ke satu file Parquet di /tmp secara inkremental.
+
+    Tiap ``write`` = satu row group, jadi memori hanya sebesar satu batch
+    (satu keyword/halaman), bukan seluruh run. ``dedupe`` membuang ``job_id``
+    yang sudah pernah lewat (antar keyword maupun di dalam batch).
+    """
+
+    def __init__(
+        self,
+        platform: str,
+        schema: Optional[pa.Schema] = None,
+        directory: Optional[str] = None,
+    ):
+        self.platform = platform
+        self.schema = schema if schema is not None else bronze_schema()
+        directory = directory or BRONZE_DIR
+        os.makedirs(directory, exist_ok=True)
+        timestamp = now_wib().strftime("%Y%m%d_%H%M%S")
+        self.path = os.path.join(directory, f"{platform}_{timestamp}.parquet")
+        self.seen_ids: set[str] = set()
+        self.rows_written = 0
+        self.row_groups = 0
+        self._writer: Optional[pq.ParquetWriter] = None
+
+    def __enter__(self) -> "BronzeParquetWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def dedupe(self, records: Iterable[dict]) -> list[dict]:
+        fresh = []
+        for record in records:
+            if record["job_id"] in self.seen_ids:
+                continue
+            self.seen_ids.add(record["job_id"])
+            fresh.append(record)
+        return fresh
+
+    def write(self, records: list[dict]) -> int:
+        """Tulis satu row group; kolom di luar schema diabaikan."""
+        if not records:
+            return 0
+        return self.write_table(build_bronze_table(records, self.schema))
+
+    def write_table(self, table: pa.Table) -> int:
+        """Tulis Table (schema = ``self.schema``) sebagai satu row group."""
+        if not table.num_rows:
+            return 0
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, self.schema)
+        self._writer.write_table(table)
+        self.rows_written += table.num_rows
+        self.row_groups += 1
+        return table.num_rows
+
+    def close(self) -> Optional[str]:
+        """Tutup file; return path kalau ada baris yang ditulis."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        return self.path if self.rows_written else None
+
+    def discard(self) -> None:
+        """Hapus file lokal (setelah upload / saat gagal)."""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
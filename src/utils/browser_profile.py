@@ -0,0 +1,209 @@
+# Profil browser persisten per platform di /tmp (opsional, SCRAPE_PERSIST_PROFILE=1):
+# - storage_state (cookies + localStorage): consent/modal login tidak muncul lagi
+# - disk cache asset statis (bundle JS/CSS), terpisah lewat SCRAPE_ASSET_CACHE=1:
+#   kunjungan ulang antar invocation tidak download ulang
+#
+# Context Playwright (``browser.new_context``) selalu off-the-record, jadi disk
+# cache Chromium tidak bertahan antar context; cache di sini dipasang lewat
+# ``context.route`` yang hanya mencocokkan URL .js/.css.
+#
+# Trade-off SCRAPE_ASSET_CACHE: begitu routing aktif, Playwright mematikan
+# HTTP cache browser untuk SELURUH context, dan tiap request .js/.css lewat
+# Python (route.fetch/fulfill). Request lain tetap tidak mampir ke Python, tapi
+# asset non-.js/.css (mis. chunk yang dimuat ulang dalam satu context) tidak
+# lagi dapat cache memori browser. Karena itu cache ini opt-in, terpisah dari
+# storage_state: hanya menguntungkan kalau bundle besar dan context sering baru.
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import Optional
+
+from playwright.async_api import BrowserContext, Route
+
+PROFILE_ROOT = "/tmp/browser_profile"
+ASSET_URL_RE = re.compile(r"^https?://[^?#]+\.(?:js|css)(?:[?#]|$)", re.IGNORECASE)
+DEFAULT_CACHE_MB = 128
+DEFAULT_MAX_AGE_S = 7 * 24 * 3600
+# Header yang tidak ikut disimpan: body dari route.fetch sudah di-decode dan
+# panjangnya bisa berbeda; cookie tidak boleh di-replay dari cache
+DROPPED_HEADERS = frozenset(
+    (
+        "content-encoding",
+        "content-length",
+        "transfer-encoding",
+        "connection",
+        "keep-alive",
+        "set-cookie",
+    )
+)
+
+
+def profile_dir(platform: str) -> str:
+    return os.path.join(PROFILE_ROOT, platform)
+
+
+def storage_state_path(platform: str) -> Optional[str]:
+    """Path storage_state platform kalau sudah pernah disimpan."""
+    path = os.path.join(profile_dir(platform), "storage_state.json")
+    return path if os.path.exists(path) else None
+
+
+async def save_storage_state(context: BrowserContext, platform: str) -> None:
+    """Simpan cookies/localStorage context (atomic, aman untuk context paralel)."""
+    os.makedirs(profile_dir(platform), exist_ok=True)
+    path = os.path.join(profile_dir(platform), "storage_state.json")
+    tmp_path = f"{path}.{os.getpid()}.{id(context)}.tmp"
+    try:
+        await context.storage_state(path=tmp_path)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"Gagal simpan storage_state {platform}: {type(e).__name__}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class AssetDiskCache:
+    """Cache body response asset statis di disk dengan batas ukuran (LRU).
+
+    Satu entry = ``<sha1>.body`` + ``<sha1>.json`` (status, header). Waktu
+    akses disimpan sebagai mtime file body; eviction membuang yang paling lama
+    tidak dipakai sampai total ukuran di bawah ``max_bytes``.
+
+    Total ukuran dihitung sekali (scan direktori) lalu diperbarui per ``put``;
+    scan + eviction hanya jalan saat total melewati ``max_bytes``. Di route
+    handler, IO disk dijalankan lewat ``asyncio.to_thread`` supaya event loop
+    tidak tertahan.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = DEFAULT_CACHE_MB * 1024 * 1024,
+        max_age_s: float = DEFAULT_MAX_AGE_S,
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age_s = max_age_s
+        self.hits = 0
+        self.misses = 0
+        self._total_bytes: Optional[int] = None  # None = belum di-scan
+        # put dari beberapa thread (to_thread) berbagi _total_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def for_platform(cls, platform: str) -> "AssetDiskCache":
+        max_mb = float(os.getenv("SCRAPE_ASSET_CACHE_MB", DEFAULT_CACHE_MB))
+        return cls(
+            os.path.join(profile_dir(platform), "asset_cache"),
+            max_bytes=int(max_mb * 1024 * 1024),
+        )
+
+    def _paths(self, url: str) -> tuple[str, str]:
+        key = hashlib.sha1(url.encode()).hexdigest()
+        base = os.path.join(self.directory, key)
+        return f"{base}.body", f"{base}.json"
+
+    def get(self, url: str) -> Optional[tuple[bytes, dict]]:
+        body_path, meta_path = self._paths(url)
+        try:
+            if time.time() - os.path.getmtime(meta_path) > self.max_age_s:
+                return None
+            with open(meta_path, encoding="utf-8") as f:
+                headers = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        os.utime(body_path)  # tandai baru dipakai (LRU)
+        return body, headers
+
+    def put(self, url: str, body: bytes, headers: dict) -> None:
+        if len(body) > self.max_bytes:
+            return
+        body_path, meta_path = self._paths(url)
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self.size_bytes()
+            try:
+                # Entry lama untuk URL yang sama ditimpa: ukurannya tidak dihitung lagi
+                self._total_bytes -= os.path.getsize(body_path)
+            except OSError:
+                pass
+            with open(body_path, "wb") as f:
+                f.write(body)
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(headers, f)
+            self._total_bytes += len(body)
+            if self._total_bytes > self.max_bytes:
+                self.evict()
+
+    def size_bytes(self) -> int:
+        return sum(
+            entry.stat().st_size
+            for entry in os.scandir(self.directory)
+            if entry.name.endswith(".body")
+        )
+
+    def evict(self) -> int:
+        """Buang entry LRU sampai total <= max_bytes; return jumlah yang dibuang."""
+        entries = [
+            (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+            for entry in os.scandir(self.directory)
+            if entry.name.endswith(".body")
+        ]
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            for stale in (path, path[: -len(".body")] + ".json"):
+                if os.path.exists(stale):
+                    os.remove(stale)
+            total -= size
+            removed += 1
+        # Scan penuh sekalian mengoreksi total yang dilacak per put
+        self._total_bytes = total
+        return removed
+
+    async def _handle(self, route: Route) -> None:
+        request = route.request
+        if request.method != "GET":
+            await route.continue_()
+            return
+
+        cached = await asyncio.to_thread(self.get, request.url)
+        if cached is not None:
+            self.hits += 1
+            body, headers = cached
+            await route.fulfill(status=200, headers=headers, body=body)
+            return
+
+        self.misses += 1
+        try:
+            response = await route.fetch()
+        except Exception:
+            await route.continue_()
+            return
+        headers = response.headers
+        if response.status == 200 and "no-store" not in headers.get(
+            "cache-control", ""
+        ):
+            # Header asli disimpan (CORS dsb. untuk script module/crossorigin),
+            # kecuali yang tidak lagi berlaku untuk body yang sudah di-decode
+            keep = {
+                name: value
+                for name, value in headers.items()
+                if name.lower() not in DROPPED_HEADERS
+            }
+            body = await response.body()
+            await asyncio.to_thread(self.put, request.url, body, keep)
+        await route.fulfill(response=response)
+
+    async def install(self, context: BrowserContext) -> None:
+        """Layani request .js/.css context dari cache disk."""
+        await context.route(ASSET_URL_RE, self._handle)
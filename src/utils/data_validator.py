@@ -3,6 +3,8 @@ import pandera.pandas as pa
 from pandera.pandas import DataFrameSchema, Column, Check
 import json
 
+from src.utils.bronze_writer import ALLOWED_PLATFORMS
+
 job_schema = DataFrameSchema(
     {
         "job_id": Column(str, unique=True),
@@ -10,10 +12,13 @@ job_schema = DataFrameSchema(
         "company_name": Column(str),
         "location": Column(str),
         "job_url": Column(str),
-        "platform": Column(
-            str, Check.isin(["kalibrr", "jobstreet", "glints", "dealls", "karir.com"])
-        ),
+        "platform": Column(str, Check.isin(list(ALLOWED_PLATFORMS))),
         "scraped_at": Column(str),
+        # Detail lowongan, hanya ada kalau enrichment aktif (SCRAPE_ENRICH_DETAILS)
+        "job_description": Column(str, nullable=True, required=False),
+        "salary": Column(str, nullable=True, required=False),
+        "job_type": Column(str, nullable=True, required=False),
+        "posted_at": Column(str, nullable=True, required=False),
     },
     strict=False,
     coerce=True,
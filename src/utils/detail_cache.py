@@ -0,0 +1,116 @@
+import json
+import os
+import time
+from typing import TYPE_CHECKING, Optional
+
+from src.utils.scraper_utils import env_flag
+
+if TYPE_CHECKING:
+    from mypy_boto3_s3 import S3Client
+
+LOCAL_DIR = "/tmp/detail_cache"
+S3_PREFIX = "_cache/job_details"
+DEFAULT_TTL_S = 14 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 5000
+
+
+class DetailCache:
+    """Cache detail lowongan per ``job_id`` (md5 URL): /tmp (LRU) lalu S3.
+
+    Posting jarang berubah setelah terbit, sedangkan URL yang sama muncul di
+    setiap run (pagi/sore) dan di beberapa keyword, jadi enrichment cukup
+    fetch detail untuk job yang benar-benar baru. Entry lebih tua dari
+    ``ttl_s`` dianggap miss. Tier lokal dibatasi ``max_entries`` (LRU via mtime).
+    """
+
+    def __init__(
+        self,
+        local_dir: str = LOCAL_DIR,
+        bucket_name: Optional[str] = None,
+        ttl_s: float = DEFAULT_TTL_S,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.local_dir = local_dir
+        self.bucket_name = bucket_name
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self._s3: Optional["S3Client"] = None
+        os.makedirs(local_dir, exist_ok=True)
+
+    @classmethod
+    def from_env(cls) -> Optional["DetailCache"]:
+        """Cache default (aktif kecuali SCRAPE_DETAIL_CACHE=0)."""
+        if not env_flag("SCRAPE_DETAIL_CACHE", default=True):
+            return None
+        ttl_days = float(os.getenv("SCRAPE_DETAIL_CACHE_TTL_DAYS", 14))
+        return cls(bucket_name=os.getenv("AWS_S3_BUCKET_NAME"), ttl_s=ttl_days * 86400)
+
+    def _s3_client(self) -> "S3Client":
+        if self._s3 is None:
+            import boto3
+
+            self._s3 = boto3.client("s3")
+        return self._s3
+
+    def _local_path(self, job_id: str) -> str:
+        return os.path.join(self.local_dir, f"{job_id}.json")
+
+    def _fresh(self, entry: dict) -> bool:
+        return time.time() - entry.get("cached_at", 0) <= self.ttl_s
+
+    def _read_local(self, job_id: str) -> Optional[dict]:
+        path = self._local_path(job_id)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        os.utime(path)  # tandai baru dipakai (LRU)
+        return entry
+
+    def _write_local(self, job_id: str, entry: dict) -> None:
+        with open(self._local_path(job_id), "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """Detail yang masih segar, atau None (miss/expired/error S3)."""
+        entry = self._read_local(job_id)
+        if entry is None and self.bucket_name:
+            try:
+                obj = self._s3_client().get_object(
+                    Bucket=self.bucket_name, Key=f"{S3_PREFIX}/{job_id}.json"
+                )
+                entry = json.loads(obj["Body"].read())
+                self._write_local(job_id, entry)
+            except Exception:
+                entry = None
+        if entry is None or not self._fresh(entry):
+            return None
+        return entry["detail"]
+
+    def put(self, job_id: str, detail: dict) -> None:
+        entry = {"cached_at": time.time(), "detail": detail}
+        self._write_local(job_id, entry)
+        if not self.bucket_name:
+            return
+        try:
+            self._s3_client().put_object(
+                Bucket=self.bucket_name,
+                Key=f"{S3_PREFIX}/{job_id}.json",
+                Body=json.dumps(entry, ensure_ascii=False).encode("utf-8"),
+                ContentType="application/json",
+            )
+        except Exception as e:
+            print(f"❌ Gagal simpan detail {job_id} ke S3: {e}")
+
+    def evict(self) -> int:
+        """Buang entry lokal LRU di atas ``max_entries``; return jumlah dibuang."""
+        entries = sorted(
+            (entry.stat().st_mtime, entry.path)
+            for entry in os.scandir(self.local_dir)
+            if entry.name.endswith(".json")
+        )
+        excess = len(entries) - self.max_entries
+        for _, path in entries[: max(0, excess)]:
+            os.remove(path)
+        return max(0, excess)
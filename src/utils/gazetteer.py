@@ -0,0 +1,412 @@
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# Gazetteer Indonesia: provinsi, kota/kabupaten, dan kecamatan/kawasan yang
+# sering muncul di lowongan, plus alias Inggris/Indonesia. Semua alias
+# lowercase dan dicocokkan sebagai kata utuh.
+#
+# Kota dan kabupaten bernama sama digabung (Kota/Kab. Bogor -> "Bogor").
+# Nama yang sekaligus provinsi (Jakarta, Jambi, Bengkulu, Gorontalo) tanpa
+# awalan "kota" dianggap provinsi, karena kotanya tidak bisa dipastikan.
+
+# (provinsi, alias)
+PROVINCES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("Aceh", ("aceh", "nanggroe aceh darussalam")),
+    ("Sumatera Utara", ("sumatera utara", "sumatra utara", "north sumatra", "north sumatera", "sumut")),
+    ("Sumatera Barat", ("sumatera barat", "sumatra barat", "west sumatra", "west sumatera", "sumbar")),
+    ("Riau", ("riau",)),
+    ("Kepulauan Riau", ("kepulauan riau", "riau islands", "kepri")),
+    ("Jambi", ("jambi",)),
+    ("Sumatera Selatan", ("sumatera selatan", "sumatra selatan", "south sumatra", "south sumatera", "sumsel")),
+    ("Kepulauan Bangka Belitung", ("kepulauan bangka belitung", "bangka belitung islands", "bangka belitung", "babel")),
+    ("Bengkulu", ("bengkulu",)),
+    ("Lampung", ("lampung",)),
+    ("DKI Jakarta", (
+        "dki jakarta", "jakarta", "jakarta raya", "daerah khusus ibukota jakarta",
+        "special capital region of jakarta", "jakarta capital region", "greater jakarta",
+    )),
+    ("Jawa Barat", ("jawa barat", "west java", "jabar")),
+    ("Banten", ("banten",)),
+    ("Jawa Tengah", ("jawa tengah", "central java", "jateng")),
+    ("DI Yogyakarta", ("di yogyakarta", "daerah istimewa yogyakarta", "special region of yogyakarta", "diy")),
+    ("Jawa Timur", ("jawa timur", "east java", "jatim")),
+    ("Bali", ("bali",)),
+    ("Nusa Tenggara Barat", ("nusa tenggara barat", "west nusa tenggara", "ntb")),
+    ("Nusa Tenggara Timur", ("nusa tenggara timur", "east nusa tenggara", "ntt")),
+    ("Kalimantan Barat", ("kalimantan barat", "west kalimantan", "kalbar")),
+    ("Kalimantan Tengah", ("kalimantan tengah", "central kalimantan", "kalteng")),
+    ("Kalimantan Selatan", ("kalimantan selatan", "south kalimantan", "kalsel")),
+    ("Kalimantan Timur", ("kalimantan timur", "east kalimantan", "kaltim")),
+    ("Kalimantan Utara", ("kalimantan utara", "north kalimantan", "kaltara")),
+    ("Sulawesi Utara", ("sulawesi utara", "north sulawesi", "sulut")),
+    ("Gorontalo", ("gorontalo",)),
+    ("Sulawesi Tengah", ("sulawesi tengah", "central sulawesi", "sulteng")),
+    ("Sulawesi Barat", ("sulawesi barat", "west sulawesi", "sulbar")),
+    ("Sulawesi Selatan", ("sulawesi selatan", "south sulawesi", "sulsel")),
+    ("Sulawesi Tenggara", ("sulawesi tenggara", "southeast sulawesi", "sultra")),
+    ("Maluku", ("maluku",)),
+    ("Maluku Utara", ("maluku utara", "north maluku", "malut")),
+    ("Papua", ("papua",)),
+    ("Papua Barat", ("papua barat", "west papua")),
+    ("Papua Barat Daya", ("papua barat daya", "southwest papua")),
+    ("Papua Tengah", ("papua tengah", "central papua")),
+    ("Papua Pegunungan", ("papua pegunungan", "highland papua")),
+    ("Papua Selatan", ("papua selatan", "south papua")),
+)  # fmt: skip
+
+# (kota/kabupaten, provinsi, alias)
+CITIES: tuple[tuple[str, str, tuple[str, ...]], ...] = (
+    ("Jakarta Selatan", "DKI Jakarta", ("jakarta selatan", "south jakarta", "jaksel")),
+    ("Jakarta Barat", "DKI Jakarta", ("jakarta barat", "west jakarta", "jakbar")),
+    ("Jakarta Pusat", "DKI Jakarta", ("jakarta pusat", "central jakarta", "jakpus")),
+    ("Jakarta Timur", "DKI Jakarta", ("jakarta timur", "east jakarta", "jaktim")),
+    ("Jakarta Utara", "DKI Jakarta", ("jakarta utara", "north jakarta", "jakut")),
+    ("Kepulauan Seribu", "DKI Jakarta", ("kepulauan seribu", "thousand islands")),
+    ("Bandung", "Jawa Barat", ("bandung",)),
+    ("Bandung Barat", "Jawa Barat", ("bandung barat", "west bandung")),
+    ("Bekasi", "Jawa Barat", ("bekasi",)),
+    ("Bogor", "Jawa Barat", ("bogor",)),
+    ("Depok", "Jawa Barat", ("depok",)),
+    ("Cimahi", "Jawa Barat", ("cimahi",)),
+    ("Cirebon", "Jawa Barat", ("cirebon",)),
+    ("Sukabumi", "Jawa Barat", ("sukabumi",)),
+    ("Tasikmalaya", "Jawa Barat", ("tasikmalaya",)),
+    ("Karawang", "Jawa Barat", ("karawang",)),
+    ("Purwakarta", "Jawa Barat", ("purwakarta",)),
+    ("Subang", "Jawa Barat", ("subang",)),
+    ("Garut", "Jawa Barat", ("garut",)),
+    ("Sumedang", "Jawa Barat", ("sumedang",)),
+    ("Cianjur", "Jawa Barat", ("cianjur",)),
+    ("Indramayu", "Jawa Barat", ("indramayu",)),
+    ("Tangerang", "Banten", ("tangerang",)),
+    ("Tangerang Selatan", "Banten", ("tangerang selatan", "south tangerang", "tangsel")),
+    ("Serang", "Banten", ("serang",)),
+    ("Cilegon", "Banten", ("cilegon",)),
+    ("Semarang", "Jawa Tengah", ("semarang",)),
+    ("Surakarta", "Jawa Tengah", ("surakarta", "solo")),
+    ("Magelang", "Jawa Tengah", ("magelang",)),
+    ("Salatiga", "Jawa Tengah", ("salatiga",)),
+    ("Pekalongan", "Jawa Tengah", ("pekalongan",)),
+    ("Tegal", "Jawa Tengah", ("tegal",)),
+    ("Kudus", "Jawa Tengah", ("kudus",)),
+    ("Jepara", "Jawa Tengah", ("jepara",)),
+    ("Klaten", "Jawa Tengah", ("klaten",)),
+    ("Banyumas", "Jawa Tengah", ("banyumas", "purwokerto")),
+    ("Yogyakarta", "DI Yogyakarta", ("yogyakarta", "jogjakarta", "jogja", "yogya", "kota yogyakarta")),
+    ("Sleman", "DI Yogyakarta", ("sleman",)),
+    ("Bantul", "DI Yogyakarta", ("bantul",)),
+    ("Kulon Progo", "DI Yogyakarta", ("kulon progo", "kulonprogo")),
+    ("Gunungkidul", "DI Yogyakarta", ("gunungkidul", "gunung kidul")),
+    ("Surabaya", "Jawa Timur", ("surabaya",)),
+    ("Malang", "Jawa Timur", ("malang",)),
+    ("Sidoarjo", "Jawa Timur", ("sidoarjo",)),
+    ("Gresik", "Jawa Timur", ("gresik",)),
+    ("Kediri", "Jawa Timur", ("kediri",)),
+    ("Madiun", "Jawa Timur", ("madiun",)),
+    ("Mojokerto", "Jawa Timur", ("mojokerto",)),
+    ("Pasuruan", "Jawa Timur", ("pasuruan",)),
+    ("Probolinggo", "Jawa Timur", ("probolinggo",)),
+    ("Jember", "Jawa Timur", ("jember",)),
+    ("Banyuwangi", "Jawa Timur", ("banyuwangi",)),
+    ("Blitar", "Jawa Timur", ("blitar",)),
+    ("Batu", "Jawa Timur", ("kota batu",)),
+    ("Denpasar", "Bali", ("denpasar",)),
+    ("Badung", "Bali", ("badung",)),
+    ("Gianyar", "Bali", ("gianyar",)),
+    ("Tabanan", "Bali", ("tabanan",)),
+    ("Buleleng", "Bali", ("buleleng", "singaraja")),
+    ("Medan", "Sumatera Utara", ("medan",)),
+    ("Deli Serdang", "Sumatera Utara", ("deli serdang",)),
+    ("Binjai", "Sumatera Utara", ("binjai",)),
+    ("Pematangsiantar", "Sumatera Utara", ("pematangsiantar", "pematang siantar")),
+    ("Padangsidimpuan", "Sumatera Utara", ("padangsidimpuan", "padang sidempuan", "padang sidimpuan")),
+    ("Padang", "Sumatera Barat", ("padang",)),
+    ("Bukittinggi", "Sumatera Barat", ("bukittinggi", "bukit tinggi")),
+    ("Pekanbaru", "Riau", ("pekanbaru", "pekan baru")),
+    ("Batam", "Kepulauan Riau", ("batam",)),
+    ("Tanjungpinang", "Kepulauan Riau", ("tanjungpinang", "tanjung pinang")),
+    ("Bintan", "Kepulauan Riau", ("bintan",)),
+    ("Jambi", "Jambi", ("kota jambi",)),
+    ("Palembang", "Sumatera Selatan", ("palembang",)),
+    ("Pangkalpinang", "Kepulauan Bangka Belitung", ("pangkalpinang", "pangkal pinang")),
+    ("Bengkulu", "Bengkulu", ("kota bengkulu",)),
+    ("Bandar Lampung", "Lampung", ("bandar lampung", "bandarlampung")),
+    ("Banda Aceh", "Aceh", ("banda aceh",)),
+    ("Lhokseumawe", "Aceh", ("lhokseumawe",)),
+    ("Pontianak", "Kalimantan Barat", ("pontianak",)),
+    ("Palangka Raya", "Kalimantan Tengah", ("palangka raya", "palangkaraya")),
+    ("Banjarmasin", "Kalimantan Selatan", ("banjarmasin",)),
+    ("Banjarbaru", "Kalimantan Selatan", ("banjarbaru",)),
+    ("Samarinda", "Kalimantan Timur", ("samarinda",)),
+    ("Balikpapan", "Kalimantan Timur", ("balikpapan",)),
+    ("Bontang", "Kalimantan Timur", ("bontang",)),
+    ("Tarakan", "Kalimantan Utara", ("tarakan",)),
+    ("Manado", "Sulawesi Utara", ("manado",)),
+    ("Bitung", "Sulawesi Utara", ("bitung",)),
+    ("Gorontalo", "Gorontalo", ("kota gorontalo",)),
+    ("Palu", "Sulawesi Tengah", ("palu",)),
+    ("Mamuju", "Sulawesi Barat", ("mamuju",)),
+    ("Makassar", "Sulawesi Selatan", ("makassar",)),
+    ("Kendari", "Sulawesi Tenggara", ("kendari",)),
+    ("Mataram", "Nusa Tenggara Barat", ("mataram",)),
+    ("Kupang", "Nusa Tenggara Timur", ("kupang",)),
+    ("Manggarai Barat", "Nusa Tenggara Timur", ("manggarai barat",)),
+    ("Ambon", "Maluku", ("ambon",)),
+    ("Ternate", "Maluku Utara", ("ternate",)),
+    ("Jayapura", "Papua", ("jayapura",)),
+    ("Manokwari", "Papua Barat", ("manokwari",)),
+    ("Sorong", "Papua Barat Daya", ("sorong",)),
+    ("Mimika", "Papua Tengah", ("mimika", "timika")),
+    ("Merauke", "Papua Selatan", ("merauke",)),
+    ("Jayawijaya", "Papua Pegunungan", ("jayawijaya", "wamena")),
+)  # fmt: skip
+
+# (kota/kabupaten induk, alias kecamatan/kawasan)
+DISTRICTS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("Jakarta Selatan", (
+        "kebayoran baru", "kebayoran lama", "kebayoran", "setiabudi", "setia budi", "mega kuningan",
+        "mampang prapatan", "mampang", "pancoran", "tebet", "cilandak", "pasar minggu", "jagakarsa",
+        "pesanggrahan", "senayan", "kemang", "lebak bulus", "simatupang", "scbd",
+    )),
+    ("Jakarta Pusat", ("menteng", "tanah abang", "gambir", "kemayoran", "senen", "cempaka putih", "sawah besar", "johar baru", "thamrin")),
+    ("Jakarta Barat", (
+        "grogol petamburan", "grogol", "kebon jeruk", "palmerah", "cengkareng", "kalideres",
+        "kembangan", "tambora", "puri indah", "slipi",
+    )),
+    ("Jakarta Timur", ("cakung", "pulo gadung", "pulogadung", "jatinegara", "duren sawit", "kramat jati", "pasar rebo", "ciracas", "matraman")),
+    ("Jakarta Utara", ("kelapa gading", "pluit", "ancol", "sunter", "tanjung priok", "penjaringan", "pademangan", "cilincing", "pantai indah kapuk")),
+    ("Tangerang Selatan", ("bsd city", "bsd", "serpong", "alam sutera", "pamulang", "ciputat", "pondok aren")),
+    ("Tangerang", ("gading serpong", "karawaci", "cikupa", "tigaraksa")),
+    ("Bekasi", ("cikarang", "cibitung", "jababeka", "tambun")),
+    ("Bogor", ("cileungsi", "cibinong", "sentul", "gunung putri")),
+    ("Depok", ("margonda", "cinere")),
+    ("Semarang", ("ungaran",)),
+    ("Badung", ("kuta", "seminyak", "canggu", "jimbaran", "nusa dua")),
+    ("Gianyar", ("ubud",)),
+    ("Manggarai Barat", ("labuan bajo",)),
+)  # fmt: skip
+
+REMOTE_ALIASES: tuple[str, ...] = (
+    "remote", "fully remote", "wfh", "work from home", "work from anywhere",
+    "anywhere", "kerja dari rumah", "jarak jauh",
+)  # fmt: skip
+
+_WHITESPACE = re.compile(r"\s+")
+# Pemisah antar lokasi di ``Gazetteer._resolve_ids``: bukan huruf/angka (\b tetap
+# berlaku) dan bukan spasi (tidak ikut dinormalisasi)
+_SEPARATOR = "\x00"
+_SEPARATOR_ID = -1
+
+
+@dataclass(frozen=True)
+class Place:
+    """Hasil resolve satu alias. ``rank`` kecil = lebih spesifik."""
+
+    city: Optional[str]
+    province: Optional[str]
+    rank: int
+
+
+DISTRICT_RANK, CITY_RANK, PROVINCE_RANK = 0, 1, 2
+_REMOTE = Place(None, None, -1)
+
+
+def trie_pattern(words: Iterable[str]) -> str:
+    """Gabungkan kata jadi regex berbentuk trie (prefix bersama difaktorkan).
+
+    Mesin regex cukup menelusuri satu cabang per karakter, bukan mencoba
+    ratusan alternatif di tiap posisi, jadi biaya scan ikut panjang string,
+    bukan jumlah alias. Cabang yang lebih panjang dicoba dulu (greedy),
+    sehingga "jakarta selatan" menang atas "jakarta".
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        end = "" in node
+        branches = [
+            re.escape(char) + build(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if end:
+            return f"(?:{body})?"
+        return body
+
+    if not trie:
+        return "(?!)"  # gazetteer kosong: tidak pernah cocok
+    return build(trie)
+
+
+class Gazetteer:
+    """Resolve lokasi lowongan ke kota, provinsi, dan flag remote.
+
+    Semua alias (kecamatan, kota, provinsi, remote) dikompilasi sekali jadi
+    satu regex trie ``\\b...\\b``; satu ``finditer`` menemukan semua alias di
+    string (kiri-ke-kanan, alias terpanjang menang). Dari semua match, tempat
+    paling spesifik yang paling kiri dipakai: "Kebayoran Baru, Jakarta" ->
+    Jakarta Selatan / DKI Jakarta.
+
+    Gazetteer hanya mengisi kolom baru ``city``/``province``/``is_remote``;
+    kolom ``location`` tetap dari ``LocationNormalizer`` supaya nilainya tidak
+    berubah untuk konsumen lama.
+    """
+
+    def __init__(
+        self,
+        provinces: Iterable[tuple[str, Iterable[str]]] = PROVINCES,
+        cities: Iterable[tuple[str, str, Iterable[str]]] = CITIES,
+        districts: Iterable[tuple[str, Iterable[str]]] = DISTRICTS,
+        remote_aliases: Iterable[str] = REMOTE_ALIASES,
+    ):
+        import numpy as np
+
+        self.places: dict[str, Place] = {}
+        city_province = {}
+        # Urutan isi: level lebih spesifik menimpa alias yang sama di level atas
+        for province, aliases in provinces:
+            self._add(aliases, Place(None, province, PROVINCE_RANK))
+        for city, province, aliases in cities:
+            city_province[city] = province
+            self._add(aliases, Place(city, province, CITY_RANK))
+        for city, aliases in districts:
+            self._add(aliases, Place(city, city_province[city], DISTRICT_RANK))
+        self._add(remote_aliases, _REMOTE)
+        self._pattern = re.compile(rf"\b{trie_pattern(self.places)}\b")
+        # Tabel per Place untuk ``_resolve_ids``/``enrich_series``; elemen
+        # terakhir kolom (None) dipakai untuk id -1
+        unique: dict[Place, int] = {}
+        for place in self.places.values():
+            unique.setdefault(place, len(unique))
+        self._place_list = list(unique)
+        self._token_ids = {alias: unique[place] for alias, place in self.places.items()}
+        self._token_ids[_SEPARATOR] = _SEPARATOR_ID
+        self._batch_pattern = re.compile(
+            f"{re.escape(_SEPARATOR)}|{self._pattern.pattern}"
+        )
+        self._ranks = np.array([p.rank for p in self._place_list], dtype=np.int64)
+        self._cities = np.array(
+            [p.city for p in self._place_list] + [None], dtype=object
+        )
+        self._provinces = np.array(
+            [p.province for p in self._place_list] + [None], dtype=object
+        )
+
+    def _add(self, aliases: Iterable[str], place: Place) -> None:
+        for alias in aliases:
+            self.places[_WHITESPACE.sub(" ", alias.strip().lower())] = place
+
+    def resolve(self, location: str) -> tuple[Optional[str], Optional[str], bool]:
+        """Return ``(city, province, is_remote)`` untuk satu string lokasi."""
+        text = _WHITESPACE.sub(" ", location.lower())
+        best = None
+        is_remote = False
+        for match in self._pattern.finditer(text):
+            place = self.places[match.group()]
+            if place is _REMOTE:
+                is_remote = True
+            elif best is None or place.rank < best.rank:
+                best = place
+        if best is None:
+            return None, None, is_remote
+        return best.city, best.province, is_remote
+
+    def resolve_many(
+        self, locations: list[str]
+    ) -> list[tuple[Optional[str], Optional[str], bool]]:
+        """``resolve`` untuk banyak lokasi sekaligus (urutan dipertahankan)."""
+        best, remote = self._resolve_ids(locations)
+        places = self._place_list
+        return [
+            (None, None, is_remote)
+            if place_id < 0
+            else (places[place_id].city, places[place_id].province, is_remote)
+            for place_id, is_remote in zip(best.tolist(), remote.tolist())
+        ]
+
+    def _resolve_ids(self, locations: list[str]) -> tuple["np.ndarray", "np.ndarray"]:
+        """Id tempat terbaik per lokasi (-1 kalau tidak ada) dan flag remote.
+
+        Semua lokasi digabung jadi satu string dengan pemisah ``\\x00``,
+        di-lower dan dirapikan spasinya sekali, lalu di-scan dengan satu
+        ``findall`` yang juga menangkap pemisahnya: nomor baris tiap match =
+        jumlah pemisah sebelumnya. Pemilihan tempat paling spesifik (rank
+        terkecil, lalu paling kiri) dikerjakan di numpy, jadi overhead Python
+        per baris hampir nol. Hasilnya identik dengan ``resolve`` per lokasi.
+        """
+        import numpy as np
+
+        n = len(locations)
+        joined = _SEPARATOR.join(locations)
+        if joined.count(_SEPARATOR) != n - 1:
+            # Pemisah di dalam lokasi (data rusak) diperlakukan sebagai spasi
+            joined = _SEPARATOR.join(loc.replace(_SEPARATOR, " ") for loc in locations)
+
+        # ``str.split`` memecah di whitespace yang sama dengan ``\\s``; pemisah
+        # bukan whitespace jadi tetap utuh
+        text = " ".join(joined.lower().split())
+        tokens = self._batch_pattern.findall(text)
+        ids = np.fromiter(map(self._token_ids.__getitem__, tokens), dtype=np.int64)
+        is_separator = ids == _SEPARATOR_ID
+        rows = np.cumsum(is_separator)[~is_separator]
+        ids = ids[~is_separator]
+        ranks = self._ranks[ids]
+
+        remote = np.zeros(n, dtype=bool)
+        remote[rows[ranks < 0]] = True
+        best = np.full(n, -1, dtype=np.int64)
+        found = ranks >= 0
+        rows, ranks, ids = rows[found], ranks[found], ids[found]
+        # lexsort stabil: dalam baris dan rank yang sama, match paling kiri dulu
+        order = np.lexsort((ranks, rows))
+        rows, ids = rows[order], ids[order]
+        if len(rows):
+            first = np.r_[True, rows[1:] != rows[:-1]]
+            best[rows[first]] = ids[first]
+        return best, remote
+
+    def enrich_series(self, locations: "pd.Series") -> "pd.DataFrame":
+        """Kolom ``city``, ``province``, ``is_remote`` dari satu kolom lokasi.
+
+        Resolve hanya jalan di nilai unik (``_resolve_ids``), hasilnya
+        dipetakan balik lewat kode factorize, jadi biaya ikut jumlah lokasi
+        berbeda, bukan jumlah baris. Lokasi null -> city/province null,
+        is_remote False.
+        """
+        import numpy as np
+        import pandas as pd
+
+        codes, uniques = pd.factorize(locations, use_na_sentinel=True)
+        raw = list(map(str, uniques.to_numpy(dtype=object)))
+        best, remote = self._resolve_ids(raw)
+        # Id -1 jatuh ke elemen terakhir (None) di tabel kolom per tempat
+        city = self._cities[best]
+        province = self._provinces[best]
+        # Baris tambahan di akhir untuk kode -1 (null)
+        return pd.DataFrame(
+            {
+                "city": np.append(city, None)[codes],
+                "province": np.append(province, None)[codes],
+                "is_remote": np.append(remote, False)[codes],
+            },
+            index=locations.index,
+        )
+
+
+@lru_cache(maxsize=1)
+def get_gazetteer() -> Gazetteer:
+    """Gazetteer bersama dari tabel bawaan (dikompilasi sekali per proses)."""
+    return Gazetteer()
@@ -0,0 +1,122 @@
+# Browserless fast path: listing yang di-render server-side cukup di-fetch
+# lewat HTTP dan di-parse tanpa Chromium. Dependency (httpx[http2],
+# selectolax) ada di group Poetry opsional ``http`` (``poetry install --with
+# http``); kalau tidak ter-install, scraper langsung pakai browser.
+from typing import Optional
+
+from src.utils.scraper_utils import DEVICE_PROFILES, FieldSelectors
+
+BLOCKED_STATUS = {401, 403, 429, 503}
+BLOCKED_MARKERS = (
+    "captcha",
+    "cf-challenge",
+    "challenge-platform",
+    "access denied",
+    "are you a robot",
+)
+
+
+def create_http_client(profile: str = "desktop_chrome"):
+    """httpx.AsyncClient dengan connection pooling + HTTP/2 (None jika httpx tidak ada)."""
+    try:
+        import httpx
+    except ImportError:
+        print("httpx tidak ter-install, HTTP fast path dinonaktifkan")
+        return None
+
+    headers = {
+        "User-Agent": DEVICE_PROFILES[profile]["user_agent"],
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9,id;q=0.8",
+    }
+    limits = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+    timeout = httpx.Timeout(15.0, connect=5.0)
+    try:
+        return httpx.AsyncClient(
+            http2=True,
+            headers=headers,
+            limits=limits,
+            timeout=timeout,
+            follow_redirects=True,
+        )
+    except ImportError:
+        # Paket h2 belum ada: tetap pooled, tapi HTTP/1.1
+        return httpx.AsyncClient(
+            headers=headers, limits=limits, timeout=timeout, follow_redirects=True
+        )
+
+
+def looks_blocked(status_code: int, html: str) -> bool:
+    """Deteksi halaman challenge/rate limit yang harus di-eskalasi ke browser."""
+    if status_code in BLOCKED_STATUS:
+        return True
+    head = html[:20000].lower()
+    return any(marker in head for marker in BLOCKED_MARKERS)
+
+
+def parse_cards_html(
+    html: str, card_selector: str, fields: FieldSelectors
+) -> Optional[list[dict]]:
+    """Parse card dari HTML mentah, bentuk output sama dengan ``extract_cards``.
+
+    Return None kalau parser (selectolax) tidak tersedia.
+    """
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:
+        print("selectolax tidak ter-install, HTTP fast path dinonaktifkan")
+        return None
+
+    cards = []
+    for node in LexborHTMLParser(html).css(card_selector):
+        row = {}
+        for name, (selector, source) in fields.items():
+            element = node.css_first(selector)
+            if element is None:
+                break
+            if source == "text":
+                value = element.text(deep=True).strip()
+            else:
+                value = element.attributes.get(source)
+            if value is None:
+                break
+            row[name] = value
+        else:
+            cards.append(row)
+    return cards
+
+
+async def fetch_cards_http(
+    url: str, card_selector: str, fields: FieldSelectors, client=None
+) -> list[dict]:
+    """Fetch + parse listing tanpa browser.
+
+    List kosong berarti fast path gagal (blocked, kosong, atau dependency
+    tidak ada) dan pemanggil harus eskalasi ke path browser.
+    """
+    own_client = client is None
+    if own_client:
+        client = create_http_client()
+        if client is None:
+            return []
+
+    try:
+        response = await client.get(url)
+        html = response.text
+        if looks_blocked(response.status_code, html):
+            print(f"HTTP fast path terblokir (status {response.status_code})")
+            return []
+
+        cards = parse_cards_html(html, card_selector, fields)
+        if not cards:
+            print("HTTP fast path: tidak ada card di HTML")
+            return []
+
+        print(f"HTTP fast path: {len(cards)} cards tanpa browser")
+        return cards
+    except Exception as e:
+        print(f"HTTP fast path error: {type(e).__name__}: {str(e)}")
+        return []
+    finally:
+        if own_client:
+            await client.aclose()
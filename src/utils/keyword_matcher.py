@@ -0,0 +1,96 @@
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable
+
+from src.utils.keywords import ALLOWED, BLOCKED
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def keyword_pattern(keywords: Iterable[str]) -> str:
+    """Gabungkan daftar keyword jadi satu alternation regex.
+
+    Semua keyword di-anchor ``\\b`` di depan, jadi "hr" tidak lagi cocok di
+    "three" dan "ui" tidak cocok di "build", tapi "engineer" tetap cocok di
+    "engineering". Spasi di belakang keyword ("bi ", " ga ") berarti kata
+    utuh: ditambah ``\\b`` di belakang juga. Pola kompatibel dengan RegExp JS.
+    """
+    words = {}
+    for keyword in keywords:
+        word = keyword.strip().lower()
+        if word:
+            # Spasi di belakang = kata utuh
+            words[word] = words.get(word, False) or keyword.endswith(" ")
+    # Keyword panjang dulu supaya alternation tidak berhenti di prefix pendek
+    parts = [
+        re.escape(word).replace(r"\ ", " ") + (r"\b" if whole else "")
+        for word, whole in sorted(words.items(), key=lambda kv: (-len(kv[0]), kv[0]))
+    ]
+    if not parts:
+        return "(?!)"  # daftar kosong: tidak pernah cocok
+    # \b sekali di depan grup: mesin regex cukup cek boundary satu kali per posisi
+    return r"\b(?:" + "|".join(parts) + ")"
+
+
+class KeywordMatcher:
+    """Filter judul lowongan: relevan (ALLOWED) dan bukan sampah (BLOCKED).
+
+    Kedua daftar dikompilasi sekali jadi dua regex gabungan, jadi tiap judul
+    cukup dua kali ``search`` alih-alih satu scan per keyword.
+    """
+
+    def __init__(self, allowed: Iterable[str], blocked: Iterable[str]):
+        self.allowed_pattern = keyword_pattern(allowed)
+        self.blocked_pattern = keyword_pattern(blocked)
+        # Pola sudah lowercase; lower() judul sekali lebih cepat dari IGNORECASE
+        self._allowed = re.compile(self.allowed_pattern)
+        self._blocked = re.compile(self.blocked_pattern)
+
+    def is_relevant(self, title: str) -> bool:
+        title = title.lower()
+        return (
+            self._allowed.search(title) is not None
+            and self._blocked.search(title) is None
+        )
+
+    def mask(self, titles: Iterable[str]) -> list[bool]:
+        """Satu boolean per judul (urutan sama), untuk memfilter record/card."""
+        allowed = self._allowed.search
+        blocked = self._blocked.search
+        return [
+            allowed(lowered) is not None and blocked(lowered) is None
+            for lowered in (title.lower() for title in titles)
+        ]
+
+    def mask_series(self, titles: "pd.Series") -> "pd.Series":
+        """Versi vectorized ``mask`` untuk satu kolom judul (null = tidak lolos).
+
+        Dipakai silver pipeline dan backfill supaya keduanya memfilter judul
+        persis sama dengan scraper.
+        """
+        lowered = titles.fillna("").astype(str).str.lower()
+        return lowered.str.contains(
+            self.allowed_pattern, regex=True
+        ) & ~lowered.str.contains(self.blocked_pattern, regex=True)
+
+    def filter_titles(self, titles: Iterable[str]) -> list[str]:
+        """Judul yang lolos filter, urutan dipertahankan."""
+        titles = list(titles)
+        return [title for title, keep in zip(titles, self.mask(titles)) if keep]
+
+
+@lru_cache(maxsize=1)
+def get_title_matcher() -> KeywordMatcher:
+    """Matcher bersama dari ``src.utils.keywords`` (dikompilasi sekali per proses)."""
+    return KeywordMatcher(ALLOWED, BLOCKED)
+
+
+def filter_titles(titles: Iterable[str]) -> list[str]:
+    return get_title_matcher().filter_titles(titles)
+
+
+def filter_cards(cards: list[dict], title_key: str = "job_title") -> list[dict]:
+    """Card/record yang judulnya lolos filter ALLOWED/BLOCKED."""
+    keep = get_title_matcher().mask(card[title_key] for card in cards)
+    return [card for card, ok in zip(cards, keep) if ok]
@@ -0,0 +1,86 @@
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Tabel alias: (kota kanonik, pola mentah yang dicari di lokasi lowercase).
+# Urutan = prioritas, sama seperti rantai if/elif lama: distrik Jakarta harus
+# di atas "jakarta" supaya "Jakarta Selatan" tidak runtuh jadi "Jakarta".
+LOCATION_ALIASES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("Jakarta Selatan", ("jakarta selatan", "south jakarta")),
+    ("Jakarta Barat", ("jakarta barat", "west jakarta")),
+    ("Jakarta Pusat", ("jakarta pusat", "central jakarta")),
+    ("Jakarta Timur", ("jakarta timur", "east jakarta")),
+    ("Jakarta Utara", ("jakarta utara", "north jakarta")),
+    ("Jakarta", ("jakarta",)),
+    ("Yogyakarta", ("yogyakarta", "jogja")),
+    ("Bandung", ("bandung",)),
+    ("Surabaya", ("surabaya",)),
+    ("Tangerang", ("tangerang",)),
+    ("Bekasi", ("bekasi", "cikarang")),
+    ("Depok", ("depok",)),
+    ("Bogor", ("bogor", "cileungsi")),
+    ("Semarang", ("semarang",)),
+)
+
+
+class LocationNormalizer:
+    """Normalisasi lokasi mentah ke nama kota kanonik dari tabel alias.
+
+    Semua alias dikompilasi sekali jadi satu regex lookahead: tiap posisi di
+    string mencoba alias menurut prioritas, lalu alias dengan prioritas
+    tertinggi dari semua posisi yang menang. Hasilnya sama persis dengan
+    rantai ``in`` lama, tapi string cukup di-scan sekali. Lokasi yang tidak
+    cocok alias mana pun di-``title()``.
+    """
+
+    def __init__(self, aliases: Iterable[tuple[str, Iterable[str]]]):
+        self.canonical: list[str] = []
+        parts = []
+        for canonical, patterns in aliases:
+            for pattern in patterns:
+                parts.append(re.escape(pattern.lower()))
+                self.canonical.append(canonical)
+        # Grup i = alias ke-i; lookahead supaya match tumpang tindih ikut terlihat
+        alternation = "|".join(f"({part})" for part in parts) or "(?!)"
+        self._pattern = re.compile(f"(?=(?:{alternation}))")
+
+    def normalize(self, location: str) -> str:
+        lowered = location.lower()
+        best = None
+        for match in self._pattern.finditer(lowered):
+            index = match.lastindex - 1
+            if best is None or index < best:
+                best = index
+                if best == 0:
+                    break
+        return lowered.title() if best is None else self.canonical[best]
+
+    def normalize_series(self, locations: "pd.Series") -> "pd.Series":
+        """Normalisasi satu kolom: regex hanya jalan di nilai unik.
+
+        Kolom di-factorize jadi kode kategori + nilai unik, nilai unik
+        dinormalisasi, lalu dipetakan balik lewat kode. Biaya ikut jumlah
+        lokasi berbeda, bukan jumlah baris. Null tetap null.
+        """
+        import numpy as np
+        import pandas as pd
+
+        codes, uniques = pd.factorize(locations, use_na_sentinel=True)
+        normalized = pd.Index(
+            [self.normalize(str(value)) for value in uniques], dtype=str
+        )
+        return pd.Series(
+            # Kode -1 (null) jadi NaN
+            normalized.take(codes, allow_fill=True, fill_value=np.nan),
+            index=locations.index,
+            name=locations.name,
+        )
+
+
+@lru_cache(maxsize=1)
+def get_location_normalizer() -> LocationNormalizer:
+    """Normalizer bersama dari ``LOCATION_ALIASES`` (dikompilasi sekali per proses)."""
+    return LocationNormalizer(LOCATION_ALIASES)
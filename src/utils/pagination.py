@@ -0,0 +1,290 @@
+import os
+import time
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Literal,
+    Optional,
+)
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from playwright.async_api import Page
+
+from src.utils.scraper_utils import (
+    ExtractionStats,
+    FieldSelectors,
+    ListingResponseCollector,
+    canonical_href,
+    extract_cards,
+    fast_human_scroll,
+    human_delay,
+    wait_until_ready,
+)
+
+if TYPE_CHECKING:
+    from src.utils.adaptive_concurrency import AIMDController
+    from src.utils.keyword_matcher import KeywordMatcher
+
+PaginationStyle = Literal["load_more", "scroll", "page_param"]
+
+
+@dataclass
+class PaginationConfig:
+    """Cara pindah halaman + batas berhenti untuk satu platform."""
+
+    style: PaginationStyle
+    load_more_selector: Optional[str] = None
+    page_param: str = "page"
+    max_cards: int = 300
+    time_budget_s: float = 60.0
+    max_steps: int = 20
+    step_wait_ms: int = 5000
+
+
+def with_page_param(url: str, param: str, page_number: int) -> str:
+    """Set/replace query ``param`` di URL (untuk gaya ``?page=N``)."""
+    parts = urlparse(url)
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    query[param] = str(page_number)
+    return urlunparse(parts._replace(query=urlencode(query)))
+
+
+def budget_from_env(config: PaginationConfig) -> PaginationConfig:
+    """Override batas kartu/waktu dari env (SCRAPE_MAX_CARDS, SCRAPE_PAGE_TIME_BUDGET_S)."""
+    max_cards = os.getenv("SCRAPE_MAX_CARDS")
+    time_budget = os.getenv("SCRAPE_PAGE_TIME_BUDGET_S")
+    if max_cards:
+        config.max_cards = int(max_cards)
+    if time_budget:
+        config.time_budget_s = float(time_budget)
+    return config
+
+
+class Paginator:
+    """Pagination bersama untuk ketiga scraper.
+
+    Mendukung tombol load-more, infinite scroll, dan URL ``?page=N``. Card
+    diekstrak inkremental setelah tiap langkah (DOM mulai dari offset terakhir,
+    atau payload API baru kalau ``collector`` menangkap response listing), dan
+    berhenti saat tidak ada card baru, budget card habis, atau budget waktu habis.
+    ``stop_when(new_cards)`` menambah kondisi berhenti milik scraper (mis. semua
+    card di langkah itu sudah pernah terlihat di run sebelumnya).
+    ``title_filter`` membuang judul yang tidak relevan sebelum ekstraksi field
+    (di dalam halaman untuk DOM); hitungannya ada di ``stats``. ``controller``
+    mencatat latency/status goto halaman ``?page=N``.
+
+    ``iter_steps()`` men-yield card baru per langkah (streaming).
+    """
+
+    def __init__(
+        self,
+        page: Page,
+        url: str,
+        card_selector: str,
+        fields: FieldSelectors,
+        config: PaginationConfig,
+        collector: Optional[ListingResponseCollector] = None,
+        parse_payload: Optional[Callable[[dict], list[dict]]] = None,
+        prepare_dom: Optional[Callable[[Page], Awaitable[None]]] = None,
+        stop_when: Optional[Callable[[list[dict]], bool]] = None,
+        title_filter: Optional["KeywordMatcher"] = None,
+        controller: Optional["AIMDController"] = None,
+        label: str = "page",
+    ):
+        self.page = page
+        self.url = url
+        self.card_selector = card_selector
+        self.fields = fields
+        self.config = config
+        self.collector = collector if parse_payload else None
+        self.parse_payload = parse_payload
+        self.prepare_dom = prepare_dom
+        self.stop_when = stop_when
+        self.title_filter = title_filter
+        self.controller = controller
+        self.label = label
+
+        self.card_count = 0
+        self.stats = ExtractionStats()
+        self._last_filtered = 0
+        self.stop_reason = ""
+        self._seen_hrefs: set[str] = set()
+        self._dom_offset = 0
+        self._payload_offset = 0
+        self._page_number = 1
+
+    # ---------------------------------------------------------------- extract
+
+    def _dedupe(self, candidates: list[dict]) -> list[dict]:
+        new_cards = []
+        for card in candidates:
+            # Query string (ref/tracking) tidak membedakan lowongan
+            key = canonical_href(card["href"])
+            if key in self._seen_hrefs:
+                continue
+            self._seen_hrefs.add(key)
+            new_cards.append(card)
+        return new_cards
+
+    def _filter_payload_cards(self, candidates: list[dict]) -> list[dict]:
+        """Filter judul untuk card dari payload API (sudah ada di Python)."""
+        new_cards = self._dedupe(candidates)
+        self.stats.seen += len(new_cards)
+        if self.title_filter is not None:
+            keep = self.title_filter.mask(card["job_title"] for card in new_cards)
+            kept = [card for card, ok in zip(new_cards, keep) if ok]
+            self._last_filtered = len(new_cards) - len(kept)
+            self.stats.filtered += self._last_filtered
+            new_cards = kept
+        self.stats.extracted += len(new_cards)
+        return new_cards
+
+    def _add_new(self, new_cards: list[dict]) -> list[dict]:
+        remaining = self.config.max_cards - self.card_count
+        new_cards = new_cards[: max(0, remaining)]
+        self.card_count += len(new_cards)
+        return new_cards
+
+    async def _collect(self) -> list[dict]:
+        """Ambil card baru (yang lolos filter judul) sejak langkah terakhir."""
+        self._last_filtered = 0
+        if self.collector is not None and self.parse_payload is not None:
+            payloads = self.collector.payloads[self._payload_offset :]
+            self._payload_offset = len(self.collector.payloads)
+            candidates = [
+                card for payload in payloads for card in self.parse_payload(payload)
+            ]
+            if candidates or self.stats.seen:
+                return self._add_new(self._filter_payload_cards(candidates))
+            # Payload tidak tertangkap/tidak bisa di-parse: DOM mulai sekarang
+            print(f"[{self.label}] Payload listing kosong, fallback ke DOM")
+            self.collector = None
+            if payloads:
+                # Card DOM bisa belum ter-render saat payload datang
+                await wait_until_ready(
+                    self.page,
+                    self.card_selector,
+                    max_wait_ms=self.config.step_wait_ms * 2,
+                    label=f"{self.label}-dom",
+                )
+
+        if self.prepare_dom is not None:
+            await self.prepare_dom(self.page)
+        dom_count = await self.page.locator(self.card_selector).count()
+        filtered_before = self.stats.filtered
+        candidates = await extract_cards(
+            self.page,
+            self.card_selector,
+            self.fields,
+            offset=self._dom_offset,
+            title_filter=self.title_filter,
+            stats=self.stats,
+        )
+        self._last_filtered = self.stats.filtered - filtered_before
+        self._dom_offset = dom_count
+        return self._add_new(self._dedupe(candidates))
+
+    # ---------------------------------------------------------------- advance
+
+    async def _wait_for_growth(self, step: int) -> None:
+        if self.collector is not None:
+            await self.collector.wait_for_more(
+                self._payload_offset, timeout_ms=self.config.step_wait_ms
+            )
+            return
+        await wait_until_ready(
+            self.page,
+            self.card_selector,
+            max_wait_ms=self.config.step_wait_ms,
+            min_cards=self._dom_offset + 1,
+            label=f"{self.label}-step-{step}",
+        )
+
+    async def _advance(self, step: int) -> bool:
+        """Pindah ke 'halaman' berikutnya; False kalau tidak ada lagi."""
+        style = self.config.style
+
+        if style == "load_more":
+            button = self.page.locator(self.config.load_more_selector or "")
+            if not await button.is_visible():
+                self.stop_reason = "tombol load-more tidak ada"
+                return False
+            await button.scroll_into_view_if_needed()
+            await human_delay()
+            await button.click()
+            await self._wait_for_growth(step)
+            return True
+
+        if style == "scroll":
+            await fast_human_scroll(self.page)
+            await self._wait_for_growth(step)
+            return True
+
+        # page_param: navigasi ke URL ?page=N berikutnya
+        self._page_number += 1
+        next_url = with_page_param(self.url, self.config.page_param, self._page_number)
+        try:
+            if self.controller is not None:
+                await self.controller.goto(
+                    self.page, next_url, wait_until="domcontentloaded", timeout=30000
+                )
+            else:
+                await self.page.goto(
+                    next_url, wait_until="domcontentloaded", timeout=30000
+                )
+        except Exception as e:
+            self.stop_reason = (
+                f"goto halaman {self._page_number} gagal: {type(e).__name__}"
+            )
+            return False
+        self._dom_offset = 0
+        if self.collector is not None:
+            await self._wait_for_growth(step)
+        else:
+            await wait_until_ready(
+                self.page,
+                self.card_selector,
+                max_wait_ms=self.config.step_wait_ms * 2,
+                label=f"{self.label}-page-{self._page_number}",
+            )
+        return True
+
+    # -------------------------------------------------------------------- run
+
+    async def iter_steps(self) -> AsyncIterator[list[dict]]:
+        """Yield card baru tiap langkah sampai salah satu kondisi berhenti."""
+        start = time.monotonic()
+        new_cards = await self._collect()
+
+        for step in range(1, self.config.max_steps + 1):
+            if new_cards:
+                yield new_cards
+            if self.stop_when is not None and self.stop_when(new_cards):
+                self.stop_reason = "semua card sudah pernah terlihat"
+                break
+            if self.card_count >= self.config.max_cards:
+                self.stop_reason = f"budget {self.config.max_cards} card tercapai"
+                break
+            if time.monotonic() - start >= self.config.time_budget_s:
+                self.stop_reason = f"budget waktu {self.config.time_budget_s}s habis"
+                break
+            if not await self._advance(step):
+                break
+            new_cards = await self._collect()
+            # Langkah yang isinya ditolak filter semua tetap dianggap ada progres
+            if not new_cards and not self._last_filtered:
+                self.stop_reason = "tidak ada card baru"
+                break
+        else:
+            if new_cards:
+                yield new_cards
+            self.stop_reason = f"batas {self.config.max_steps} langkah"
+
+        elapsed = time.monotonic() - start
+        print(
+            f"📄 [{self.label}] {self.card_count} cards dalam {elapsed:.1f}s "
+            f"({self.stats}), berhenti: {self.stop_reason}"
+        )
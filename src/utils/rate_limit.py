@@ -0,0 +1,49 @@
+import asyncio
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """Token bucket async: rata-rata ``rate`` request/detik, burst ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Tunggu sampai ada token. Waiter dilayani berurutan (FIFO lewat lock)."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class DomainRateLimiter:
+    """Satu TokenBucket per domain, jadi host yang berbeda tidak saling antre."""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def bucket(self, url: str) -> TokenBucket:
+        domain = urlparse(url).netloc.lower()
+        if domain not in self._buckets:
+            self._buckets[domain] = TokenBucket(self.rate, self.capacity)
+        return self._buckets[domain]
+
+    async def acquire(self, url: str) -> None:
+        await self.bucket(url).acquire()
@@ -1,9 +1,33 @@
 import asyncio
 import os
 import random
-from typing import Dict, TypedDict
-
-from playwright.async_api import Page, Browser, BrowserContext, ViewportSize
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    TypedDict,
+)
+from urllib.parse import urlsplit
+
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    Response,
+    ViewportSize,
+    async_playwright,
+)
+
+if TYPE_CHECKING:
+    from src.utils.keyword_matcher import KeywordMatcher
 
 
 class DeviceProfile(TypedDict):
@@ -41,6 +65,251 @@ async def fast_human_scroll(page: Page):
     await asyncio.sleep(0.3)
 
 
+# ============================================================================
+# BATCH CARD EXTRACTION: Satu round trip IPC per halaman
+# ============================================================================
+
+# Nama field -> (CSS selector relatif ke card, "text" atau nama atribut)
+FieldSelectors = Dict[str, tuple[str, str]]
+
+_EXTRACT_CARDS_JS = """
+(cards, { fields, offset, titleFilter }) => {
+    const read = (card, [selector, source]) => {
+        const el = card.querySelector(selector);
+        if (!el) return null;
+        return source === 'text'
+            ? (el.textContent || '').trim()
+            : el.getAttribute(source);
+    };
+    // Predikat judul dikompilasi sekali per panggilan dari pola KeywordMatcher
+    const allowed = titleFilter ? new RegExp(titleFilter.allowed) : null;
+    const blocked = titleFilter ? new RegExp(titleFilter.blocked) : null;
+
+    const pending = cards.slice(offset);
+    const rows = [];
+    let filtered = 0;
+    for (const card of pending) {
+        try {
+            if (titleFilter) {
+                const title = read(card, fields[titleFilter.field]);
+                if (title === null) continue;
+                const lowered = title.toLowerCase();
+                if (!allowed.test(lowered) || blocked.test(lowered)) {
+                    filtered++;
+                    continue;
+                }
+            }
+            const row = {};
+            let complete = true;
+            for (const [name, spec] of Object.entries(fields)) {
+                const value = read(card, spec);
+                if (value === null) { complete = false; break; }
+                row[name] = value;
+            }
+            if (complete) rows.push(row);
+        } catch (e) {
+            // card rusak dilewati
+        }
+    }
+    return { seen: pending.length, filtered, rows };
+}
+"""
+
+
+@dataclass
+class ExtractionStats:
+    """Hitungan card per scrape: dilihat, ditolak filter judul, diekstrak."""
+
+    seen: int = 0
+    filtered: int = 0
+    extracted: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.seen} card dilihat, {self.filtered} difilter, "
+            f"{self.extracted} diekstrak"
+        )
+
+
+def canonical_href(href: str) -> str:
+    """Path lowongan tanpa query/fragment (ref/tracking) dan slash penutup.
+
+    Href dari DOM (dengan query tracking) dan dari payload API (dibangun
+    sendiri atau URL absolut) untuk lowongan yang sama jadi string yang sama,
+    jadi ``job_id``, seen index, dan cache detail tidak berubah antar mode.
+    """
+    return urlsplit(href.strip()).path.rstrip("/")
+
+
+async def extract_cards(
+    page: Page,
+    card_selector: str,
+    fields: FieldSelectors,
+    offset: int = 0,
+    title_filter: Optional["KeywordMatcher"] = None,
+    stats: Optional[ExtractionStats] = None,
+) -> list[dict]:
+    """Ambil semua field semua card lewat satu ``evaluate_all``.
+
+    Card yang field-nya tidak lengkap dilewati (toleransi per card seperti
+    loop lama), jadi satu card rusak tidak menggagalkan satu halaman.
+    ``offset`` melewati card DOM yang sudah diekstrak (ekstraksi inkremental).
+    ``title_filter`` menjalankan aturan ALLOWED/BLOCKED di dalam halaman, jadi
+    card yang ditolak tidak pernah menyeberang ke Python. ``stats`` diakumulasi.
+    """
+    arg: dict = {
+        "fields": {name: list(sel) for name, sel in fields.items()},
+        "offset": offset,
+        "titleFilter": None,
+    }
+    if title_filter is not None:
+        arg["titleFilter"] = {
+            "field": "job_title",
+            "allowed": title_filter.allowed_pattern,
+            "blocked": title_filter.blocked_pattern,
+        }
+    result = await page.locator(card_selector).evaluate_all(_EXTRACT_CARDS_JS, arg)
+    rows = result["rows"]
+    print(
+        f"Found {result['seen']} potential cards, {result['filtered']} difilter, "
+        f"{len(rows)} lengkap"
+    )
+    if stats is not None:
+        stats.seen += result["seen"]
+        stats.filtered += result["filtered"]
+        stats.extracted += len(rows)
+    return rows
+
+
+# ============================================================================
+# RESPONSE INTERCEPTION: Ambil listing dari JSON API situs, bukan dari DOM
+# ============================================================================
+
+
+def env_flag(name: str, default: bool = False) -> bool:
+    """Baca flag boolean dari environment ("1", "true", "yes", "on")."""
+    raw = os.getenv(name)
+    if raw is None or raw.strip() == "":
+        return default
+    return raw.strip().lower() in ("1", "true", "yes", "on")
+
+
+class ListingResponseCollector:
+    """Tangkap payload JSON listing lewat ``page.on("response")``.
+
+    Dipasang SEBELUM ``page.goto`` supaya response pertama ikut tertangkap.
+    Scraper memakai ``payloads`` kalau ada, dan fallback ke DOM kalau kosong.
+    """
+
+    def __init__(self, page: Page, url_patterns: list[str]):
+        self.url_patterns = url_patterns
+        self.payloads: list = []
+        self._received = asyncio.Event()
+        page.on("response", self._on_response)
+
+    def matches(self, url: str) -> bool:
+        return any(pattern in url for pattern in self.url_patterns)
+
+    async def _on_response(self, response: Response) -> None:
+        if response.status != 200 or not self.matches(response.url):
+            return
+        if "json" not in response.headers.get("content-type", ""):
+            return
+        try:
+            payload = await response.json()
+        except Exception as e:
+            print(f"Gagal parse payload listing: {type(e).__name__}: {str(e)}")
+            return
+        self.payloads.append(payload)
+        self._received.set()
+
+    @property
+    def has_payload(self) -> bool:
+        return self._received.is_set()
+
+    async def wait_for_payload(self, timeout_ms: int = 5000) -> bool:
+        """Tunggu payload pertama; False kalau timeout (pakai DOM)."""
+        try:
+            await asyncio.wait_for(self._received.wait(), timeout_ms / 1000)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def wait_for_more(self, known: int, timeout_ms: int = 5000) -> bool:
+        """Tunggu payload ke-``known + 1`` (mis. setelah scroll/paging)."""
+        deadline = time.monotonic() + timeout_ms / 1000
+        while len(self.payloads) <= known:
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(0.1)
+        return True
+
+
+# ============================================================================
+# READINESS ENGINE: Ganti sleep hydration tetap dengan sinyal siap
+# ============================================================================
+
+
+async def wait_until_ready(
+    page: Page,
+    card_selector: str,
+    collector: Optional[ListingResponseCollector] = None,
+    max_wait_ms: int = 10000,
+    poll_ms: int = 250,
+    stable_polls: int = 2,
+    min_cards: int = 1,
+    label: str = "page",
+) -> int:
+    """Tunggu sampai halaman listing siap, dengan batas waktu keras.
+
+    Siap kalau salah satu terpenuhi:
+    - payload listing sudah tertangkap ``collector``
+    - jumlah card >= ``min_cards`` dan stabil selama ``stable_polls`` poll
+    - network idle (tidak ada request baru ~500ms) dengan card >= ``min_cards``
+
+    Time-to-ready di-log per halaman untuk tuning. Return jumlah card terakhir.
+    """
+    start = time.monotonic()
+    deadline = start + max_wait_ms / 1000
+    idle_task = asyncio.create_task(
+        page.wait_for_load_state("networkidle", timeout=max_wait_ms)
+    )
+    last_count = -1
+    stable = 0
+    count = 0
+    reason = "timeout"
+
+    try:
+        while True:
+            if collector is not None and collector.has_payload:
+                reason = "response"
+                break
+
+            count = await page.locator(card_selector).count()
+            if count >= min_cards:
+                if idle_task.done() and idle_task.exception() is None:
+                    reason = "network-idle"
+                    break
+                stable = stable + 1 if count == last_count else 0
+                if stable >= stable_polls:
+                    reason = "stable"
+                    break
+            last_count = count
+
+            if time.monotonic() >= deadline:
+                break
+            await asyncio.sleep(poll_ms / 1000)
+    finally:
+        if not idle_task.done():
+            idle_task.cancel()
+        else:
+            idle_task.exception()  # hindari warning "exception never retrieved"
+
+    elapsed = time.monotonic() - start
+    print(f"⏱️ ready[{label}] {elapsed:.2f}s ({count} cards, {reason})")
+    return count
+
+
 # ============================================================================
 # STEALTH BROWSER CONTEXT (The Fixer)
 # ============================================================================
@@ -89,6 +358,7 @@ async def create_browser(p, headless: bool = True):
 async def create_stealth_context(
     browser: Browser,
     profile: str = "desktop_chrome",
+    storage_state: Optional[str] = None,
 ) -> BrowserContext:
     device = DEVICE_PROFILES[profile]
 
@@ -101,6 +371,7 @@ async def create_stealth_context(
         locale="en-US",
         timezone_id="America/New_York",
         permissions=["geolocation", "notifications"],
+        storage_state=storage_state,
     )
 
     # CRITICAL: Injeksi script SEBELUM page load
@@ -261,3 +532,304 @@ async def create_stealth_context(
     )
 
     return context
+
+
+# ============================================================================
+# RESOURCE POLICY: Blocking native di Chromium, tanpa route handler Python
+# ============================================================================
+
+# Pola wildcard Network.setBlockedURLs ("*" = sembarang karakter)
+TRACKER_URL_PATTERNS = (
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*adsystem.com*",
+    "*ads.yahoo.com*",
+    "*adservice.google.com*",
+    "*connect.facebook.net*",
+    "*hotjar.com*",
+)
+IMAGE_URL_PATTERNS = tuple(
+    f"*.{ext}*" for ext in ("png", "jpg", "jpeg", "gif", "webp", "svg", "ico")
+)
+FONT_URL_PATTERNS = tuple(f"*.{ext}*" for ext in ("woff", "woff2", "ttf", "otf"))
+MEDIA_URL_PATTERNS = tuple(f"*.{ext}*" for ext in ("mp4", "webm", "mp3", "m3u8"))
+
+
+# Kategori resource yang bisa dipilih PlatformSpec (``blocked_resources``)
+RESOURCE_CATEGORY_PATTERNS: Dict[str, tuple[str, ...]] = {
+    "tracker": TRACKER_URL_PATTERNS,
+    "image": IMAGE_URL_PATTERNS,
+    "font": FONT_URL_PATTERNS,
+    "media": MEDIA_URL_PATTERNS,
+}
+
+
+@dataclass(frozen=True)
+class ResourcePolicy:
+    """Daftar pola URL yang diblokir Chromium untuk satu platform."""
+
+    blocked_url_patterns: tuple[str, ...] = ()
+
+    @classmethod
+    def from_categories(cls, categories: Iterable[str]) -> "ResourcePolicy":
+        """Gabungkan pola dari nama kategori (``tracker``, ``image``, ...)."""
+        patterns: tuple[str, ...] = ()
+        for category in categories:
+            patterns += RESOURCE_CATEGORY_PATTERNS[category]
+        return cls(patterns)
+
+
+async def apply_resource_policy(page: Page, platform: str, policy: ResourcePolicy):
+    """Pasang blocking per platform lewat CDP ``Network.setBlockedURLs``.
+
+    Berbeda dengan ``page.route``, request yang tidak diblokir tidak pernah
+    mampir ke Python. ``policy`` dibangun dari ``PlatformSpec.blocked_resources``
+    (satu-satunya sumber policy per platform).
+    Return CDP session (atau None kalau policy kosong, dimatikan lewat
+    SCRAPE_BLOCK_RESOURCES=0, atau CDP tidak tersedia).
+    """
+    if not policy.blocked_url_patterns:
+        return None
+    if not env_flag("SCRAPE_BLOCK_RESOURCES", default=True):
+        return None
+
+    try:
+        cdp = await page.context.new_cdp_session(page)
+        await cdp.send("Network.enable")
+        await cdp.send(
+            "Network.setBlockedURLs", {"urls": list(policy.blocked_url_patterns)}
+        )
+    except Exception as e:
+        print(f"Resource policy {platform} gagal dipasang: {type(e).__name__}: {e}")
+        return None
+
+    print(
+        f"Resource policy {platform}: {len(policy.blocked_url_patterns)} pola diblokir"
+    )
+    return cdp
+
+
+# ============================================================================
+# SCRAPER SESSION: Satu Chromium untuk semua keyword
+# ============================================================================
+
+
+class ScraperSession:
+    """Satu browser per invocation, context/page baru per keyword.
+
+    Launch Chromium dan init Playwright adalah fixed cost terbesar per keyword,
+    jadi session ini dibuka sekali di ``run_*_pipeline`` lalu dipakai ulang.
+    Browser baru di-launch saat context pertama diminta, dan di-launch ulang
+    otomatis kalau koneksinya putus (session yang dipakai lintas invocation).
+
+    Usage:
+        async with ScraperSession(headless=True) as session:
+            context = await session.new_context()
+    """
+
+    def __init__(self, headless: bool = True, profile: str = "desktop_chrome"):
+        self.headless = headless
+        self.profile = profile
+        self._playwright_cm = None
+        self._start_lock = asyncio.Lock()
+        self._http_client = None
+        self._asset_caches: dict = {}
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+
+    @property
+    def is_alive(self) -> bool:
+        """Health check: browser sudah di-launch dan masih terhubung."""
+        return self.browser is not None and self.browser.is_connected()
+
+    async def start(self) -> "ScraperSession":
+        """Launch Chromium (idempotent, aman dipanggil paralel)."""
+        async with self._start_lock:
+            if self.is_alive:
+                return self
+            if self.browser is not None:
+                # Browser/driver mati (crash, container di-freeze): relaunch
+                print("Browser tidak terhubung, relaunch...")
+                await self._close_browser()
+            self._playwright_cm = async_playwright()
+            self.playwright = await self._playwright_cm.__aenter__()
+            self.browser = await create_browser(self.playwright, headless=self.headless)
+            print("Berhasil create browser (session)")
+        return self
+
+    def http_client(self):
+        """httpx client bersama untuk HTTP fast path (pooled, HTTP/2)."""
+        if self._http_client is None:
+            from src.utils.http_fetch import create_http_client
+
+            self._http_client = create_http_client(self.profile)
+        return self._http_client
+
+    async def new_context(self, storage_state: Optional[str] = None) -> BrowserContext:
+        """Stealth context baru (cookies & storage terisolasi per keyword)."""
+        if not self.is_alive:
+            await self.start()
+        assert self.browser is not None
+        return await create_stealth_context(
+            self.browser, profile=self.profile, storage_state=storage_state
+        )
+
+    @asynccontextmanager
+    async def context(
+        self, platform: Optional[str] = None
+    ) -> AsyncIterator[BrowserContext]:
+        """Context per keyword yang otomatis ditutup, browser tetap hidup.
+
+        Dengan ``platform`` dan SCRAPE_PERSIST_PROFILE=1, storage_state
+        platform itu di /tmp dipulihkan dan disimpan lagi. SCRAPE_ASSET_CACHE=1
+        menambah cache disk .js/.css; routing itu mematikan HTTP cache browser
+        untuk seluruh context (lihat ``browser_profile``), jadi opt-in terpisah.
+        """
+        if platform is None or not env_flag("SCRAPE_PERSIST_PROFILE"):
+            context = await self.new_context()
+            try:
+                yield context
+            finally:
+                await context.close()
+            return
+
+        from src.utils.browser_profile import (
+            AssetDiskCache,
+            save_storage_state,
+            storage_state_path,
+        )
+
+        context = await self.new_context(storage_state=storage_state_path(platform))
+        cache = None
+        if env_flag("SCRAPE_ASSET_CACHE"):
+            if platform not in self._asset_caches:
+                self._asset_caches[platform] = AssetDiskCache.for_platform(platform)
+            cache = self._asset_caches[platform]
+            await cache.install(context)
+        try:
+            yield context
+        finally:
+            await save_storage_state(context, platform)
+            await context.close()
+            if cache is not None:
+                print(f"Asset cache {platform}: {cache.hits} hit, {cache.misses} miss")
+
+    async def new_page(self) -> Page:
+        """Page baru di context baru; tutup lewat ``page.context.close()``."""
+        context = await self.new_context()
+        return await context.new_page()
+
+    async def _close_browser(self) -> None:
+        if self.browser is not None:
+            try:
+                await self.browser.close()
+            except Exception as e:
+                print(f"Gagal close browser: {type(e).__name__}: {str(e)}")
+            self.browser = None
+        if self._playwright_cm is not None:
+            try:
+                await self._playwright_cm.__aexit__(None, None, None)
+            except Exception as e:
+                print(f"Gagal stop Playwright: {type(e).__name__}: {str(e)}")
+            self._playwright_cm = None
+            self.playwright = None
+
+    async def close(self) -> None:
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        await self._close_browser()
+
+    async def __aenter__(self) -> "ScraperSession":
+        # Chromium di-launch lazy saat context pertama dibuat, jadi run yang
+        # seluruhnya lewat HTTP fast path tidak pernah membayar launch browser
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+
+@asynccontextmanager
+async def use_session(
+    session: Optional[ScraperSession] = None, headless: bool = True
+) -> AsyncIterator[ScraperSession]:
+    """Pakai session yang diberikan, atau buka session sekali-pakai.
+
+    Session milik pemanggil tidak ditutup di sini; session sekali-pakai
+    ditutup saat keluar (perilaku lama: satu browser per panggilan scraper).
+    """
+    if session is not None:
+        yield session
+        return
+
+    async with ScraperSession(headless=headless) as own_session:
+        yield own_session
+
+
+# ============================================================================
+# CONCURRENT KEYWORD SCRAPING: Bounded page pool di satu browser
+# ============================================================================
+
+
+def get_scrape_concurrency(default: int = 1) -> int:
+    """Jumlah keyword yang di-scrape paralel (env ``SCRAPE_CONCURRENCY``)."""
+    raw = os.getenv("SCRAPE_CONCURRENCY")
+    if not raw:
+        return default
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        print(f"SCRAPE_CONCURRENCY tidak valid ({raw!r}), pakai {default}")
+        return default
+
+
+async def stream_keywords_concurrently(
+    keywords: list[str],
+    stream_one: Callable[[str], AsyncGenerator[list, None]],
+    concurrency: int = 1,
+    controller=None,
+    max_pending: int = 4,
+) -> AsyncIterator[tuple[str, list]]:
+    """Scrape keyword paralel, yield ``(keyword, batch)`` sesuai urutan selesai.
+
+    Maksimal ``concurrency`` keyword sekaligus; dengan ``controller``
+    (AIMDController) batasnya mengikuti limit adaptif controller.
+    Batch dari semua keyword digabung lewat queue terbatas (``max_pending``),
+    jadi scraper berhenti sebentar kalau konsumen (validasi/tulis parquet)
+    tertinggal. Error di satu keyword hanya di-log; batch yang sudah di-yield
+    keyword itu tetap dipakai.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, max_pending))
+    done = object()
+
+    async def _produce(keyword: str) -> None:
+        batches = stream_one(keyword)
+        try:
+            async with controller.slot() if controller is not None else semaphore:
+                async for batch in batches:
+                    await queue.put((keyword, batch))
+        except Exception as e:
+            print(f"❌ Keyword '{keyword}' gagal: {type(e).__name__}: {str(e)}")
+        finally:
+            # Tutup generator (browser context ikut ditutup) juga saat dibatalkan
+            await batches.aclose()
+        # Sentinel hanya saat selesai normal: kalau konsumen berhenti lebih
+        # awal, task dibatalkan dan tidak boleh menunggu di queue yang penuh
+        await queue.put(done)
+
+    tasks = [asyncio.create_task(_produce(keyword)) for keyword in keywords]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            item = await queue.get()
+            if item is done:
+                remaining -= 1
+                continue
+            yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,114 @@
+import os
+from array import array
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Iterable, Optional
+
+if TYPE_CHECKING:
+    from mypy_boto3_s3 import S3Client
+
+LOCAL_DIR = "/tmp/seen_index"
+S3_PREFIX = "_state/seen_jobs"
+
+
+def _hash_key(job_id: str) -> int:
+    """64-bit pertama dari md5 hex ``job_id`` (cukup unik, 8 byte per job)."""
+    return int(job_id[:16], 16)
+
+
+class SeenJobIndex:
+    """Himpunan ``job_id`` dari run sebelumnya, disimpan sebagai sorted hash array.
+
+    Dipakai untuk menghentikan pagination lebih awal: listing yang diurutkan
+    terbaru (Glints ``sortBy=LATEST``) tidak perlu di-scroll lagi begitu satu
+    halaman isinya sudah pernah terlihat semua. Persisten di ``/tmp`` (cache
+    container warm) dan S3 bronze bucket (``_state/seen_jobs/<platform>.bin``).
+    """
+
+    def __init__(self, platform: str, hashes: Optional[Iterable[int]] = None):
+        self.platform = platform
+        self._hashes = array("Q", sorted(set(hashes or [])))
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def __contains__(self, job_id: str) -> bool:
+        key = _hash_key(job_id)
+        i = bisect_left(self._hashes, key)
+        return i < len(self._hashes) and self._hashes[i] == key
+
+    def all_seen(self, job_ids: list[str]) -> bool:
+        """True kalau ada job dan semuanya sudah pernah terlihat."""
+        return bool(job_ids) and all(job_id in self for job_id in job_ids)
+
+    def add_many(self, job_ids: Iterable[str]) -> None:
+        merged = set(self._hashes)
+        merged.update(_hash_key(job_id) for job_id in job_ids)
+        self._hashes = array("Q", sorted(merged))
+
+    # ------------------------------------------------------------ persistence
+
+    def to_bytes(self) -> bytes:
+        return self._hashes.tobytes()
+
+    @classmethod
+    def from_bytes(cls, platform: str, data: bytes) -> "SeenJobIndex":
+        hashes = array("Q")
+        hashes.frombytes(data)
+        index = cls(platform)
+        index._hashes = hashes
+        return index
+
+    @staticmethod
+    def _local_path(platform: str) -> str:
+        return os.path.join(LOCAL_DIR, f"{platform}.bin")
+
+    @staticmethod
+    def _s3_key(platform: str) -> str:
+        return f"{S3_PREFIX}/{platform}.bin"
+
+    @classmethod
+    def load(cls, platform: str) -> "SeenJobIndex":
+        """Load dari S3 (sumber utama), fallback ke /tmp, atau index kosong."""
+        bucket_name = os.getenv("AWS_S3_BUCKET_NAME")
+        if bucket_name:
+            try:
+                import boto3
+
+                s3: S3Client = boto3.client("s3")
+                obj = s3.get_object(Bucket=bucket_name, Key=cls._s3_key(platform))
+                index = cls.from_bytes(platform, obj["Body"].read())
+                print(f"Seen index {platform}: {len(index)} job dari S3")
+                return index
+            except Exception as e:
+                print(f"Seen index {platform} tidak ada di S3: {type(e).__name__}")
+
+        path = cls._local_path(platform)
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                index = cls.from_bytes(platform, f.read())
+            print(f"Seen index {platform}: {len(index)} job dari {path}")
+            return index
+
+        return cls(platform)
+
+    def save(self) -> None:
+        """Simpan ke /tmp dan S3 (kalau bucket di-set). Gagal simpan tidak fatal."""
+        data = self.to_bytes()
+
+        os.makedirs(LOCAL_DIR, exist_ok=True)
+        with open(self._local_path(self.platform), "wb") as f:
+            f.write(data)
+
+        bucket_name = os.getenv("AWS_S3_BUCKET_NAME")
+        if not bucket_name:
+            return
+        try:
+            import boto3
+
+            s3: S3Client = boto3.client("s3")
+            s3.put_object(
+                Bucket=bucket_name, Key=self._s3_key(self.platform), Body=data
+            )
+            print(f"Seen index {self.platform}: {len(self)} job disimpan")
+        except Exception as e:
+            print(f"❌ Gagal simpan seen index {self.platform}: {e}")
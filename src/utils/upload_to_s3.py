@@ -1,27 +1,36 @@
 from typing import TYPE_CHECKING
 import boto3
 import io
-import pandas as pd
 from dotenv import load_dotenv
 import os
 from src.utils.time_utils import now_wib
 
+# pandas hanya untuk type hint: upload_file_to_s3 (jalur scraper) tidak butuh pandas
 if TYPE_CHECKING:
+    import pandas as pd
     from mypy_boto3_s3 import S3Client
 
 load_dotenv()
 
 
-def upload_to_s3(df: pd.DataFrame, platform: str):
-    s3: S3Client = boto3.client("s3")
-    bucket_name = os.getenv("AWS_S3_BUCKET_NAME")
-
-    if not bucket_name:
-        raise ValueError("AWS_S3_BUCKET_NAME environment variable not set")
+def _bronze_key(
+    s3: "S3Client", bucket_name: str, platform: str, replace: bool = True
+) -> str:
+    """Return key file baru di partisi ingestion_date hari ini.
 
+    ``replace=True``: file lama di partisi itu dihapus dulu (satu file per
+    hari). ``replace=False``: file baru ditambahkan di samping file lama,
+    dipakai kalau seen index aktif, karena run berikutnya berhenti lebih awal
+    dan hanya membawa sebagian listing.
+    """
     now = now_wib()
     date_str = now.strftime("%Y-%m-%d")
     timestamp = now.strftime("%H%M%S")
+    key = (
+        f"platform={platform}/ingestion_date={date_str}/{platform}_{timestamp}.parquet"
+    )
+    if not replace:
+        return key
 
     # check if already exist object in ingestion_date, if exist, replace with new file, if not exist, create new file
 
@@ -35,9 +44,17 @@ def upload_to_s3(df: pd.DataFrame, platform: str):
             f"🧹 Menghapus {existing_objects['KeyCount']} file lama di folder ingestion_date={date_str}"
         )
 
-    file_key = (
-        f"platform={platform}/ingestion_date={date_str}/{platform}_{timestamp}.parquet"
-    )
+    return key
+
+
+def upload_to_s3(df: "pd.DataFrame", platform: str):
+    s3: S3Client = boto3.client("s3")
+    bucket_name = os.getenv("AWS_S3_BUCKET_NAME")
+
+    if not bucket_name:
+        raise ValueError("AWS_S3_BUCKET_NAME environment variable not set")
+
+    file_key = _bronze_key(s3, bucket_name, platform)
 
     parquet_buffer = io.BytesIO()
     df.to_parquet(parquet_buffer, engine="pyarrow", index=False)
@@ -49,3 +66,25 @@ def upload_to_s3(df: pd.DataFrame, platform: str):
     except Exception as e:
         print(f"❌ Gagal upload ke S3: {e}")
         return False
+
+
+def upload_file_to_s3(path: str, platform: str, replace: bool = True):
+    """Upload file Parquet bronze yang sudah ditulis di disk (streaming, tanpa buffer).
+
+    ``replace=False`` menambah file ke partisi hari ini (lihat ``_bronze_key``).
+    """
+    s3: S3Client = boto3.client("s3")
+    bucket_name = os.getenv("AWS_S3_BUCKET_NAME")
+
+    if not bucket_name:
+        raise ValueError("AWS_S3_BUCKET_NAME environment variable not set")
+
+    file_key = _bronze_key(s3, bucket_name, platform, replace=replace)
+
+    try:
+        s3.upload_file(path, bucket_name, file_key)
+        print(f"🚀 Data mendarat di: s3://{bucket_name}/{file_key}")
+        return True
+    except Exception as e:
+        print(f"❌ Gagal upload ke S3: {e}")
+        return False
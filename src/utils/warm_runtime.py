@@ -0,0 +1,104 @@
+# Runtime warm untuk Lambda: event loop + ScraperSession tetap hidup di level
+# module, jadi invocation berikutnya di container yang sama (jadwal pagi/sore,
+# retry Step Functions) tidak membayar start Playwright + launch Chromium lagi.
+import asyncio
+import importlib
+import threading
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from src.utils.scraper_utils import ScraperSession
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_session: Optional[ScraperSession] = None
+_prewarm_thread: Optional[threading.Thread] = None
+
+# Modul berat yang di-import di main thread selama Chromium di-launch
+PREWARM_IMPORTS = ("pyarrow", "pyarrow.parquet", "src.utils.bronze_writer")
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Event loop module-level; dibuat ulang hanya kalau sudah ditutup."""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+    # Loop bisa dibuat di thread prewarm; daftarkan juga di thread pemanggil
+    asyncio.set_event_loop(_loop)
+    return _loop
+
+
+def get_session() -> ScraperSession:
+    """ScraperSession warm. Browser mati di-relaunch oleh ``session.start()``."""
+    global _session
+    if _session is None:
+        _session = ScraperSession(headless=True)
+    elif _session.browser is not None and not _session.is_alive:
+        print("Warm session: browser tidak terhubung, akan di-relaunch")
+    else:
+        print("Warm session: pakai ulang browser dari invocation sebelumnya")
+    return _session
+
+
+def _launch_in_background() -> None:
+    start = time.perf_counter()
+    try:
+        get_loop().run_until_complete(get_session().start())
+        print(f"Prewarm: Chromium siap dalam {time.perf_counter() - start:.2f}s")
+    except Exception as e:
+        # Tidak fatal: handler akan launch browser secara lazy seperti biasa
+        print(f"Prewarm gagal: {type(e).__name__}: {str(e)}")
+
+
+def prewarm(imports: tuple[str, ...] = PREWARM_IMPORTS) -> None:
+    """Launch Chromium di thread lain sambil import modul berat di main thread.
+
+    Dipanggil saat import module handler (fase init Lambda, CPU di-boost),
+    jadi handler pertama langsung mendapat browser yang siap.
+    """
+    global _prewarm_thread
+    if _prewarm_thread is not None:
+        return
+    _prewarm_thread = threading.Thread(
+        target=_launch_in_background, name="chromium-prewarm", daemon=True
+    )
+    _prewarm_thread.start()
+
+    start = time.perf_counter()
+    for module in imports:
+        try:
+            importlib.import_module(module)
+        except ImportError as e:
+            print(f"Prewarm: skip import {module}: {e}")
+    print(f"Prewarm: import selesai dalam {time.perf_counter() - start:.2f}s")
+
+
+def wait_for_prewarm() -> None:
+    """Tunggu launch di thread prewarm selesai sebelum loop dipakai main thread."""
+    global _prewarm_thread
+    if _prewarm_thread is not None:
+        _prewarm_thread.join()
+        _prewarm_thread = None
+
+
+def run_warm(pipeline: Callable[[ScraperSession], Awaitable[T]]) -> T:
+    """Jalankan ``pipeline(session)`` di loop warm (pengganti ``asyncio.run``).
+
+    Loop dan browser sengaja TIDAK ditutup setelah selesai.
+    """
+    wait_for_prewarm()
+    loop = get_loop()
+    return loop.run_until_complete(pipeline(get_session()))
+
+
+def shutdown() -> None:
+    """Tutup session dan loop warm (untuk test / proses non-Lambda)."""
+    global _loop, _session
+    wait_for_prewarm()
+    if _loop is not None and not _loop.is_closed():
+        if _session is not None:
+            _loop.run_until_complete(_session.close())
+        _loop.close()
+    _loop = None
+    _session = None
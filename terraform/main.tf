@@ -507,6 +507,7 @@ resource "aws_lambda_function" "kalibrr" {
       PLAYWRIGHT_BROWSERS_PATH = "/opt/pw-browsers"
       AWS_S3_BUCKET_NAME       = aws_s3_bucket.bronze.id
       SCRAPE_KEYWORDS          = "data-engineer-intern,etl-developer-intern,big-data-intern,bi-engineer-intern"
+      SCRAPER_WARM_REUSE       = "1"
     }
   }
 
@@ -541,6 +542,7 @@ resource "aws_lambda_function" "glints" {
       PLAYWRIGHT_BROWSERS_PATH = "/opt/pw-browsers"
       AWS_S3_BUCKET_NAME       = aws_s3_bucket.bronze.id
       SCRAPE_KEYWORDS          = "data+engineer+intern,etl+developer+intern,big+data+intern,bi+engineer+intern"
+      SCRAPER_WARM_REUSE       = "1"
     }
   }
 
@@ -575,6 +577,45 @@ resource "aws_lambda_function" "jobstreet" {
       PLAYWRIGHT_BROWSERS_PATH = "/opt/pw-browsers"
       AWS_S3_BUCKET_NAME       = aws_s3_bucket.bronze.id
       SCRAPE_KEYWORDS          = "data-engineer-intern,etl-developer-intern,big-data-intern,bi-engineer-intern"
+      SCRAPER_WARM_REUSE       = "1"
+    }
+  }
+
+  memory_size = 3008
+  timeout     = 900
+}
+
+# Resource untuk semua platform dalam satu container (eksperimen GB-seconds:
+# satu Chromium dan satu event loop menggantikan tiga Lambda di atas)
+resource "aws_lambda_function" "all_platforms" {
+  function_name = "jobscraper-all-platforms"
+  role          = aws_iam_role.lambda_exec_role.arn
+  package_type  = "Image"
+  architectures = ["x86_64"]
+  image_uri     = "${aws_ecr_repository.scraper_repo.repository_url}@${data.aws_ecr_image.scraper_latest.image_digest}"
+
+  publish = false
+
+  lifecycle {
+    ignore_changes = [publish]
+  }
+
+  dead_letter_config {
+    target_arn = aws_sqs_queue.scraper_dlq.arn
+  }
+
+  image_config {
+    command = ["src.entrypoint.handlers.all_platforms_handler"]
+  }
+
+  environment {
+    variables = {
+      PLAYWRIGHT_BROWSERS_PATH  = "/opt/pw-browsers"
+      AWS_S3_BUCKET_NAME        = aws_s3_bucket.bronze.id
+      SCRAPE_KEYWORDS_GLINTS    = "data+engineer+intern,etl+developer+intern,big+data+intern,bi+engineer+intern"
+      SCRAPE_KEYWORDS_JOBSTREET = "data-engineer-intern,etl-developer-intern,big-data-intern,bi-engineer-intern"
+      SCRAPE_KEYWORDS_KALIBRR   = "data-engineer-intern,etl-developer-intern,big-data-intern,bi-engineer-intern"
+      SCRAPER_WARM_REUSE        = "1"
     }
   }
 
@@ -883,6 +924,34 @@ resource "aws_glue_catalog_table" "silver_table" {
       name = "keyword"
       type = "string"
     }
+    columns {
+      name = "city"
+      type = "string"
+    }
+    columns {
+      name = "province"
+      type = "string"
+    }
+    columns {
+      name = "is_remote"
+      type = "boolean"
+    }
+    columns {
+      name = "job_description"
+      type = "string"
+    }
+    columns {
+      name = "salary"
+      type = "string"
+    }
+    columns {
+      name = "job_type"
+      type = "string"
+    }
+    columns {
+      name = "posted_at"
+      type = "string"
+    }
   }
 
   partition_keys {
@@ -39,17 +39,21 @@ ORDER BY 3 DESC;
 -- =========================================================
 -- 3. v_job_location_stats
 --    Sebaran lokasi (Bar Chart / Map)
+--    location = nilai lama (tabel alias); hierarki kota/provinsi
+--    dari gazetteer ada di kolom city dan province
 -- =========================================================
 CREATE OR REPLACE VIEW "v_job_location_stats" AS
 SELECT
   location,
+  province,
+  COALESCE(is_remote, false) AS is_remote,
   platform,
   keyword,
   COUNT(*) AS job_count,
   COUNT(DISTINCT ingestion_date) AS active_days
 FROM "jobscraper_db"."v_jobscraper_clean"
-GROUP BY 1, 2, 3
-ORDER BY 4 DESC;
+GROUP BY 1, 2, 3, 4, 5
+ORDER BY 6 DESC;
 
 -- =========================================================
 -- 4. v_job_new_vs_existing
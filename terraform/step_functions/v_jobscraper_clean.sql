@@ -16,6 +16,9 @@ WITH
       job_title,
       company_name,
       location,
+      city,
+      province,
+      is_remote,
       job_url,
       platform,
       scraped_at,
@@ -41,6 +44,9 @@ WITH
       job_title,
       company_name,
       location,
+      city,
+      province,
+      is_remote,
       job_url,
       platform,
       scraped_at,
@@ -62,6 +68,9 @@ SELECT
   job_title,
   company_name,
   location,
+  city,
+  province,
+  is_remote,
   job_url,
   keyword,
   ingestion_date,
@@ -0,0 +1,130 @@
+"""Tests for the AIMD adaptive concurrency controller."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from src.utils.adaptive_concurrency import AIMDController
+from src.utils.scraper_utils import stream_keywords_concurrently
+
+
+class TestAIMDController:
+    """Tests for AIMDController."""
+
+    def test_additive_increase_per_round(self):
+        controller = AIMDController("glints", initial=1, max_limit=4)
+
+        controller.on_success(0.5)
+        assert controller.current_limit == 2
+        controller.on_success(0.5)
+        assert controller.current_limit == 2  # +1/2
+        controller.on_success(0.5)
+        assert controller.current_limit == 3
+
+    def test_increase_capped_at_max(self):
+        controller = AIMDController("glints", initial=4, max_limit=4)
+
+        controller.on_success(0.5)
+
+        assert controller.current_limit == 4
+
+    def test_multiplicative_decrease_with_cooldown(self):
+        controller = AIMDController("kalibrr", initial=4, max_limit=4, cooldown_s=60)
+
+        controller.on_timeout()
+        controller.on_status(429)  # masih dalam cooldown: diabaikan
+
+        assert controller.current_limit == 2
+        assert controller.counts["timeout"] == 1
+        assert controller.counts["throttled"] == 1
+
+    def test_slow_page_and_empty_page_decrease(self):
+        controller = AIMDController("jobstreet", initial=4, max_limit=4, cooldown_s=0)
+
+        controller.on_success(controller.latency_target_s + 1)
+        controller.on_empty_page()
+
+        assert controller.current_limit == 1
+
+    def test_non_throttle_status_is_ignored(self):
+        controller = AIMDController("glints", initial=2, max_limit=2)
+
+        controller.on_status(500)
+
+        assert controller.current_limit == 2
+
+    @pytest.mark.asyncio
+    async def test_goto_records_throttle_status(self):
+        controller = AIMDController("glints", initial=2, max_limit=2)
+        page = MagicMock()
+        page.goto = AsyncMock(return_value=MagicMock(status=429))
+
+        await controller.goto(page, "https://glints.com/x", timeout=1000)
+
+        page.goto.assert_awaited_once_with("https://glints.com/x", timeout=1000)
+        assert controller.current_limit == 1
+
+    @pytest.mark.asyncio
+    async def test_goto_timeout_decreases_and_reraises(self):
+        controller = AIMDController("glints", initial=2, max_limit=2)
+        page = MagicMock()
+        page.goto = AsyncMock(side_effect=PlaywrightTimeoutError("timeout"))
+
+        with pytest.raises(PlaywrightTimeoutError):
+            await controller.goto(page, "https://glints.com/x")
+
+        assert controller.current_limit == 1
+
+    def test_retry_wait_grows_after_backoff(self):
+        controller = AIMDController("glints", initial=4, max_limit=4, cooldown_s=0)
+        state = MagicMock(attempt_number=2)
+
+        assert controller.retry_wait(state) == 4.0
+        controller.on_timeout()
+        assert controller.retry_wait(state) == 8.0
+
+    def test_from_env_fixed_without_flag(self, monkeypatch):
+        monkeypatch.delenv("SCRAPE_ADAPTIVE_CONCURRENCY", raising=False)
+        monkeypatch.setenv("SCRAPE_CONCURRENCY", "3")
+
+        controller = AIMDController.from_env("glints")
+        controller.on_timeout()
+
+        assert controller.current_limit == 3
+
+    def test_from_env_adaptive_range(self, monkeypatch):
+        monkeypatch.setenv("SCRAPE_ADAPTIVE_CONCURRENCY", "1")
+        monkeypatch.setenv("SCRAPE_CONCURRENCY", "2")
+        monkeypatch.setenv("SCRAPE_MAX_CONCURRENCY", "6")
+
+        controller = AIMDController.from_env("glints")
+
+        assert (controller.min_limit, controller.current_limit) == (1, 2)
+        assert controller.max_limit == 6
+
+    @pytest.mark.asyncio
+    async def test_keywords_respect_controller_limit(self):
+        controller = AIMDController("glints", initial=2, max_limit=2)
+        active = 0
+        peak = 0
+
+        async def stream_one(keyword):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            yield [keyword]
+
+        results = [
+            item
+            async for item in stream_keywords_concurrently(
+                ["a", "b", "c", "d", "e"], stream_one, controller=controller
+            )
+        ]
+
+        assert len(results) == 5
+        assert peak == 2
+        assert controller.in_flight == 0
@@ -0,0 +1,207 @@
+"""Tests for the incremental bronze Parquet writer and streaming stage."""
+
+import asyncio
+from unittest.mock import patch
+
+import pyarrow.parquet as pq
+import pytest
+
+from src.main.bronze_stream import stream_to_bronze
+from src.utils.bronze_writer import (
+    BronzeParquetWriter,
+    BronzeSchemaError,
+    bronze_schema,
+    build_bronze_table,
+    validate_bronze_table,
+)
+
+
+def _record(job_id, title="Data Engineer Intern"):
+    return {
+        "job_id": job_id,
+        "job_title": title,
+        "company_name": "PT Data",
+        "location": "Jakarta",
+        "job_url": f"https://glints.com/{job_id}",
+        "platform": "glints",
+        "scraped_at": "20240101_070000",
+    }
+
+
+class TestBronzeParquetWriter:
+    """Tests for BronzeParquetWriter."""
+
+    def test_row_group_per_write(self, tmp_path):
+        writer = BronzeParquetWriter("glints", directory=str(tmp_path))
+
+        writer.write([{**_record("1"), "keyword": "a"}])
+        writer.write([{**_record("2"), "keyword": "b"}])
+        path = writer.close()
+
+        parquet = pq.ParquetFile(path)
+        assert parquet.metadata.num_row_groups == 2
+        assert parquet.schema_arrow == bronze_schema()
+        assert parquet.read().column("job_id").to_pylist() == ["1", "2"]
+
+    def test_dedupe_across_and_within_batches(self, tmp_path):
+        writer = BronzeParquetWriter("glints", directory=str(tmp_path))
+
+        first = writer.dedupe([_record("1"), _record("2"), _record("1")])
+        second = writer.dedupe([_record("2"), _record("3")])
+
+        assert [r["job_id"] for r in first] == ["1", "2"]
+        assert [r["job_id"] for r in second] == ["3"]
+
+    def test_close_without_rows_returns_none(self, tmp_path):
+        writer = BronzeParquetWriter("glints", directory=str(tmp_path))
+
+        assert writer.close() is None
+
+    def test_detail_schema(self):
+        assert "job_description" in bronze_schema(with_details=True).names
+        assert "job_description" not in bronze_schema().names
+
+
+class TestValidateBronzeTable:
+    """Tests for the Arrow-native bronze schema checks."""
+
+    def _table(self, records):
+        return build_bronze_table(
+            [{**r, "keyword": "kw"} for r in records], bronze_schema()
+        )
+
+    def test_valid_table_passes(self):
+        table = self._table([_record("1"), _record("2")])
+
+        assert validate_bronze_table(table) is table
+
+    def test_duplicate_job_id_rejected(self):
+        with pytest.raises(BronzeSchemaError, match="job_id"):
+            validate_bronze_table(self._table([_record("1"), _record("1")]))
+
+    def test_null_required_column_rejected(self):
+        record = {**_record("1"), "company_name": None}
+
+        with pytest.raises(BronzeSchemaError, match="company_name"):
+            validate_bronze_table(self._table([record]))
+
+    def test_unknown_platform_rejected(self):
+        record = {**_record("1"), "platform": "linkedin"}
+
+        with pytest.raises(BronzeSchemaError, match="linkedin"):
+            validate_bronze_table(self._table([record]))
+
+    def test_non_string_values_are_coerced(self):
+        record = {**_record("1"), "job_id": 123, "keyword": "kw"}
+
+        table = build_bronze_table([record], bronze_schema())
+
+        assert table.column("job_id").to_pylist() == ["123"]
+
+
+class TestStreamToBronze:
+    """Tests for stream_to_bronze."""
+
+    @pytest.mark.asyncio
+    async def test_streams_dedupes_and_uploads(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("SCRAPE_ENRICH_DETAILS", raising=False)
+        monkeypatch.setattr("src.utils.bronze_writer.BRONZE_DIR", str(tmp_path))
+        uploaded = {}
+
+        def fake_upload(path, platform, replace=True):
+            uploaded["path"] = path
+            uploaded["replace"] = replace
+            uploaded["table"] = pq.read_table(path)
+            return True
+
+        async def batches():
+            yield "kw-a", [_record("1"), _record("2")]
+            yield "kw-b", [_record("2"), _record("3")]
+
+        with patch("src.utils.upload_to_s3.upload_file_to_s3", fake_upload):
+            rows, job_ids = await stream_to_bronze("glints", batches())
+
+        assert rows == 3
+        assert job_ids == {"1", "2", "3"}
+        table = uploaded["table"]
+        assert table.column("keyword").to_pylist() == ["kw-a", "kw-a", "kw-b"]
+        assert uploaded["path"].startswith(str(tmp_path))
+        assert list(tmp_path.iterdir()) == []  # file lokal dihapus
+        assert uploaded["replace"] is True
+
+    @pytest.mark.asyncio
+    async def test_append_mode_keeps_partition(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("SCRAPE_ENRICH_DETAILS", raising=False)
+        monkeypatch.setattr("src.utils.bronze_writer.BRONZE_DIR", str(tmp_path))
+
+        async def batches():
+            yield "kw", [_record("1")]
+
+        with patch(
+            "src.utils.upload_to_s3.upload_file_to_s3", return_value=True
+        ) as upload:
+            await stream_to_bronze("glints", batches(), replace_partition=False)
+
+        assert upload.call_args.kwargs == {"replace": False}
+
+    @pytest.mark.asyncio
+    async def test_no_data_skips_upload(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("SCRAPE_ENRICH_DETAILS", raising=False)
+        monkeypatch.setattr("src.utils.bronze_writer.BRONZE_DIR", str(tmp_path))
+
+        async def batches():
+            return
+            yield
+
+        with patch("src.utils.upload_to_s3.upload_file_to_s3") as upload:
+            assert await stream_to_bronze("glints", batches()) == (0, set())
+
+        upload.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_validation_overlaps_scraping(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("SCRAPE_ENRICH_DETAILS", raising=False)
+        monkeypatch.setattr("src.utils.bronze_writer.BRONZE_DIR", str(tmp_path))
+        validated = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        def fake_validate(records, schema):
+            loop.call_soon_threadsafe(validated.set)
+            return build_bronze_table(records, schema)
+
+        async def batches():
+            yield "kw-a", [_record("1")]
+            # Batch kedua baru di-scrape setelah batch pertama tervalidasi
+            await validated.wait()
+            yield "kw-b", [_record("2")]
+
+        with (
+            patch("src.main.bronze_stream._validate_batch", fake_validate),
+            patch("src.utils.upload_to_s3.upload_file_to_s3", return_value=True),
+        ):
+            rows, _ = await asyncio.wait_for(
+                stream_to_bronze("glints", batches()), timeout=5
+            )
+
+        assert rows == 2
+
+    @pytest.mark.asyncio
+    async def test_validation_error_stops_pipeline(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("SCRAPE_ENRICH_DETAILS", raising=False)
+        monkeypatch.setattr("src.utils.bronze_writer.BRONZE_DIR", str(tmp_path))
+
+        async def batches():
+            for i in range(10):
+                yield "kw", [_record(str(i))]
+
+        with (
+            patch(
+                "src.main.bronze_stream._validate_batch",
+                side_effect=ValueError("schema"),
+            ),
+            patch("src.utils.upload_to_s3.upload_file_to_s3") as upload,
+        ):
+            with pytest.raises(ValueError, match="schema"):
+                await asyncio.wait_for(stream_to_bronze("glints", batches()), 5)
+
+        upload.assert_not_called()
@@ -0,0 +1,148 @@
+"""Tests for the persisted browser profile (storage state + asset cache)."""
+
+import os
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.utils import browser_profile
+from src.utils.browser_profile import (
+    ASSET_URL_RE,
+    AssetDiskCache,
+    save_storage_state,
+    storage_state_path,
+)
+
+
+class TestAssetDiskCache:
+    """Tests for AssetDiskCache storage and LRU eviction."""
+
+    def test_put_and_get(self, tmp_path):
+        cache = AssetDiskCache(str(tmp_path))
+        url = "https://glints.com/_next/static/app.js"
+
+        assert cache.get(url) is None
+        cache.put(url, b"console.log(1)", {"content-type": "text/javascript"})
+
+        body, headers = cache.get(url)
+        assert body == b"console.log(1)"
+        assert headers == {"content-type": "text/javascript"}
+
+    def test_expired_entry_is_miss(self, tmp_path):
+        cache = AssetDiskCache(str(tmp_path), max_age_s=0)
+        cache.put("https://x.com/a.js", b"a", {})
+
+        assert cache.get("https://x.com/a.js") is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = AssetDiskCache(str(tmp_path), max_bytes=25)
+        cache.put("https://x.com/old.js", b"o" * 10, {})
+        cache.put("https://x.com/used.js", b"u" * 10, {})
+        body_path, _ = cache._paths("https://x.com/old.js")
+        os.utime(body_path, (1, 1))  # paling lama tidak dipakai
+        cache.get("https://x.com/used.js")
+
+        cache.put("https://x.com/new.js", b"n" * 10, {})
+
+        assert cache.get("https://x.com/old.js") is None
+        assert cache.get("https://x.com/used.js") is not None
+        assert cache.get("https://x.com/new.js") is not None
+        assert cache.size_bytes() <= 25
+
+    def test_evicts_only_past_threshold(self, tmp_path, monkeypatch):
+        cache = AssetDiskCache(str(tmp_path), max_bytes=25)
+        calls = []
+        original = cache.evict
+        monkeypatch.setattr(cache, "evict", lambda: calls.append(1) or original())
+
+        cache.put("https://x.com/a.js", b"a" * 10, {})
+        cache.put("https://x.com/b.js", b"b" * 10, {})
+        cache.put("https://x.com/a.js", b"A" * 10, {})  # timpa: total tetap 20
+
+        assert calls == []
+        cache.put("https://x.com/c.js", b"c" * 10, {})
+
+        assert calls == [1]
+        assert cache.size_bytes() <= 25
+
+    def test_total_starts_from_existing_entries(self, tmp_path):
+        AssetDiskCache(str(tmp_path)).put("https://x.com/a.js", b"a" * 20, {})
+        cache = AssetDiskCache(str(tmp_path), max_bytes=25)
+
+        cache.put("https://x.com/b.js", b"b" * 10, {})
+
+        assert cache.get("https://x.com/b.js") is not None
+        assert cache.size_bytes() <= 25
+
+    def test_route_pattern_only_matches_static_assets(self):
+        assert ASSET_URL_RE.search("https://cdn.x.com/app.3f2a.js")
+        assert ASSET_URL_RE.search("https://cdn.x.com/main.css?v=12")
+        assert not ASSET_URL_RE.search("https://x.com/api/search?q=a.js")
+        assert not ASSET_URL_RE.search("https://x.com/jobs")
+
+    @pytest.mark.asyncio
+    async def test_route_serves_cached_body(self, tmp_path):
+        cache = AssetDiskCache(str(tmp_path))
+        cache.put("https://x.com/app.js", b"cached", {"content-type": "text/js"})
+        route = MagicMock()
+        route.request.method = "GET"
+        route.request.url = "https://x.com/app.js"
+        route.fulfill = AsyncMock()
+        route.fetch = AsyncMock()
+
+        await cache._handle(route)
+
+        route.fetch.assert_not_awaited()
+        route.fulfill.assert_awaited_once_with(
+            status=200, headers={"content-type": "text/js"}, body=b"cached"
+        )
+        assert cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_miss_keeps_original_headers(self, tmp_path):
+        cache = AssetDiskCache(str(tmp_path))
+        response = MagicMock(status=200)
+        response.headers = {
+            "content-type": "text/javascript",
+            "access-control-allow-origin": "https://x.com",
+            "timing-allow-origin": "*",
+            "content-encoding": "br",
+            "content-length": "10",
+        }
+        response.body = AsyncMock(return_value=b"decoded body")
+        route = MagicMock()
+        route.request.method = "GET"
+        route.request.url = "https://cdn.x.com/app.js"
+        route.fetch = AsyncMock(return_value=response)
+        route.fulfill = AsyncMock()
+
+        await cache._handle(route)
+
+        _, headers = cache.get("https://cdn.x.com/app.js")
+        assert headers == {
+            "content-type": "text/javascript",
+            "access-control-allow-origin": "https://x.com",
+            "timing-allow-origin": "*",
+        }
+
+
+class TestStorageState:
+    """Tests for storage_state persistence."""
+
+    @pytest.mark.asyncio
+    async def test_save_then_restore_path(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(browser_profile, "PROFILE_ROOT", str(tmp_path))
+
+        async def write_state(path):
+            with open(path, "w") as f:
+                f.write('{"cookies": [], "origins": []}')
+
+        context = MagicMock()
+        context.storage_state = AsyncMock(side_effect=write_state)
+
+        assert storage_state_path("jobstreet") is None
+        await save_storage_state(context, "jobstreet")
+
+        path = storage_state_path("jobstreet")
+        assert path == str(tmp_path / "jobstreet" / "storage_state.json")
+        assert os.listdir(tmp_path / "jobstreet") == ["storage_state.json"]
@@ -0,0 +1,65 @@
+"""Tests for the job-detail cache (local LRU tier + S3 tier)."""
+
+import io
+import json
+import os
+import time
+from unittest.mock import MagicMock
+
+from src.utils.detail_cache import S3_PREFIX, DetailCache
+
+DETAIL = {"job_description": "Build pipelines", "salary": None}
+
+
+class TestDetailCache:
+    """Tests for DetailCache TTL, LRU and S3 fallback."""
+
+    def test_local_round_trip(self, tmp_path):
+        cache = DetailCache(local_dir=str(tmp_path))
+
+        assert cache.get("abc") is None
+        cache.put("abc", DETAIL)
+
+        assert cache.get("abc") == DETAIL
+
+    def test_expired_entry_is_miss(self, tmp_path):
+        cache = DetailCache(local_dir=str(tmp_path), ttl_s=60)
+        with open(tmp_path / "abc.json", "w") as f:
+            json.dump({"cached_at": time.time() - 120, "detail": DETAIL}, f)
+
+        assert cache.get("abc") is None
+
+    def test_lru_eviction_keeps_recent_entries(self, tmp_path):
+        cache = DetailCache(local_dir=str(tmp_path), max_entries=2)
+        for job_id in ("a", "b", "c"):
+            cache.put(job_id, DETAIL)
+        os.utime(tmp_path / "a.json", (1, 1))
+
+        assert cache.evict() == 1
+        assert sorted(os.listdir(tmp_path)) == ["b.json", "c.json"]
+
+    def test_s3_tier_fills_local_tier(self, tmp_path):
+        cache = DetailCache(local_dir=str(tmp_path), bucket_name="bronze")
+        entry = {"cached_at": time.time(), "detail": DETAIL}
+        s3 = MagicMock()
+        s3.get_object.return_value = {
+            "Body": io.BytesIO(json.dumps(entry).encode("utf-8"))
+        }
+        cache._s3 = s3
+
+        assert cache.get("abc") == DETAIL
+        s3.get_object.assert_called_once_with(
+            Bucket="bronze", Key=f"{S3_PREFIX}/abc.json"
+        )
+        assert (tmp_path / "abc.json").exists()
+
+    def test_s3_errors_are_misses(self, tmp_path):
+        cache = DetailCache(local_dir=str(tmp_path), bucket_name="bronze")
+        s3 = MagicMock()
+        s3.get_object.side_effect = Exception("NoSuchKey")
+        s3.put_object.side_effect = Exception("AccessDenied")
+        cache._s3 = s3
+
+        assert cache.get("abc") is None
+        cache.put("abc", DETAIL)  # tidak raise, tier lokal tetap terisi
+        assert cache.get("abc") == DETAIL
@@ -0,0 +1,176 @@
+"""Tests for the Indonesian location gazetteer."""
+
+import re
+
+import pandas as pd
+
+from src.utils.gazetteer import (
+    CITIES,
+    DISTRICTS,
+    PROVINCES,
+    Gazetteer,
+    get_gazetteer,
+    trie_pattern,
+)
+
+
+class TestTriePattern:
+    """Tests for trie_pattern."""
+
+    def test_longest_alias_wins(self):
+        pattern = re.compile(rf"\b{trie_pattern(['jakarta', 'jakarta selatan'])}\b")
+
+        assert pattern.findall("jakarta selatan, jakarta") == [
+            "jakarta selatan",
+            "jakarta",
+        ]
+
+    def test_whole_words_only(self):
+        pattern = re.compile(rf"\b{trie_pattern(['bali', 'kuta'])}\b")
+
+        assert pattern.findall("balikpapan, kutai") == []
+
+    def test_empty_word_list_never_matches(self):
+        assert re.search(trie_pattern([]), "jakarta") is None
+
+
+class TestGazetteer:
+    """Tests for Gazetteer.resolve."""
+
+    def test_city_with_province(self):
+        assert get_gazetteer().resolve("Bandung, Jawa Barat") == (
+            "Bandung",
+            "Jawa Barat",
+            False,
+        )
+
+    def test_english_alias(self):
+        assert get_gazetteer().resolve("South Jakarta, Jakarta") == (
+            "Jakarta Selatan",
+            "DKI Jakarta",
+            False,
+        )
+
+    def test_district_resolves_to_parent_city(self):
+        assert get_gazetteer().resolve("Kebayoran Baru, Jakarta") == (
+            "Jakarta Selatan",
+            "DKI Jakarta",
+            False,
+        )
+        assert get_gazetteer().resolve("BSD City") == (
+            "Tangerang Selatan",
+            "Banten",
+            False,
+        )
+
+    def test_longer_city_name_wins(self):
+        assert get_gazetteer().resolve("Tangerang Selatan")[0] == "Tangerang Selatan"
+        assert get_gazetteer().resolve("Padang Sidempuan")[0] == "Padangsidimpuan"
+
+    def test_province_only(self):
+        assert get_gazetteer().resolve("Jakarta") == (None, "DKI Jakarta", False)
+        assert get_gazetteer().resolve("West Java") == (None, "Jawa Barat", False)
+
+    def test_remote(self):
+        assert get_gazetteer().resolve("Remote") == (None, None, True)
+        assert get_gazetteer().resolve("Work From Home - Surabaya") == (
+            "Surabaya",
+            "Jawa Timur",
+            True,
+        )
+
+    def test_unknown_location(self):
+        assert get_gazetteer().resolve("Indonesia") == (None, None, False)
+
+    def test_no_substring_false_positive(self):
+        assert get_gazetteer().resolve("Balikpapan")[0] == "Balikpapan"
+
+    def test_district_cities_exist(self):
+        cities = {city for city, _, _ in CITIES}
+        provinces = {province for province, _ in PROVINCES}
+
+        assert {city for city, _ in DISTRICTS} <= cities
+        assert {province for _, province, _ in CITIES} <= provinces
+        assert len(PROVINCES) == 38
+
+    def test_custom_tables(self):
+        gazetteer = Gazetteer(
+            provinces=[("P", ("prov",))],
+            cities=[("C", "P", ("kota c",))],
+            districts=[("C", ("kec d",))],
+            remote_aliases=["anywhere"],
+        )
+
+        assert gazetteer.resolve("Kec D, Prov") == ("C", "P", False)
+        assert gazetteer.resolve("anywhere") == (None, None, True)
+
+
+class TestResolveMany:
+    """Tests for Gazetteer.resolve_many."""
+
+    def test_matches_resolve(self):
+        gazetteer = get_gazetteer()
+        locations = [
+            "Kebayoran Baru, Jakarta",
+            "WFH",
+            "",
+            "Tangerang,  Jakarta",
+            "Work From Home - Surabaya",
+            "BALIKPAPAN\tKalimantan Timur",
+            "Indonesia",
+        ]
+
+        assert gazetteer.resolve_many(locations) == [
+            gazetteer.resolve(location) for location in locations
+        ]
+
+    def test_separator_inside_location(self):
+        assert get_gazetteer().resolve_many(["x\x00bandung", "remote"]) == [
+            ("Bandung", "Jawa Barat", False),
+            (None, None, True),
+        ]
+
+    def test_empty_list(self):
+        assert get_gazetteer().resolve_many([]) == []
+
+
+class TestEnrichSeries:
+    """Tests for Gazetteer.enrich_series."""
+
+    def test_columns_mapped_back_to_rows(self):
+        series = pd.Series(
+            ["Medan", "Remote", None, "Medan"], index=[5, 6, 7, 8], name="location"
+        )
+
+        result = get_gazetteer().enrich_series(series)
+
+        assert result.columns.tolist() == ["city", "province", "is_remote"]
+        assert result.index.tolist() == [5, 6, 7, 8]
+        assert result["city"].fillna("-").tolist() == ["Medan", "-", "-", "Medan"]
+        assert result["province"].isna().tolist() == [False, True, True, False]
+        assert result["is_remote"].tolist() == [False, True, False, False]
+
+    def test_resolves_each_unique_value_once(self, monkeypatch):
+        gazetteer = Gazetteer()
+        calls = []
+        original = gazetteer._resolve_ids
+        monkeypatch.setattr(
+            gazetteer, "_resolve_ids", lambda locs: calls.extend(locs) or original(locs)
+        )
+
+        gazetteer.enrich_series(pd.Series(["Bali", "Depok"] * 1000))
+
+        assert sorted(calls) == ["Bali", "Depok"]
+
+    def test_categorical_input(self):
+        series = pd.Series(["cikarang", "bekasi", "cikarang"], dtype="category")
+
+        result = get_gazetteer().enrich_series(series)
+
+        assert result["city"].tolist() == ["Bekasi", "Bekasi", "Bekasi"]
+
+    def test_empty_series(self):
+        result = get_gazetteer().enrich_series(pd.Series([], dtype=str))
+
+        assert result.empty
+        assert result["is_remote"].dtype == bool
@@ -0,0 +1,98 @@
+"""Tests for the browserless HTTP fast path."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.utils.http_fetch import fetch_cards_http, looks_blocked, parse_cards_html
+
+FIELDS = {
+    "job_title": ('[data-automation="jobTitle"]', "text"),
+    "href": ('[data-automation="jobTitle"]', "href"),
+    "company_name": ('[data-automation="jobCompany"]', "text"),
+}
+
+LISTING_HTML = """
+<html><body>
+  <article data-automation="normalJob">
+    <a data-automation="jobTitle" href="/id/job/1"> Data Engineer </a>
+    <a data-automation="jobCompany">PT Satu</a>
+  </article>
+  <article data-automation="normalJob">
+    <a data-automation="jobTitle" href="/id/job/2">No company</a>
+  </article>
+</body></html>
+"""
+
+
+class TestLooksBlocked:
+    """Tests for looks_blocked."""
+
+    def test_blocked_status(self):
+        assert looks_blocked(429, "")
+        assert looks_blocked(403, "<html></html>")
+
+    def test_challenge_page(self):
+        assert looks_blocked(200, "<div id='cf-challenge'>Checking...</div>")
+
+    def test_normal_page(self):
+        assert not looks_blocked(200, LISTING_HTML)
+
+
+class TestParseCardsHtml:
+    """Tests for parse_cards_html."""
+
+    def test_parse_same_shape_as_extract_cards(self):
+        pytest.importorskip("selectolax")
+
+        cards = parse_cards_html(
+            LISTING_HTML, 'article[data-automation="normalJob"]', FIELDS
+        )
+
+        assert cards == [
+            {
+                "job_title": "Data Engineer",
+                "href": "/id/job/1",
+                "company_name": "PT Satu",
+            }
+        ]
+
+
+class TestFetchCardsHttp:
+    """Tests for fetch_cards_http escalation rules."""
+
+    @staticmethod
+    def _client(status_code, text):
+        client = MagicMock()
+        client.get = AsyncMock(
+            return_value=MagicMock(status_code=status_code, text=text)
+        )
+        return client
+
+    @pytest.mark.asyncio
+    async def test_blocked_response_escalates(self):
+        client = self._client(403, "Access Denied")
+
+        cards = await fetch_cards_http("https://x", "article", FIELDS, client=client)
+
+        assert cards == []
+
+    @pytest.mark.asyncio
+    async def test_empty_listing_escalates(self):
+        pytest.importorskip("selectolax")
+        client = self._client(200, "<html><body>loading...</body></html>")
+
+        cards = await fetch_cards_http("https://x", "article", FIELDS, client=client)
+
+        assert cards == []
+
+    @pytest.mark.asyncio
+    async def test_success_returns_cards(self):
+        pytest.importorskip("selectolax")
+        client = self._client(200, LISTING_HTML)
+
+        cards = await fetch_cards_http(
+            "https://x", 'article[data-automation="normalJob"]', FIELDS, client=client
+        )
+
+        assert len(cards) == 1
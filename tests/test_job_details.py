@@ -0,0 +1,127 @@
+"""Tests for the job-detail enrichment stage."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.utils.detail_cache import DetailCache
+from src.scraper.job_details import (
+    DETAIL_FIELDS,
+    DetailEnricher,
+    extract_jsonld_blocks,
+    parse_job_posting,
+)
+
+POSTING = {
+    "@context": "https://schema.org",
+    "@type": "JobPosting",
+    "title": "Data Engineer Intern",
+    "description": "<p>Build <b>ETL</b> pipelines &amp; dashboards</p>",
+    "employmentType": ["INTERN", "FULL_TIME"],
+    "datePosted": "2026-03-01",
+    "baseSalary": {
+        "@type": "MonetaryAmount",
+        "currency": "IDR",
+        "value": {"minValue": 4000000, "maxValue": 6000000, "unitText": "MONTH"},
+    },
+}
+
+
+def _html(posting):
+    return (
+        "<html><head>"
+        '<script type="application/ld+json">{"@type": "Organization"}</script>'
+        f'<script type="application/ld+json">{json.dumps(posting)}</script>'
+        "</head><body></body></html>"
+    )
+
+
+class TestParseJobPosting:
+    """Tests for JSON-LD JobPosting parsing."""
+
+    def test_fields_extracted(self):
+        detail = parse_job_posting(extract_jsonld_blocks(_html(POSTING)))
+
+        assert detail == {
+            "job_description": "Build ETL pipelines & dashboards",
+            "salary": "IDR 4000000-6000000/MONTH",
+            "job_type": "INTERN, FULL_TIME",
+            "posted_at": "2026-03-01",
+        }
+
+    def test_graph_wrapper_and_missing_salary(self):
+        posting = {k: v for k, v in POSTING.items() if k != "baseSalary"}
+        blocks = [json.dumps({"@graph": [{"@type": "WebPage"}, posting]})]
+
+        detail = parse_job_posting(blocks)
+
+        assert detail["salary"] is None
+        assert detail["posted_at"] == "2026-03-01"
+
+    def test_invalid_json_gives_empty_detail(self):
+        assert parse_job_posting(["{not json"]) == dict.fromkeys(DETAIL_FIELDS)
+
+
+class TestDetailEnricher:
+    """Tests for DetailEnricher over the HTTP path."""
+
+    @staticmethod
+    def _client(html, status=200):
+        response = MagicMock(status_code=status, text=html)
+        client = MagicMock()
+        client.get = AsyncMock(return_value=response)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_enrich_via_http(self):
+        client = self._client(_html(POSTING))
+        enricher = DetailEnricher(http_client=client, rate_per_s=100)
+        records = [
+            {"job_id": str(i), "job_url": f"https://glints.com/job/{i}"}
+            for i in range(5)
+        ]
+
+        result = await enricher.enrich(records)
+
+        assert client.get.await_count == 5
+        assert all(r["job_type"] == "INTERN, FULL_TIME" for r in result)
+        assert enricher.counts["http"] == 5
+
+    @pytest.mark.asyncio
+    async def test_blocked_without_browser_leaves_fields_empty(self):
+        enricher = DetailEnricher(http_client=self._client("captcha", status=403))
+
+        result = await enricher.enrich([{"job_id": "1", "job_url": "https://x/1"}])
+
+        assert all(result[0][field] is None for field in DETAIL_FIELDS)
+        assert enricher.counts["gagal"] == 1
+
+    @pytest.mark.asyncio
+    async def test_time_budget_skips_remaining_jobs(self):
+        client = self._client(_html(POSTING))
+        enricher = DetailEnricher(http_client=client, time_budget_s=0)
+
+        result = await enricher.enrich([{"job_id": "1", "job_url": "https://x/1"}])
+
+        client.get.assert_not_awaited()
+        assert result[0]["salary"] is None
+        assert enricher.counts["skip"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_fetch_and_new_details_cached(self, tmp_path):
+        cache = DetailCache(local_dir=str(tmp_path))
+        cache.put("old", {"salary": "IDR 1", "job_type": None})
+        client = self._client(_html(POSTING))
+        enricher = DetailEnricher(http_client=client, cache=cache)
+        records = [
+            {"job_id": "old", "job_url": "https://x/old"},
+            {"job_id": "new", "job_url": "https://x/new"},
+        ]
+
+        result = await enricher.enrich(records)
+
+        assert client.get.await_count == 1
+        assert result[0]["salary"] == "IDR 1"
+        assert enricher.counts["cache"] == 1
+        assert cache.get("new")["posted_at"] == "2026-03-01"
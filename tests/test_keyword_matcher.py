@@ -0,0 +1,63 @@
+"""Tests for the compiled ALLOWED/BLOCKED title matcher."""
+
+import pandas as pd
+
+from src.utils.keyword_matcher import (
+    KeywordMatcher,
+    filter_cards,
+    filter_titles,
+    keyword_pattern,
+)
+
+
+class TestKeywordMatcher:
+    """Tests for KeywordMatcher and the shared filter helpers."""
+
+    def test_word_start_boundary_avoids_false_positives(self):
+        matcher = KeywordMatcher(["data"], ["hr", "ui"])
+
+        assert matcher.is_relevant("Data Engineer")
+        assert matcher.is_relevant("Three Data Streams")
+        assert matcher.is_relevant("Build Data Platform")
+        assert not matcher.is_relevant("HR Data Officer")
+        assert not matcher.is_relevant("UI Data Designer")
+
+    def test_prefix_match_is_kept(self):
+        matcher = KeywordMatcher(["engineer"], [])
+
+        assert matcher.is_relevant("Software Engineering Intern")
+        assert not matcher.is_relevant("Reengineer")
+
+    def test_trailing_space_means_whole_word(self):
+        matcher = KeywordMatcher(["bi "], [" ga "])
+
+        assert matcher.is_relevant("BI Analyst")
+        assert matcher.is_relevant("Senior BI")
+        assert not matcher.is_relevant("Bioinformatics")
+        assert not KeywordMatcher(["bi "], [" ga "]).is_relevant("BI GA Staff")
+
+    def test_pattern_escapes_keywords(self):
+        assert keyword_pattern(["c++", " ml"]) == r"\b(?:c\+\+|ml)"
+        assert keyword_pattern([]) == "(?!)"
+
+    def test_filter_titles_keeps_order(self):
+        titles = ["Data Entry", "Data Engineer", "Sales", "Machine Learning Intern"]
+
+        assert filter_titles(titles) == ["Data Engineer", "Machine Learning Intern"]
+
+    def test_filter_cards(self):
+        cards = [
+            {"job_title": "ETL Developer", "href": "/1"},
+            {"job_title": "Marketing Data", "href": "/2"},
+        ]
+
+        assert [card["href"] for card in filter_cards(cards)] == ["/1"]
+
+    def test_mask_series_matches_mask(self):
+        matcher = KeywordMatcher(["data"], ["hr"])
+        titles = pd.Series(["Data Engineer", "HR Data Officer", None, "Three Data"])
+
+        assert matcher.mask_series(titles).tolist() == [True, False, False, True]
+        assert matcher.mask_series(titles.fillna("")).tolist() == matcher.mask(
+            titles.fillna("")
+        )
@@ -0,0 +1,96 @@
+"""Tests for the alias-table location normalizer."""
+
+import pandas as pd
+
+from src.utils.location_normalizer import (
+    LOCATION_ALIASES,
+    LocationNormalizer,
+    get_location_normalizer,
+)
+
+
+class TestLocationNormalizer:
+    """Tests for LocationNormalizer."""
+
+    def test_compound_site_locations(self):
+        normalizer = get_location_normalizer()
+
+        assert (
+            normalizer.normalize("Kota Jakarta Timur, DKI Jakarta") == "Jakarta Timur"
+        )
+        assert normalizer.normalize("Cikarang, Bekasi") == "Bekasi"
+        assert normalizer.normalize("Yogyakarta, DI Yogyakarta") == "Yogyakarta"
+        assert normalizer.normalize("bogor jakarta utara") == "Jakarta Utara"
+
+    def test_priority_beats_position(self):
+        # "tangerang" muncul lebih dulu, tapi Jakarta lebih tinggi di tabel
+        assert get_location_normalizer().normalize("Tangerang, Jakarta") == "Jakarta"
+
+    def test_overlapping_aliases(self):
+        normalizer = LocationNormalizer([("A", ("ab",)), ("B", ("abc",))])
+
+        assert normalizer.normalize("xabc") == "A"
+
+    def test_unknown_is_title_cased(self):
+        assert get_location_normalizer().normalize("MEDAN, sumut") == "Medan, Sumut"
+
+    def test_empty_alias_table(self):
+        assert LocationNormalizer([]).normalize("jakarta") == "Jakarta"
+
+    def test_aliases_are_lowercase(self):
+        for _, patterns in LOCATION_ALIASES:
+            assert all(pattern == pattern.lower() for pattern in patterns)
+
+
+class TestNormalizeSeries:
+    """Tests for LocationNormalizer.normalize_series."""
+
+    def test_maps_back_to_every_row(self):
+        series = pd.Series(
+            ["south jakarta", "Bandung", "south jakarta", "jogja"],
+            index=[10, 11, 12, 13],
+            name="location",
+        )
+
+        result = get_location_normalizer().normalize_series(series)
+
+        assert result.tolist() == [
+            "Jakarta Selatan",
+            "Bandung",
+            "Jakarta Selatan",
+            "Yogyakarta",
+        ]
+        assert result.index.tolist() == [10, 11, 12, 13]
+        assert result.name == "location"
+
+    def test_normalizes_each_unique_value_once(self, monkeypatch):
+        normalizer = LocationNormalizer(LOCATION_ALIASES)
+        calls = []
+        original = normalizer.normalize
+        monkeypatch.setattr(
+            normalizer, "normalize", lambda loc: calls.append(loc) or original(loc)
+        )
+
+        normalizer.normalize_series(pd.Series(["bekasi", "depok"] * 500))
+
+        assert sorted(calls) == ["bekasi", "depok"]
+
+    def test_nulls_stay_null(self):
+        series = pd.Series(["depok", None, "depok"])
+
+        result = get_location_normalizer().normalize_series(series)
+
+        assert result[0] == "Depok" and result[2] == "Depok"
+        assert pd.isna(result[1])
+
+    def test_categorical_input(self):
+        series = pd.Series(["cikarang", "bekasi", "cikarang"], dtype="category")
+
+        result = get_location_normalizer().normalize_series(series)
+
+        assert result.tolist() == ["Bekasi", "Bekasi", "Bekasi"]
+
+    def test_empty_series(self):
+        result = get_location_normalizer().normalize_series(pd.Series([], dtype=str))
+
+        assert result.empty
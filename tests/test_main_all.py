@@ -0,0 +1,75 @@
+"""Tests for the single-process all-platforms runner."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.entrypoint import handlers
+from src.main.main_all import run_all_platforms_pipeline
+from src.main.platform_pipeline import run_platform_pipeline
+
+
+class TestRunAllPlatformsPipeline:
+    """Tests for run_all_platforms_pipeline and all_platforms_handler."""
+
+    @pytest.mark.asyncio
+    async def test_platforms_share_session_and_fail_independently(self):
+        session = MagicMock()
+        outcomes = {"glints": 12, "jobstreet": RuntimeError("blocked"), "kalibrr": 7}
+
+        async def fake_pipeline(platform, keywords, session=None):
+            if isinstance(outcomes[platform], Exception):
+                raise outcomes[platform]
+            return outcomes[platform]
+
+        pipeline = AsyncMock(side_effect=fake_pipeline)
+        with patch("src.main.platform_pipeline.run_platform_pipeline", pipeline):
+            results = await run_all_platforms_pipeline(
+                {"glints": ["a+b"], "jobstreet": ["a-b"], "kalibrr": ["c-d"]},
+                session=session,
+            )
+
+        assert results == {"glints": 12, "jobstreet": 0, "kalibrr": 7}
+        pipeline.assert_any_await("glints", ["a+b"], session=session)
+        pipeline.assert_any_await("kalibrr", ["c-d"], session=session)
+
+    def test_handler_reports_failed_platforms(self, monkeypatch):
+        monkeypatch.delenv("SCRAPER_WARM_REUSE", raising=False)
+        monkeypatch.delenv("SCRAPER_PREWARM", raising=False)
+        monkeypatch.setenv("SCRAPE_KEYWORDS_KALIBRR", "x,y")
+        pipeline = AsyncMock(return_value={"glints": 3, "jobstreet": 0, "kalibrr": 1})
+
+        with patch("src.main.main_all.run_all_platforms_pipeline", pipeline):
+            with pytest.raises(RuntimeError, match="jobstreet"):
+                handlers.all_platforms_handler({}, None)
+
+        keywords_by_platform = pipeline.await_args.args[0]
+        assert keywords_by_platform["kalibrr"] == ["x", "y"]
+        assert keywords_by_platform["glints"] == handlers.DEFAULT_KEYWORDS_GLINTS
+
+
+class TestRunPlatformPipeline:
+    """Tests for the shared per-platform runner."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "platform, uses_seen_index", [("glints", True), ("jobstreet", False)]
+    )
+    async def test_seen_index_only_for_newest_first_listing(
+        self, monkeypatch, platform, uses_seen_index
+    ):
+        monkeypatch.setenv("SCRAPE_SEEN_INDEX", "1")
+        index = MagicMock()
+        to_bronze = AsyncMock(return_value=(3, ["a", "b", "c"]))
+
+        with (
+            patch("src.utils.seen_index.SeenJobIndex.load", return_value=index),
+            patch("src.main.bronze_stream.stream_to_bronze", to_bronze),
+        ):
+            rows = await run_platform_pipeline(platform, ["x"], session=MagicMock())
+
+        assert rows == 3
+        assert to_bronze.await_args.args[0] == platform
+        # Run dengan seen index menambah file ke partisi hari ini
+        assert to_bronze.await_args.kwargs["replace_partition"] is not uses_seen_index
+        assert index.save.called is uses_seen_index
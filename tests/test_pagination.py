@@ -0,0 +1,210 @@
+"""Tests for the shared pagination engine."""
+
+import pytest
+
+from src.utils.keyword_matcher import KeywordMatcher
+from src.utils.pagination import Paginator, PaginationConfig, with_page_param
+
+FIELDS = {"href": ("a", "href")}
+
+
+class FakeLocator:
+    def __init__(self, page, selector):
+        self.page = page
+        self.selector = selector
+
+    async def count(self):
+        return len(self.page.cards)
+
+    async def evaluate_all(self, js, arg):
+        pending = self.page.cards[arg["offset"] :]
+        rows = [{"href": href, "job_title": "Data Engineer"} for href in pending]
+        if arg["titleFilter"]:
+            # Simulasi predikat di halaman: href genap = judul tidak relevan
+            rows = [row for row in rows if int(row["href"].rsplit("/", 1)[1]) % 2]
+        return {
+            "seen": len(pending),
+            "filtered": len(pending) - len(rows),
+            "rows": rows,
+        }
+
+    async def is_visible(self):
+        return self.page.remaining > 0
+
+    async def scroll_into_view_if_needed(self):
+        return None
+
+    async def click(self):
+        self.page.load_batch()
+
+
+class FakePage:
+    """Listing dengan tombol load-more: tiap klik menambah ``batch`` card."""
+
+    def __init__(self, total, batch=3):
+        self.total = total
+        self.batch = batch
+        self.cards = []
+        self.clicks = 0
+        self.load_batch()
+        self.clicks = 0
+
+    @property
+    def remaining(self):
+        return self.total - len(self.cards)
+
+    def load_batch(self):
+        self.clicks += 1
+        start = len(self.cards)
+        end = min(self.total, start + self.batch)
+        self.cards.extend(f"/job/{i}" for i in range(start, end))
+
+    def locator(self, selector):
+        return FakeLocator(self, selector)
+
+    async def wait_for_load_state(self, *args, **kwargs):
+        return None
+
+
+def _config(**overrides):
+    base = {
+        "style": "load_more",
+        "load_more_selector": "button",
+        "step_wait_ms": 50,
+    }
+    base.update(overrides)
+    return PaginationConfig(**base)
+
+
+async def _collect(paginator: Paginator) -> list[dict]:
+    return [card async for step in paginator.iter_steps() for card in step]
+
+
+class TestWithPageParam:
+    """Tests for with_page_param."""
+
+    def test_adds_and_replaces_param(self):
+        url = "https://id.jobstreet.com/id/data-jobs?daterange=7"
+        assert with_page_param(url, "page", 2).endswith("daterange=7&page=2")
+        assert with_page_param(f"{url}&page=2", "page", 3).endswith("page=3")
+
+
+class TestPaginator:
+    """Tests for Paginator stop conditions."""
+
+    @pytest.mark.asyncio
+    async def test_load_more_until_exhausted(self):
+        page = FakePage(total=10)
+
+        paginator = Paginator(page, "https://x", "article", FIELDS, _config())
+        cards = await _collect(paginator)
+
+        assert [card["href"] for card in cards] == [f"/job/{i}" for i in range(10)]
+        assert paginator.stop_reason == "tombol load-more tidak ada"
+
+    @pytest.mark.asyncio
+    async def test_stops_at_card_budget(self):
+        page = FakePage(total=100)
+
+        paginator = Paginator(
+            page, "https://x", "article", FIELDS, _config(max_cards=7)
+        )
+        cards = await _collect(paginator)
+
+        assert len(cards) == 7
+        assert page.clicks == 2  # 3 + 3 + 3 card dimuat, tidak lanjut klik
+        assert "budget" in paginator.stop_reason
+
+    @pytest.mark.asyncio
+    async def test_stops_at_time_budget(self):
+        page = FakePage(total=100)
+
+        paginator = Paginator(
+            page, "https://x", "article", FIELDS, _config(time_budget_s=0)
+        )
+        cards = await _collect(paginator)
+
+        assert len(cards) == 3
+        assert page.clicks == 0
+        assert "waktu" in paginator.stop_reason
+
+    @pytest.mark.asyncio
+    async def test_scroll_stops_when_no_new_cards(self):
+        page = FakePage(total=3)
+
+        async def no_scroll(*args, **kwargs):
+            return None
+
+        page.mouse = type("Mouse", (), {"wheel": staticmethod(no_scroll)})()
+
+        paginator = Paginator(
+            page, "https://x", "article", FIELDS, _config(style="scroll")
+        )
+        cards = await _collect(paginator)
+
+        assert len(cards) == 3
+        assert paginator.stop_reason == "tidak ada card baru"
+
+    @pytest.mark.asyncio
+    async def test_stop_when_all_new_cards_seen(self):
+        page = FakePage(total=100)
+        seen = {f"/job/{i}" for i in range(3, 100)}
+
+        paginator = Paginator(
+            page,
+            "https://x",
+            "article",
+            FIELDS,
+            _config(),
+            stop_when=lambda new: bool(new) and all(c["href"] in seen for c in new),
+        )
+        cards = await _collect(paginator)
+
+        assert len(cards) == 6
+        assert page.clicks == 1
+        assert paginator.stop_reason == "semua card sudah pernah terlihat"
+
+    @pytest.mark.asyncio
+    async def test_title_filter_counts_and_keeps_paginating(self):
+        page = FakePage(total=8, batch=2)
+        matcher = KeywordMatcher(["data"], [])
+
+        paginator = Paginator(
+            page, "https://x", "article", FIELDS, _config(), title_filter=matcher
+        )
+        cards = await _collect(paginator)
+
+        assert [card["href"] for card in cards] == [
+            "/job/1",
+            "/job/3",
+            "/job/5",
+            "/job/7",
+        ]
+        assert (paginator.stats.seen, paginator.stats.filtered) == (8, 4)
+        assert paginator.stats.extracted == 4
+
+    @pytest.mark.asyncio
+    async def test_title_filter_on_payload_cards(self):
+        page = FakePage(total=0)
+        collector = type("Collector", (), {})()
+        collector.payloads = [
+            [
+                {"href": "/job/a", "job_title": "Data Engineer"},
+                {"href": "/job/b", "job_title": "HR Admin"},
+            ]
+        ]
+
+        paginator = Paginator(
+            page,
+            "https://x",
+            "article",
+            FIELDS,
+            _config(max_steps=0),
+            collector=collector,
+            parse_payload=lambda payload: payload,
+            title_filter=KeywordMatcher(["data"], ["hr"]),
+        )
+        cards = await _collect(paginator)
+
+        assert [card["href"] for card in cards] == ["/job/a"]
+        assert (paginator.stats.seen, paginator.stats.filtered) == (2, 1)
@@ -0,0 +1,43 @@
+"""Tests for the async token bucket rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.utils.rate_limit import DomainRateLimiter, TokenBucket
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket and DomainRateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_rate_limited(self):
+        bucket = TokenBucket(rate=50, capacity=2)
+
+        start = time.monotonic()
+        for _ in range(2):
+            await bucket.acquire()
+        burst_elapsed = time.monotonic() - start
+        for _ in range(3):
+            await bucket.acquire()
+        total_elapsed = time.monotonic() - start
+
+        assert burst_elapsed < 0.02
+        assert total_elapsed >= 0.05  # 3 token tambahan @ 50/s ~ 60ms
+
+    @pytest.mark.asyncio
+    async def test_domains_have_independent_buckets(self):
+        limiter = DomainRateLimiter(rate=5, capacity=1)
+
+        start = time.monotonic()
+        await asyncio.gather(
+            limiter.acquire("https://glints.com/a"),
+            limiter.acquire("https://www.kalibrr.com/b"),
+            limiter.acquire("https://id.jobstreet.com/c"),
+        )
+
+        assert time.monotonic() - start < 0.1
+        assert limiter.bucket("https://GLINTS.com/x") is limiter.bucket(
+            "https://glints.com/y"
+        )
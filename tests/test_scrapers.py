@@ -0,0 +1,339 @@
+"""Tests for platform scraper parsing helpers (tanpa browser)."""
+
+import hashlib
+from dataclasses import replace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.scraper.engine import PlatformScraper, get_spec, spec_modules
+from src.scraper.jobscraper_glints import parse_listing_payload as parse_glints
+from src.scraper.jobscraper_jobstreet import parse_listing_payload as parse_jobstreet
+
+
+class TestGlintsListingPayload:
+    """Tests for Glints GraphQL searchJobs payload parsing."""
+
+    def test_parse_jobs_in_page(self):
+        payload = {
+            "data": {
+                "searchJobsV3": {
+                    "jobsInPage": [
+                        {
+                            "id": "abc-123",
+                            "title": " Data Engineer Intern ",
+                            "company": {"name": "PT Data"},
+                            "location": {"formattedName": "Jakarta Selatan"},
+                        },
+                        {"title": "Missing id"},
+                    ]
+                }
+            }
+        }
+
+        cards = parse_glints(payload)
+
+        assert cards == [
+            {
+                "job_title": "Data Engineer Intern",
+                "href": "/id/opportunities/jobs/data-engineer-intern/abc-123",
+                "company_name": "PT Data",
+                "location": "Jakarta Selatan",
+            }
+        ]
+
+    def test_prefers_payload_url_over_guessed_slug(self):
+        payload = {
+            "data": {
+                "searchJobs": {
+                    "jobsInPage": [
+                        {
+                            "id": "abc-123",
+                            "title": "Data Engineer (Intern)",
+                            "url": "https://glints.com/id/opportunities/jobs/de-intern/abc-123?utm=x",
+                        }
+                    ]
+                }
+            }
+        }
+
+        [card] = parse_glints(payload)
+
+        assert get_spec("glints").job_url(card["href"]) == (
+            "https://glints.com/id/opportunities/jobs/de-intern/abc-123"
+        )
+
+    def test_falls_back_to_city_name(self):
+        payload = {
+            "data": {
+                "searchJobs": {
+                    "jobsInPage": [
+                        {
+                            "id": "1",
+                            "title": "BI Analyst",
+                            "company": {"name": "X"},
+                            "city": {"name": "Bandung"},
+                        }
+                    ]
+                }
+            }
+        }
+
+        assert parse_glints(payload)[0]["location"] == "Bandung"
+
+    def test_unexpected_payload_returns_empty(self):
+        assert parse_glints({}) == []
+        assert parse_glints({"data": None}) == []
+        assert parse_glints({"errors": [{"message": "rate limited"}]}) == []
+
+
+class TestJobstreetListingPayload:
+    """Tests for JobStreet job search payload parsing."""
+
+    def test_parse_search_results(self):
+        payload = {
+            "data": [
+                {
+                    "id": "81234567",
+                    "title": "Data Engineer",
+                    "advertiser": {"description": "PT Contoh"},
+                    "locations": [{"label": "Jakarta Raya"}],
+                },
+                {"id": "2"},  # tanpa title, dilewati
+            ]
+        }
+
+        cards = parse_jobstreet(payload)
+
+        assert cards == [
+            {
+                "job_title": "Data Engineer",
+                "href": "/id/job/81234567",
+                "company_name": "PT Contoh",
+                "location": "Jakarta Raya",
+            }
+        ]
+
+    def test_company_name_preferred_over_advertiser(self):
+        payload = {
+            "data": [
+                {
+                    "id": "1",
+                    "title": "ETL Developer",
+                    "companyName": "Brand Name",
+                    "advertiser": {"description": "Recruiter Ltd"},
+                    "location": "Surabaya",
+                }
+            ]
+        }
+
+        card = parse_jobstreet(payload)[0]
+
+        assert card["company_name"] == "Brand Name"
+        assert card["location"] == "Surabaya"
+
+
+class TestPlatformSpec:
+    """Tests for PlatformSpec and the spec registry."""
+
+    def test_registry_loads_all_platforms(self):
+        for platform in ("glints", "jobstreet", "kalibrr"):
+            assert get_spec(platform).name == platform
+
+    def test_registry_discovers_spec_files(self):
+        # Spec baru cukup file ``jobscraper_<platform>.py``, tanpa edit engine
+        assert spec_modules() == {
+            platform: f"src.scraper.jobscraper_{platform}"
+            for platform in ("glints", "jobstreet", "kalibrr")
+        }
+
+    def test_unknown_platform_raises(self):
+        with pytest.raises(ValueError):
+            get_spec("dealls")
+
+    def test_url_for_keyword(self):
+        url = get_spec("jobstreet").url_for("data-engineer")
+
+        assert url == "https://id.jobstreet.com/id/data-engineer-jobs?daterange=7"
+        assert "keyword=bi+engineer&" in get_spec("glints").url_for("bi+engineer")
+
+    def test_job_id_is_md5_of_full_url(self):
+        spec = get_spec("kalibrr")
+        expected = hashlib.md5(b"https://www.kalibrr.com/c/x/jobs/1").hexdigest()
+
+        assert spec.job_id("/c/x/jobs/1") == expected
+
+    def test_dom_and_payload_hrefs_share_job_id(self):
+        spec = get_spec("jobstreet")
+        dom_href = "/id/job/123?type=standout&ref=search-standalone#sol=abc"
+
+        assert spec.job_url(dom_href) == "https://id.jobstreet.com/id/job/123"
+        assert spec.job_id(dom_href) == spec.job_id("/id/job/123")
+        assert spec.job_id("https://id.jobstreet.com/id/job/123/") == spec.job_id(
+            "/id/job/123"
+        )
+
+    def test_build_results(self):
+        scraper = PlatformScraper(get_spec("glints"))
+        card = {
+            "job_title": "Data Engineer Intern",
+            "href": "/id/opportunities/jobs/a/1",
+            "company_name": "PT Data",
+            "location": "Jakarta",
+        }
+
+        [record] = scraper.build_results([card], "20240101_070000")
+
+        assert record["job_url"] == "https://glints.com/id/opportunities/jobs/a/1"
+        assert record["platform"] == "glints"
+        assert record["scraped_at"] == "20240101_070000"
+
+
+class TestPlatformScraperHttpFastPath:
+    """Tests for PlatformScraper.scrape via the HTTP fast path."""
+
+    @pytest.mark.asyncio
+    async def test_fast_path_skips_browser(self, monkeypatch):
+        monkeypatch.setenv("SCRAPE_HTTP_FAST_PATH", "1")
+        cards = [
+            {
+                "job_title": "Data Engineer",
+                "href": "/id/job/1",
+                "company_name": "PT A",
+                "location": "Jakarta",
+            },
+            {
+                "job_title": "Sales Manager",
+                "href": "/id/job/2",
+                "company_name": "PT B",
+                "location": "Bandung",
+            },
+        ]
+        scraper = PlatformScraper(get_spec("jobstreet"))
+
+        with (
+            patch(
+                "src.utils.http_fetch.fetch_cards_http",
+                AsyncMock(return_value=cards),
+            ),
+            patch.object(scraper, "_stream_browser", MagicMock()) as browser,
+        ):
+            results = await scraper.scrape("https://id.jobstreet.com/id/x-jobs")
+
+        browser.assert_not_called()
+        assert [r["job_url"] for r in results] == ["https://id.jobstreet.com/id/job/1"]
+
+    @pytest.mark.asyncio
+    async def test_fast_path_paginates_page_param(self, monkeypatch):
+        monkeypatch.setenv("SCRAPE_HTTP_FAST_PATH", "1")
+        pages = {
+            "https://id.jobstreet.com/id/x-jobs": [
+                {"job_title": "Data Engineer", "href": "/id/job/1"},
+            ],
+            "https://id.jobstreet.com/id/x-jobs?page=2": [
+                {"job_title": "Data Analyst", "href": "/id/job/2"},
+            ],
+            "https://id.jobstreet.com/id/x-jobs?page=3": [
+                {"job_title": "Data Analyst", "href": "/id/job/2?ref=x"},
+            ],
+        }
+        for cards in pages.values():
+            for card in cards:
+                card.update(company_name="PT A", location="Jakarta")
+        fetch = AsyncMock(side_effect=lambda url, *args, **kwargs: pages[url])
+        scraper = PlatformScraper(get_spec("jobstreet"))
+
+        with (
+            patch("src.utils.http_fetch.fetch_cards_http", fetch),
+            patch.object(scraper, "_stream_browser", MagicMock()) as browser,
+        ):
+            batches = [
+                batch
+                async for batch in scraper.stream("https://id.jobstreet.com/id/x-jobs")
+            ]
+
+        browser.assert_not_called()
+        # Halaman 3 tidak berisi card baru: pagination berhenti
+        assert fetch.await_count == 3
+        assert [[r["job_url"] for r in batch] for batch in batches] == [
+            ["https://id.jobstreet.com/id/job/1"],
+            ["https://id.jobstreet.com/id/job/2"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_fast_path_stops_when_all_seen(self, monkeypatch):
+        monkeypatch.setenv("SCRAPE_HTTP_FAST_PATH", "1")
+        card = {
+            "job_title": "Data Engineer",
+            "href": "/id/job/1",
+            "company_name": "PT A",
+            "location": "Jakarta",
+        }
+        fetch = AsyncMock(side_effect=lambda url, *args, **kwargs: [dict(card)])
+        seen_index = MagicMock()
+        seen_index.all_seen.return_value = True
+        scraper = PlatformScraper(get_spec("jobstreet"))
+
+        with patch("src.utils.http_fetch.fetch_cards_http", fetch):
+            await scraper.scrape(
+                "https://id.jobstreet.com/id/x-jobs", seen_index=seen_index
+            )
+
+        assert fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_load_more_spec_uses_browser_paginator(self, monkeypatch):
+        # Kalibrr (load-more) tidak boleh berhenti di halaman pertama HTTP
+        monkeypatch.setenv("SCRAPE_HTTP_FAST_PATH", "1")
+        scraper = PlatformScraper(get_spec("kalibrr"))
+        card = {
+            "job_title": "Data Engineer",
+            "href": "/j/1",
+            "company_name": "PT A",
+            "location": "Jakarta",
+        }
+
+        async def fake_stream(*args):
+            yield [card]
+
+        fetch = AsyncMock()
+        with (
+            patch("src.utils.http_fetch.fetch_cards_http", fetch),
+            patch.object(scraper, "_stream_browser", fake_stream),
+        ):
+            results = await scraper.scrape("https://kalibrr.id/x")
+
+        fetch.assert_not_called()
+        assert len(results) == 1
+
+    def test_fast_path_requires_page_param(self):
+        spec = get_spec("kalibrr")
+
+        with pytest.raises(ValueError, match="page_param"):
+            replace(spec, http_fast_path=True)
+        for style in ("load_more", "scroll"):
+            with pytest.raises(ValueError):
+                replace(spec, http_fast_path=True, pagination={"style": style})
+
+    @pytest.mark.asyncio
+    async def test_browser_path_streams_batch_per_step(self, monkeypatch):
+        monkeypatch.setenv("SCRAPE_HTTP_FAST_PATH", "1")
+        scraper = PlatformScraper(get_spec("glints"))
+        steps = [
+            [{"job_title": "A", "href": "/a", "company_name": "", "location": ""}],
+            [{"job_title": "B", "href": "/b", "company_name": "", "location": ""}],
+        ]
+
+        async def fake_stream(*args):
+            for cards in steps:
+                yield cards
+
+        with patch.object(scraper, "_stream_browser", fake_stream):
+            batches = [
+                batch async for batch in scraper.stream("https://glints.com/id/x")
+            ]
+
+        assert [[r["job_url"] for r in batch] for batch in batches] == [
+            ["https://glints.com/a"],
+            ["https://glints.com/b"],
+        ]
@@ -0,0 +1,53 @@
+"""Tests for the persisted seen-job index."""
+
+import hashlib
+
+from src.utils import seen_index as seen_index_module
+from src.utils.seen_index import SeenJobIndex
+
+
+def _job_id(url):
+    return hashlib.md5(url.encode()).hexdigest()
+
+
+class TestSeenJobIndex:
+    """Tests for SeenJobIndex membership and persistence."""
+
+    def test_membership_after_add(self):
+        index = SeenJobIndex("glints")
+        index.add_many(
+            [_job_id("https://glints.com/a"), _job_id("https://glints.com/b")]
+        )
+
+        assert _job_id("https://glints.com/a") in index
+        assert _job_id("https://glints.com/c") not in index
+        assert len(index) == 2
+
+    def test_all_seen(self):
+        index = SeenJobIndex("glints")
+        index.add_many([_job_id("a"), _job_id("b")])
+
+        assert index.all_seen([_job_id("a"), _job_id("b")])
+        assert not index.all_seen([_job_id("a"), _job_id("new")])
+        assert not index.all_seen([])
+
+    def test_bytes_round_trip(self):
+        index = SeenJobIndex("glints")
+        index.add_many(_job_id(str(i)) for i in range(50))
+
+        restored = SeenJobIndex.from_bytes("glints", index.to_bytes())
+
+        assert len(restored) == 50
+        assert all(_job_id(str(i)) in restored for i in range(50))
+
+    def test_save_and_load_local(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("AWS_S3_BUCKET_NAME", raising=False)
+        monkeypatch.setattr(seen_index_module, "LOCAL_DIR", str(tmp_path))
+
+        index = SeenJobIndex("kalibrr")
+        index.add_many([_job_id("x")])
+        index.save()
+
+        loaded = SeenJobIndex.load("kalibrr")
+        assert _job_id("x") in loaded
+        assert len(SeenJobIndex.load("glints")) == 0
@@ -81,7 +81,19 @@ class TestJobSilverSchema:
             "scraped_at",
             "keyword",
         }
-        assert set(JOB_SILVER_SCHEMA.columns.keys()) == expected_columns
+        required_columns = {
+            name
+            for name, column in JOB_SILVER_SCHEMA.columns.items()
+            if column.required
+        }
+        assert required_columns == expected_columns
+
+    def test_schema_detail_columns_are_optional(self):
+        """Test that enrichment detail columns are optional and nullable."""
+        for name in ("job_description", "salary", "job_type", "posted_at"):
+            column = JOB_SILVER_SCHEMA.columns[name]
+            assert column.required is False
+            assert column.nullable is True
 
     def test_schema_job_id_is_unique(self):
         """Test that job_id column is marked as unique."""
@@ -59,6 +59,24 @@ class TestTransformSilver:
         mock_validate.assert_called_once()
         mock_upload.assert_called_once()
 
+    @patch("src.silver_layer.orchestrator.upload_to_silver")
+    @patch("src.silver_layer.orchestrator.validate_silver_schema")
+    @patch("src.silver_layer.orchestrator.apply_location_normalization")
+    def test_transform_silver_keeps_latest_duplicate(
+        self, mock_normalize, mock_validate, mock_upload, sample_bronze_dataframe
+    ):
+        """Test that job_ids repeated across bronze files keep the latest row."""
+        later = sample_bronze_dataframe.iloc[[0]].assign(scraped_at="20260305_190000")
+        df = pd.concat([sample_bronze_dataframe, later], ignore_index=True)
+        mock_normalize.side_effect = lambda frame: frame
+        mock_validate.side_effect = lambda frame: frame
+
+        transform_silver(df)
+
+        result = mock_validate.call_args[0][0]
+        assert result["job_id"].tolist().count("id1") == 1
+        assert "20260305_190000" in result["scraped_at"].tolist()
+
     @patch("src.silver_layer.orchestrator.validate_silver_schema")
     @patch("src.silver_layer.orchestrator.apply_location_normalization")
     def test_transform_silver_validation_error(
@@ -40,14 +40,16 @@ class TestGetBronzeObject:
         mock_s3 = MagicMock()
         mock_s3_client.return_value = mock_s3
 
-        # Mock list_objects_v2 response
-        mock_s3.list_objects_v2.return_value = {
-            "Contents": [
-                {
-                    "Key": "platform=kalibrr/ingestion_date=2026-03-05/kalibrr_090000.parquet"
-                },
-            ]
-        }
+        # Mock paginated list_objects_v2 response
+        mock_s3.get_paginator.return_value.paginate.return_value = [
+            {
+                "Contents": [
+                    {
+                        "Key": "platform=kalibrr/ingestion_date=2026-03-05/kalibrr_090000.parquet"
+                    },
+                ]
+            }
+        ]
 
         # Mock get_object response
         buffer = io.BytesIO()
@@ -73,8 +75,8 @@ class TestGetBronzeObject:
         mock_s3 = MagicMock()
         mock_s3_client.return_value = mock_s3
 
-        # Mock empty response
-        mock_s3.list_objects_v2.return_value = {}
+        # Mock empty response (a single page without Contents)
+        mock_s3.get_paginator.return_value.paginate.return_value = [{}]
 
         result = get_bronze_object(["kalibrr"])
 
@@ -93,16 +95,18 @@ class TestGetBronzeObject:
         mock_s3_client.return_value = mock_s3
 
         # Mock responses for each platform
-        mock_s3.list_objects_v2.return_value = {
-            "Contents": [
-                {
-                    "Key": "platform=kalibrr/ingestion_date=2026-03-05/kalibrr_090000.parquet"
-                },
-                {
-                    "Key": "platform=glints/ingestion_date=2026-03-05/glints_090100.parquet"
-                },
-            ]
-        }
+        mock_s3.get_paginator.return_value.paginate.return_value = [
+            {
+                "Contents": [
+                    {
+                        "Key": "platform=kalibrr/ingestion_date=2026-03-05/kalibrr_090000.parquet"
+                    },
+                    {
+                        "Key": "platform=glints/ingestion_date=2026-03-05/glints_090100.parquet"
+                    },
+                ]
+            }
+        ]
 
         # Mock get_object
         buffer = io.BytesIO()
@@ -127,7 +131,7 @@ class TestGetBronzeObject:
         mock_s3_client.return_value = mock_s3
 
         # Mock S3 error
-        mock_s3.list_objects_v2.side_effect = ClientError(
+        mock_s3.get_paginator.return_value.paginate.side_effect = ClientError(
             {
                 "Error": {
                     "Code": "NoSuchBucket",
@@ -140,6 +144,65 @@ class TestGetBronzeObject:
         with pytest.raises(ClientError):
             get_bronze_object(["kalibrr"])
 
+    @patch("src.silver_layer.storage.boto3.client")
+    @patch("src.silver_layer.storage.get_bronze_bucket_name")
+    def test_get_bronze_object_reads_every_page(
+        self, mock_bucket, mock_s3_client, sample_dataframe
+    ):
+        """Test that keys beyond the first 1000-key page are read too."""
+        mock_bucket.return_value = "test-bronze-bucket"
+
+        mock_s3 = MagicMock()
+        mock_s3_client.return_value = mock_s3
+
+        pages = [
+            {"Contents": [{"Key": f"platform=kalibrr/part_{i}.parquet"}]}
+            for i in range(3)
+        ]
+        mock_s3.get_paginator.return_value.paginate.return_value = pages
+
+        buffer = io.BytesIO()
+        sample_dataframe.to_parquet(buffer)
+        mock_s3.get_object.return_value = {
+            "Body": MagicMock(read=lambda: buffer.getvalue())
+        }
+
+        result = get_bronze_object(["kalibrr"])
+
+        mock_s3.get_paginator.assert_called_with("list_objects_v2")
+        assert mock_s3.get_object.call_count == 3
+        assert len(result) == 3 * len(sample_dataframe)
+        assert list(result.index) == list(range(len(result)))
+
+    @patch("src.silver_layer.storage.boto3.client")
+    @patch("src.silver_layer.storage.get_bronze_bucket_name")
+    def test_get_bronze_object_column_projection(
+        self, mock_bucket, mock_s3_client, sample_dataframe
+    ):
+        """Test projection and null-filling of columns missing from a file."""
+        mock_bucket.return_value = "test-bronze-bucket"
+
+        mock_s3 = MagicMock()
+        mock_s3_client.return_value = mock_s3
+
+        mock_s3.get_paginator.return_value.paginate.return_value = [
+            {"Contents": [{"Key": "old.parquet"}, {"Key": "new.parquet"}]}
+        ]
+        old = io.BytesIO()
+        sample_dataframe.to_parquet(old, index=False)
+        new = io.BytesIO()
+        sample_dataframe.assign(salary="10jt").to_parquet(new, index=False)
+        bodies = {"old.parquet": old.getvalue(), "new.parquet": new.getvalue()}
+        mock_s3.get_object.side_effect = lambda Bucket, Key: {
+            "Body": MagicMock(read=lambda: bodies[Key])
+        }
+
+        result = get_bronze_object(["kalibrr"], columns=["job_id", "salary"])
+
+        assert result.columns.tolist() == ["job_id", "salary"]
+        assert result["job_id"].tolist() == ["id1", "id2", "id1", "id2"]
+        assert result["salary"].isna().tolist() == [True, True, False, False]
+
 
 class TestUploadToSilver:
     """Tests for upload_to_silver function."""
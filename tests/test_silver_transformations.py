@@ -5,6 +5,7 @@ import pandas as pd
 from src.silver_layer.transformations import (
     normalize_location,
     apply_location_normalization,
+    apply_title_filter,
 )
 
 
@@ -122,7 +123,35 @@ class TestApplyLocationNormalization:
         result = apply_location_normalization(df)
 
         assert len(result) == 2
-        assert set(result.columns) == {"location", "job_id", "job_title"}
+        assert set(result.columns) == {
+            "location",
+            "job_id",
+            "job_title",
+            "city",
+            "province",
+            "is_remote",
+        }
+
+    def test_gazetteer_columns(self):
+        """Test that gazetteer columns are added and location keeps legacy values."""
+        df = pd.DataFrame(
+            {"location": ["Kebayoran Baru, Jakarta", "Remote", "tangerang selatan"]}
+        )
+
+        result = apply_location_normalization(df)
+
+        assert result["location"].tolist() == ["Jakarta", "Remote", "Tangerang"]
+        assert result["city"].fillna("-").tolist() == [
+            "Jakarta Selatan",
+            "-",
+            "Tangerang Selatan",
+        ]
+        assert result["province"].fillna("-").tolist() == [
+            "DKI Jakarta",
+            "-",
+            "Banten",
+        ]
+        assert result["is_remote"].tolist() == [False, True, False]
 
     def test_empty_dataframe(self):
         """Test normalization with empty dataframe."""
@@ -131,3 +160,32 @@ class TestApplyLocationNormalization:
 
         assert len(result) == 0
         assert "location" in result.columns
+
+
+class TestApplyTitleFilter:
+    """Tests for apply_title_filter function."""
+
+    def test_drops_irrelevant_titles(self):
+        """Test that only allowed, non-blocked titles are kept."""
+        df = pd.DataFrame(
+            {
+                "job_id": ["id1", "id2", "id3", "id4"],
+                "job_title": [
+                    "Data Engineer Intern",
+                    "HR Data Admin",
+                    "Frontend Developer",
+                    "Build Data Pipeline Engineer",
+                ],
+            }
+        )
+
+        result = apply_title_filter(df)
+
+        assert list(result["job_id"]) == ["id1", "id4"]
+
+    def test_empty_dataframe(self):
+        """Test title filter with empty dataframe."""
+        df = pd.DataFrame({"job_title": []})
+        result = apply_title_filter(df)
+
+        assert len(result) == 0
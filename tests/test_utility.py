@@ -1,13 +1,26 @@
 import pytest
 import pandera.pandas as pa
+from src.scraper.engine import get_spec
 from src.utils.data_validator import validate_job_data
 from src.utils.data_validator import job_schema
+from src.utils.keyword_matcher import get_title_matcher
 from src.utils.scraper_utils import (
     DEVICE_PROFILES,
+    ExtractionStats,
+    ListingResponseCollector,
+    ResourcePolicy,
+    ScraperSession,
+    apply_resource_policy,
+    extract_cards,
+    get_scrape_concurrency,
     human_delay,
+    stream_keywords_concurrently,
+    use_session,
+    wait_until_ready,
 )
-from src.utils.upload_to_s3 import upload_to_s3
-from unittest.mock import patch, MagicMock
+from src.utils.upload_to_s3 import upload_file_to_s3, upload_to_s3
+from unittest.mock import patch, MagicMock, AsyncMock
+import asyncio
 import pandas as pd
 
 # ===============================================================================
@@ -120,6 +133,337 @@ class TestScraperUtils:
             assert isinstance(viewport["height"], int)
 
 
+class TestExtractCards:
+    @pytest.mark.asyncio
+    async def test_single_evaluate_call_and_incomplete_cards_skipped(self):
+        locator = MagicMock()
+        locator.evaluate_all = AsyncMock(
+            return_value={
+                "seen": 3,  # satu card rusak / field hilang tidak dikembalikan
+                "filtered": 0,
+                "rows": [
+                    {"job_title": "Data Engineer", "href": "/job/1"},
+                    {"job_title": "ETL Developer", "href": "/job/2"},
+                ],
+            }
+        )
+        page = MagicMock()
+        page.locator.return_value = locator
+
+        fields = {"job_title": ("h2 a", "text"), "href": ("h2 a", "href")}
+        cards = await extract_cards(page, "article", fields)
+
+        page.locator.assert_called_once_with("article")
+        locator.evaluate_all.assert_awaited_once()
+        assert [card["href"] for card in cards] == ["/job/1", "/job/2"]
+
+    @pytest.mark.asyncio
+    async def test_title_filter_shipped_to_page_and_stats_accumulated(self):
+        locator = MagicMock()
+        locator.evaluate_all = AsyncMock(
+            return_value={
+                "seen": 5,
+                "filtered": 4,
+                "rows": [{"job_title": "Data Engineer", "href": "/job/1"}],
+            }
+        )
+        page = MagicMock()
+        page.locator.return_value = locator
+        stats = ExtractionStats(seen=2, filtered=1, extracted=1)
+
+        fields = {"job_title": ("h2 a", "text"), "href": ("h2 a", "href")}
+        cards = await extract_cards(
+            page, "article", fields, title_filter=get_title_matcher(), stats=stats
+        )
+
+        arg = locator.evaluate_all.await_args.args[1]
+        assert arg["titleFilter"]["field"] == "job_title"
+        assert arg["titleFilter"]["allowed"] == get_title_matcher().allowed_pattern
+        assert len(cards) == 1
+        assert (stats.seen, stats.filtered, stats.extracted) == (7, 5, 2)
+
+
+class TestResourcePolicy:
+    @staticmethod
+    def _policy(platform):
+        return ResourcePolicy.from_categories(get_spec(platform).blocked_resources)
+
+    @staticmethod
+    def _page():
+        cdp = MagicMock()
+        cdp.send = AsyncMock()
+        page = MagicMock()
+        page.context.new_cdp_session = AsyncMock(return_value=cdp)
+        return page, cdp
+
+    @pytest.mark.asyncio
+    async def test_blocked_urls_set_via_cdp(self):
+        page, cdp = self._page()
+
+        result = await apply_resource_policy(page, "glints", self._policy("glints"))
+
+        assert result is cdp
+        page.route.assert_not_called()
+        method, params = cdp.send.await_args_list[-1].args
+        assert method == "Network.setBlockedURLs"
+        assert "*.png*" in params["urls"]
+        assert "*.woff2*" in params["urls"]
+        assert "*doubleclick.net*" in params["urls"]
+
+    def test_jobstreet_policy_blocks_trackers_only(self):
+        patterns = self._policy("jobstreet").blocked_url_patterns
+
+        assert "*googletagmanager.com*" in patterns
+        assert not any(p.startswith("*.") for p in patterns)
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_env_or_empty_policy(self, monkeypatch):
+        page, cdp = self._page()
+
+        assert await apply_resource_policy(page, "dealls", ResourcePolicy()) is None
+        monkeypatch.setenv("SCRAPE_BLOCK_RESOURCES", "0")
+        policy = self._policy("glints")
+        assert await apply_resource_policy(page, "glints", policy) is None
+        page.context.new_cdp_session.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cdp_failure_is_not_fatal(self):
+        page, _ = self._page()
+        page.context.new_cdp_session.side_effect = Exception("not chromium")
+
+        policy = self._policy("kalibrr")
+        assert await apply_resource_policy(page, "kalibrr", policy) is None
+
+
+class TestListingResponseCollector:
+    @staticmethod
+    def _response(url, status=200, content_type="application/json", body=None):
+        response = MagicMock()
+        response.url = url
+        response.status = status
+        response.headers = {"content-type": content_type}
+        response.json = AsyncMock(return_value=body)
+        return response
+
+    @pytest.mark.asyncio
+    async def test_collects_matching_json_only(self):
+        page = MagicMock()
+        collector = ListingResponseCollector(page, ["/api/search"])
+        page.on.assert_called_once_with("response", collector._on_response)
+
+        await collector._on_response(self._response("https://x.com/app.js"))
+        await collector._on_response(self._response("https://x.com/api/search", 429))
+        await collector._on_response(
+            self._response("https://x.com/api/search?page=1", body={"data": [1]})
+        )
+
+        assert collector.payloads == [{"data": [1]}]
+        assert await collector.wait_for_payload(timeout_ms=10)
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out_without_payload(self):
+        collector = ListingResponseCollector(MagicMock(), ["/api/search"])
+        assert not await collector.wait_for_payload(timeout_ms=10)
+
+
+class TestWaitUntilReady:
+    @staticmethod
+    def _page(counts):
+        async def never_idle(*args, **kwargs):
+            await asyncio.sleep(60)
+
+        locator = MagicMock()
+        locator.count = AsyncMock(side_effect=counts)
+        page = MagicMock()
+        page.locator.return_value = locator
+        page.wait_for_load_state = never_idle
+        return page
+
+    @pytest.mark.asyncio
+    async def test_returns_when_card_count_stabilizes(self):
+        page = self._page([0, 5, 12, 12, 12] + [12] * 50)
+
+        count = await wait_until_ready(page, "article", poll_ms=1, max_wait_ms=5000)
+
+        assert count == 12
+        assert page.locator.return_value.count.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_returns_immediately_when_payload_captured(self):
+        page = self._page([0] * 50)
+        collector = MagicMock(has_payload=True)
+
+        await wait_until_ready(page, "article", collector=collector, poll_ms=1)
+
+        page.locator.return_value.count.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_hard_ceiling(self):
+        page = self._page([0] * 1000)
+
+        start = asyncio.get_running_loop().time()
+        count = await wait_until_ready(page, "article", poll_ms=5, max_wait_ms=50)
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert count == 0
+        assert elapsed < 1
+
+
+class TestScraperSession:
+    @pytest.fixture
+    def mock_playwright(self):
+        playwright_cm = MagicMock()
+        playwright_cm.__aenter__ = AsyncMock(return_value=MagicMock())
+        playwright_cm.__aexit__ = AsyncMock(return_value=None)
+        browser = MagicMock()
+        browser.close = AsyncMock()
+        with (
+            patch(
+                "src.utils.scraper_utils.async_playwright",
+                return_value=playwright_cm,
+            ),
+            patch(
+                "src.utils.scraper_utils.create_browser",
+                new=AsyncMock(return_value=browser),
+            ) as mock_create_browser,
+            patch(
+                "src.utils.scraper_utils.create_stealth_context",
+                new=AsyncMock(side_effect=lambda *a, **k: MagicMock(close=AsyncMock())),
+            ) as mock_create_context,
+        ):
+            yield mock_create_browser, mock_create_context, browser
+
+    @pytest.mark.asyncio
+    async def test_browser_launched_once_for_many_contexts(self, mock_playwright):
+        mock_create_browser, mock_create_context, browser = mock_playwright
+
+        async with ScraperSession() as session:
+            for _ in range(4):
+                async with session.context() as context:
+                    pass
+                context.close.assert_awaited_once()
+
+        assert mock_create_browser.await_count == 1
+        assert mock_create_context.await_count == 4
+        browser.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_use_session_keeps_caller_session_open(self, mock_playwright):
+        _, _, browser = mock_playwright
+
+        session = ScraperSession()
+        async with use_session(session) as active_session:
+            assert active_session is session
+            async with active_session.context():
+                pass
+
+        browser.close.assert_not_awaited()
+        await session.close()
+        browser.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_browser_launched_lazily(self, mock_playwright):
+        mock_create_browser, _, browser = mock_playwright
+
+        async with ScraperSession():
+            pass
+
+        mock_create_browser.assert_not_awaited()
+        browser.close.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_dead_browser_relaunched_transparently(self, mock_playwright):
+        mock_create_browser, mock_create_context, browser = mock_playwright
+
+        session = ScraperSession()
+        async with session.context():
+            pass
+        browser.is_connected.return_value = False  # crash / container di-freeze
+        assert not session.is_alive
+        async with session.context():
+            pass
+
+        assert mock_create_browser.await_count == 2
+        assert mock_create_context.await_count == 2
+        browser.close.assert_awaited_once()
+        await session.close()
+
+
+class TestConcurrentKeywords:
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        in_flight = 0
+        peak = 0
+
+        async def stream_one(keyword):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            yield [{"job_id": keyword}]
+
+        keywords = [f"kw{i}" for i in range(6)]
+        results = [
+            item
+            async for item in stream_keywords_concurrently(
+                keywords, stream_one, concurrency=2
+            )
+        ]
+
+        assert peak == 2
+        assert sorted(kw for kw, _ in results) == keywords
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_batches_and_isolates_errors(self):
+        async def stream_one(keyword):
+            yield [{"job_id": f"{keyword}-1"}]
+            if keyword == "bad":
+                raise TimeoutError("goto timeout")
+            yield [{"job_id": f"{keyword}-2"}]
+
+        batches = [
+            item
+            async for item in stream_keywords_concurrently(
+                ["good", "bad"], stream_one, concurrency=2, max_pending=1
+            )
+        ]
+
+        job_ids = sorted(record["job_id"] for _, batch in batches for record in batch)
+        assert job_ids == ["bad-1", "good-1", "good-2"]
+
+    @pytest.mark.asyncio
+    async def test_stream_consumer_abort_leaves_no_pending_tasks(self):
+        closed = []
+
+        async def stream_one(keyword):
+            try:
+                for i in range(10):
+                    yield [{"job_id": f"{keyword}-{i}"}]
+            finally:
+                closed.append(keyword)
+
+        baseline = asyncio.all_tasks()
+        stream = stream_keywords_concurrently(
+            ["a", "b", "c"], stream_one, concurrency=3, max_pending=1
+        )
+        with pytest.raises(ValueError):
+            async for _ in stream:
+                raise ValueError("schema")  # konsumen gagal di batch pertama
+        await stream.aclose()
+
+        assert asyncio.all_tasks() == baseline
+        assert sorted(closed) == ["a", "b", "c"]
+
+    @patch.dict("os.environ", {"SCRAPE_CONCURRENCY": "3"})
+    def test_concurrency_from_env(self):
+        assert get_scrape_concurrency() == 3
+
+    @patch.dict("os.environ", {"SCRAPE_CONCURRENCY": "abc"})
+    def test_invalid_concurrency_falls_back(self):
+        assert get_scrape_concurrency(default=1) == 1
+
+
 # ===============================================================================
 #                              UPLOAD TO S3 TESTS
 # ===============================================================================
@@ -189,3 +533,29 @@ class TestUploadToS3:
         assert file_key.startswith("platform=kalibrr/ingestion_date=")
         assert file_key.endswith(".parquet")
         assert "kalibrr_" in file_key
+
+    @patch.dict("os.environ", {"AWS_S3_BUCKET_NAME": "test-bucket"})
+    @patch("src.utils.upload_to_s3.boto3.client")
+    def test_upload_file_to_s3(self, mock_boto3_client):
+        mock_s3_client = MagicMock()
+        mock_boto3_client.return_value = mock_s3_client
+        mock_s3_client.list_objects_v2.return_value = {"KeyCount": 0}
+
+        result = upload_file_to_s3("/tmp/bronze/glints.parquet", "glints")
+
+        assert result
+        path, bucket, file_key = mock_s3_client.upload_file.call_args[0]
+        assert (path, bucket) == ("/tmp/bronze/glints.parquet", "test-bucket")
+        assert file_key.startswith("platform=glints/ingestion_date=")
+
+    @patch.dict("os.environ", {"AWS_S3_BUCKET_NAME": "test-bucket"})
+    @patch("src.utils.upload_to_s3.boto3.client")
+    def test_upload_file_to_s3_append_keeps_existing(self, mock_boto3_client):
+        mock_s3_client = MagicMock()
+        mock_boto3_client.return_value = mock_s3_client
+
+        assert upload_file_to_s3("/tmp/bronze/glints.parquet", "glints", replace=False)
+
+        mock_s3_client.list_objects_v2.assert_not_called()
+        mock_s3_client.delete_object.assert_not_called()
+        mock_s3_client.upload_file.assert_called_once()
@@ -0,0 +1,80 @@
+"""Tests for the warm Lambda runtime (event loop + browser reuse)."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.utils import warm_runtime
+
+
+@pytest.fixture
+def mock_browser_launch():
+    playwright_cm = MagicMock()
+    playwright_cm.__aenter__ = AsyncMock(return_value=MagicMock())
+    playwright_cm.__aexit__ = AsyncMock(return_value=None)
+    browser = MagicMock()
+    browser.close = AsyncMock()
+    with (
+        patch("src.utils.scraper_utils.async_playwright", return_value=playwright_cm),
+        patch(
+            "src.utils.scraper_utils.create_browser",
+            new=AsyncMock(return_value=browser),
+        ) as mock_create_browser,
+        patch(
+            "src.utils.scraper_utils.create_stealth_context",
+            new=AsyncMock(side_effect=lambda *a, **k: MagicMock(close=AsyncMock())),
+        ),
+    ):
+        yield mock_create_browser, browser
+    warm_runtime.shutdown()
+
+
+async def _pipeline(session):
+    async with session.context():
+        pass
+    return session
+
+
+class TestRunWarm:
+    """Tests for run_warm reuse across invocations."""
+
+    def test_loop_and_browser_reused_across_invocations(self, mock_browser_launch):
+        mock_create_browser, browser = mock_browser_launch
+
+        first = warm_runtime.run_warm(_pipeline)
+        loop = warm_runtime.get_loop()
+        second = warm_runtime.run_warm(_pipeline)
+
+        assert first is second
+        assert warm_runtime.get_loop() is loop
+        assert mock_create_browser.await_count == 1
+        browser.close.assert_not_awaited()
+
+    def test_dead_browser_relaunched_on_next_invocation(self, mock_browser_launch):
+        mock_create_browser, browser = mock_browser_launch
+
+        warm_runtime.run_warm(_pipeline)
+        browser.is_connected.return_value = False
+        warm_runtime.run_warm(_pipeline)
+
+        assert mock_create_browser.await_count == 2
+
+    def test_shutdown_closes_session(self, mock_browser_launch):
+        _, browser = mock_browser_launch
+
+        warm_runtime.run_warm(_pipeline)
+        warm_runtime.shutdown()
+
+        browser.close.assert_awaited_once()
+        assert warm_runtime._session is None
+
+    def test_prewarm_launches_browser_for_first_invocation(self, mock_browser_launch):
+        mock_create_browser, _ = mock_browser_launch
+
+        warm_runtime.prewarm(imports=("json",))
+        warm_runtime.wait_for_prewarm()
+        assert mock_create_browser.await_count == 1
+
+        warm_runtime.run_warm(_pipeline)
+
+        assert mock_create_browser.await_count == 1